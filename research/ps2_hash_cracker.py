@@ -0,0 +1,428 @@
+#
+# PS2 LTB Hash Cracker
+#
+# PS2 LTBs store piece, animation and socket names as 32-bit hashes. Names we
+# know live in src/hash_ps2.txt; everything else imports as "Piece N",
+# "Animation_N" or "SocketN". This script tries to find the missing ones.
+#
+# 1. Collect the unresolved hashes from a folder of PS2 LTBs. This loads the
+#    real importer, so it needs mathutils. Run it with Blender's Python, or
+#    `pip install mathutils`:
+#
+#       python ps2_hash_cracker.py collect path/to/ltbs -o hashes.tsv
+#
+# 2. Crack them against wordlists. This only needs numpy:
+#
+#       python ps2_hash_cracker.py crack hashes.tsv -w words.txt --numbers 9 --pairs
+#
+#    Hits are checked against HashLookUp.hash and merged into
+#    hash_ps2_user.txt. Copy that file next to hash_ps2.py in the installed
+#    add-on (or point LITHTECH_PS2_HASHES at it) and the importer picks it up.
+#
+# Candidates are built as  prefix + word [+ separator + word] + suffix,
+# where the suffixes include the U/D aim variants and numeric suffixes.
+# The hash is h = h * (magic + 1) + c (mod 2^32), so
+#   hash(a + b) = hash(a) * (magic + 1) ^ len(b) + hash(b)
+# and every combination is a couple of uint32 multiply-adds over numpy
+# arrays instead of a Python loop per character.
+#
+
+import argparse
+import importlib
+import os
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+SRC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+PACKAGE_NAME = 'lithtech_src'
+
+DEFAULT_OUTPUT = 'hash_ps2_user.txt'
+DEFAULT_SEPARATORS = ['', '_']
+AIM_SUFFIXES = ['U', 'D']
+
+# Max candidates hashed at once per worker
+BATCH_SIZE = 1 << 22
+
+#
+# Helpers
+#
+
+def load_src_module(name):
+    '''
+    Import a module from src/ without running the add-on's __init__.py
+    (which needs bpy). The modules use relative imports, so they're loaded
+    under a bare package.
+    '''
+    if PACKAGE_NAME not in sys.modules:
+        package = types.ModuleType(PACKAGE_NAME)
+        package.__path__ = [os.path.abspath(SRC_PATH)]
+        sys.modules[PACKAGE_NAME] = package
+    return importlib.import_module('%s.%s' % (PACKAGE_NAME, name))
+
+
+def read_lines(path):
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def unique(items):
+    return list(dict.fromkeys(items))
+
+#
+# Collect
+#
+
+def find_ltbs(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for filename in sorted(files):
+                    if filename.lower().endswith('.ltb'):
+                        yield os.path.join(root, filename)
+        else:
+            yield path
+
+
+def collect(paths, out_path):
+    reader_module = load_src_module('reader_ltb_ps2')
+
+    found = {}
+    for path in find_ltbs(paths):
+        reader = reader_module.PS2LTBModelReader()
+        try:
+            reader.from_file(path)
+        except Exception as e:
+            print("Skipping %s: %s" % (path, e))
+            continue
+
+        hasher = getattr(reader, '_hasher', None)
+        if hasher is None:
+            continue
+
+        for category, hash_value in hasher.unresolved:
+            found.setdefault((hasher._magic_number, category, hash_value & 0xFFFFFFFF), path)
+    # End For
+
+    with open(out_path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('# magic\tcategory\thash\tfirst seen in\n')
+        for (magic, category, hash_value), path in sorted(found.items()):
+            f.write('%d\t%s\t%08x\t%s\n' % (magic, category, hash_value, path))
+
+    print("Wrote %d unresolved hash(es) to %s" % (len(found), out_path))
+
+
+def read_hashes(path):
+    '''
+    Returns {magic: {hash: set(categories)}}
+    '''
+    targets = {}
+    for line in read_lines(path):
+        fields = line.split('\t')
+        magic, category, hash_value = int(fields[0]), fields[1], int(fields[2], 16)
+        targets.setdefault(magic, {}).setdefault(hash_value, set()).add(category)
+    return targets
+
+#
+# Kernel
+#
+
+def encode(strings):
+    '''
+    Strings to a zero padded (n, max_len) uint8 matrix, with the same
+    normalisation the game applies: upper case, low byte only, '/' -> '\\'.
+    '''
+    lengths = np.array([len(s) for s in strings], dtype=np.int64)
+    matrix = np.zeros((len(strings), max(1, int(lengths.max(initial=0)))), dtype=np.uint8)
+    for i, s in enumerate(strings):
+        data = bytes(ord(c) & 0xFF for c in s.upper())
+        matrix[i, :len(data)] = np.frombuffer(data, dtype=np.uint8)
+    matrix[matrix == 0x2F] = 0x5C
+    return matrix, lengths
+
+
+def hash_strings(strings, magic):
+    '''
+    Vectorised HashLookUp.hash, as uint32. One pass per column.
+    '''
+    matrix, lengths = encode(strings)
+    multiplier = np.uint32((magic + 1) & 0xFFFFFFFF)
+    hashes = np.zeros(len(strings), dtype=np.uint32)
+    with np.errstate(over='ignore'):
+        for column in range(matrix.shape[1]):
+            active = lengths > column
+            hashes[active] = hashes[active] * multiplier + matrix[active, column]
+    return hashes, lengths
+
+
+def power_table(magic, max_length):
+    powers = np.ones(max_length + 1, dtype=np.uint32)
+    multiplier = np.uint32((magic + 1) & 0xFFFFFFFF)
+    with np.errstate(over='ignore'):
+        for i in range(1, max_length + 1):
+            powers[i] = powers[i - 1] * multiplier
+    return powers
+
+
+class Parts(object):
+    '''
+    A list of strings with their hashes and lengths, ready to be combined.
+    '''
+    def __init__(self, strings, magic):
+        self.strings = strings
+        self.hashes, self.lengths = hash_strings(strings, magic)
+
+
+def concat(left_hashes, right_hashes, right_lengths, powers):
+    '''
+    hash(a + b) for every (a, b) pair, as a (len(left), len(right)) matrix.
+    '''
+    with np.errstate(over='ignore'):
+        return left_hashes[:, None] * powers[right_lengths][None, :] + right_hashes[None, :]
+
+#
+# Workers
+#
+
+_worker = {}
+
+
+def init_worker(magic, target_hashes, prefixes, words, joins, suffixes):
+    _worker['targets'] = np.sort(np.array(target_hashes, dtype=np.uint32))
+    _worker['prefixes'] = Parts(prefixes, magic)
+    _worker['words'] = Parts(words, magic)
+    _worker['joins'] = Parts(joins, magic)
+    _worker['suffixes'] = Parts(suffixes, magic)
+
+    # Longest right hand side is join + word + suffix
+    longest = max(len(s) for s in prefixes + words + joins + suffixes)
+    _worker['powers'] = power_table(magic, longest * 3)
+
+
+def match(hashes):
+    targets = _worker['targets']
+    positions = np.searchsorted(targets, hashes)
+    positions[positions == len(targets)] = 0
+    return np.nonzero(targets[positions] == hashes)
+
+
+def search_words(start, stop):
+    '''
+    prefix + word + suffix, for words[start:stop]
+    '''
+    prefixes, words, suffixes = _worker['prefixes'], _worker['words'], _worker['suffixes']
+    powers = _worker['powers']
+    hits = []
+
+    word_hashes = words.hashes[start:stop]
+    word_lengths = words.lengths[start:stop]
+
+    # (prefix, word) -> flattened, then against every suffix
+    head = concat(prefixes.hashes, word_hashes, word_lengths, powers).ravel()
+    full = concat(head, suffixes.hashes, suffixes.lengths, powers)
+
+    for head_index, suffix_index in zip(*match(full)):
+        prefix_index, word_index = divmod(int(head_index), stop - start)
+        hits.append(prefixes.strings[prefix_index] + words.strings[start + word_index] + suffixes.strings[suffix_index])
+
+    return hits
+
+
+def search_pairs(start, stop):
+    '''
+    prefix + word + join + word + suffix, for first words in words[start:stop]
+    '''
+    prefixes, words, joins, suffixes = _worker['prefixes'], _worker['words'], _worker['joins'], _worker['suffixes']
+    powers = _worker['powers']
+    hits = []
+
+    # Every (join, second word, suffix) tail, hashed once per task
+    tail_hashes = []
+    tail_lengths = []
+    for join_index in range(len(joins.strings)):
+        join_word = concat(joins.hashes[join_index:join_index + 1], words.hashes, words.lengths, powers).ravel()
+        join_word_lengths = joins.lengths[join_index] + words.lengths
+        with np.errstate(over='ignore'):
+            tail = (join_word[:, None] * powers[suffixes.lengths][None, :] + suffixes.hashes[None, :]).ravel()
+        tail_hashes.append(tail)
+        tail_lengths.append((join_word_lengths[:, None] + suffixes.lengths[None, :]).ravel())
+    tail_hashes = np.concatenate(tail_hashes)
+    tail_lengths = np.concatenate(tail_lengths)
+    per_join = len(words.strings) * len(suffixes.strings)
+
+    # Keep the working set around BATCH_SIZE
+    rows_per_batch = max(1, BATCH_SIZE // max(1, len(tail_hashes)))
+
+    for word_index in range(start, stop):
+        head = concat(prefixes.hashes, words.hashes[word_index:word_index + 1], words.lengths[word_index:word_index + 1], powers).ravel()
+
+        for row in range(0, len(head), rows_per_batch):
+            full = concat(head[row:row + rows_per_batch], tail_hashes, tail_lengths, powers)
+            for prefix_index, tail_index in zip(*match(full)):
+                join_index, rest = divmod(int(tail_index), per_join)
+                second_index, suffix_index = divmod(rest, len(suffixes.strings))
+                hits.append(prefixes.strings[row + int(prefix_index)] + words.strings[word_index]
+                            + joins.strings[join_index] + words.strings[second_index] + suffixes.strings[suffix_index])
+        # End For
+    # End For
+
+    return hits
+
+#
+# Crack
+#
+
+def build_suffixes(user_suffixes, numbers, separators):
+    suffixes = [''] + list(user_suffixes)
+
+    # Aim up/down variants, e.g. "Fire" -> "FireU" / "FireD"
+    suffixes += [suffix + aim for suffix in list(suffixes) for aim in AIM_SUFFIXES]
+
+    if numbers is not None:
+        for separator in separators:
+            suffixes += ['%s%d' % (separator, n) for n in range(numbers + 1)]
+
+    return unique(suffixes)
+
+
+def crack(args):
+    hasher_module = load_src_module('hash_ps2')
+
+    words = []
+    for path in args.wordlist:
+        words += read_lines(path)
+    if args.known:
+        for names in hasher_module.HASH_LOOKUP.values():
+            words += names
+    words = unique(words)
+
+    if not words:
+        print("No words to try, pass at least one --wordlist")
+        return
+
+    prefixes = unique([''] + args.prefix)
+    suffixes = build_suffixes(args.suffix, args.numbers, args.separator)
+    joins = unique(args.separator)
+
+    targets = {}
+    for path in args.hashes:
+        for magic, hashes in read_hashes(path).items():
+            for hash_value, categories in hashes.items():
+                targets.setdefault(magic, {}).setdefault(hash_value, set()).update(categories)
+
+    # The output gets a magic header only if all targets share one magic
+    magics = list(targets)
+    out_magic = magics[0] if len(magics) == 1 else None
+
+    # Existing hits are kept. Their hash column only holds for the magic they
+    # were cracked under, so names from another magic are kept without it.
+    results = {}
+    if os.path.exists(args.output):
+        for category, entries in hasher_module.read_dictionary(args.output).items():
+            for hash_value, magic, name in entries:
+                if magic != out_magic:
+                    hash_value = None
+                names = results.setdefault(category, {}).setdefault(hash_value, [])
+                if name not in names:
+                    names.append(name)
+
+    space = len(prefixes) * len(words) * len(suffixes)
+    if args.pairs:
+        space *= 1 + len(joins) * len(words)
+
+    for magic, hashes in sorted(targets.items()):
+        print("magic %d: %d target(s), %d candidate(s), %d job(s)" % (magic, len(hashes), space, args.jobs))
+
+        hasher = hasher_module.HashLookUp(magic)
+        tasks = [search_words, search_pairs] if args.pairs else [search_words]
+        chunk = args.chunk or max(1, len(words) // (args.jobs * 8))
+        ranges = [(start, min(start + chunk, len(words))) for start in range(0, len(words), chunk)]
+
+        hits = []
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker,
+                                 initargs=(magic, list(hashes), prefixes, words, joins, suffixes)) as pool:
+            futures = [pool.submit(task, start, stop) for task in tasks for start, stop in ranges]
+            for done, future in enumerate(futures):
+                hits += future.result()
+                print("  %d/%d chunks, %d hit(s)" % (done + 1, len(futures), len(hits)), end='\r')
+        print()
+
+        for name in unique(hits):
+            # Double check against the importer's own hash
+            hash_value = hasher.hash(name) & 0xFFFFFFFF
+            if hash_value not in hashes:
+                print("  kernel mismatch for '%s', skipped" % name)
+                continue
+
+            for category in sorted(hashes[hash_value]):
+                names = results.setdefault(category, {}).setdefault(hash_value, [])
+                if name not in names:
+                    names.append(name)
+                    print("  [%s] %08x = %s" % (category, hash_value, name))
+        # End For
+    # End For
+
+    # Collisions are likely with big search spaces; the first name found is
+    # the entry, the rest are left in as comments to pick from by hand.
+    entries = {}
+    alternatives = []
+    for category, by_hash in results.items():
+        entries[category] = []
+        hashed = set(names[0] for hash_value, names in by_hash.items() if hash_value is not None)
+        for hash_value, names in sorted(by_hash.items(), key=lambda item: item[1][0]):
+            if hash_value is None:
+                # Hand-written names, or names from another magic, without a
+                # hash column (unless cracked again under this one)
+                entries[category] += [(None, name) for name in names if name not in hashed]
+                continue
+            entries[category].append((hash_value, names[0]))
+            alternatives += ['%s\t%08x\t%s' % (category, hash_value, name) for name in names[1:]]
+
+    hasher_module.write_dictionary(args.output, entries, out_magic)
+    if alternatives:
+        with open(args.output, 'a', encoding='utf-8', newline='\n') as f:
+            f.write('\n# Other names with the same hash\n')
+            for line in alternatives:
+                f.write('# %s\n' % line)
+
+    print("Wrote %d name(s) to %s" % (sum(len(e) for e in entries.values()), args.output))
+
+#
+# Main
+#
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Find names for unresolved PS2 LTB hashes.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    collect_parser = commands.add_parser('collect', help='collect unresolved hashes from PS2 LTBs (needs mathutils)')
+    collect_parser.add_argument('paths', nargs='+', help='LTB files or folders')
+    collect_parser.add_argument('-o', '--output', default='hashes.tsv')
+
+    crack_parser = commands.add_parser('crack', help='search for names matching collected hashes')
+    crack_parser.add_argument('hashes', nargs='+', help='hash lists written by collect')
+    crack_parser.add_argument('-w', '--wordlist', action='append', default=[], help='one word per line, can be repeated')
+    crack_parser.add_argument('--known', action='store_true', help='also use the names already in hash_ps2.txt as words')
+    crack_parser.add_argument('--prefix', action='append', default=[], help='extra prefix, can be repeated')
+    crack_parser.add_argument('--suffix', action='append', default=[], help='extra suffix, can be repeated')
+    crack_parser.add_argument('--separator', action='append', default=None, help='word/number separators (default: "" and "_")')
+    crack_parser.add_argument('--numbers', type=int, default=None, help='try numeric suffixes 0..N')
+    crack_parser.add_argument('--pairs', action='store_true', help='also try two-word combinations')
+    crack_parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1)
+    crack_parser.add_argument('--chunk', type=int, default=0, help='words per task (default: automatic)')
+    crack_parser.add_argument('-o', '--output', default=DEFAULT_OUTPUT)
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'collect':
+        collect(args.paths, args.output)
+    else:
+        if args.separator is None:
+            args.separator = DEFAULT_SEPARATORS
+        crack(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -36,13 +36,14 @@ from bpy_extras.io_utils import ImportHelper
 
 # submodules (reload-safe on re-enable)
 from . import coordinates
+from . import fk
 from . import reader_dispatch
 from . import builder_import
 from . import animation_import
 from . import exporter_lta
 from . import ui_anim
 
-for _m in (coordinates, reader_dispatch, builder_import, animation_import, exporter_lta, ui_anim):
+for _m in (coordinates, fk, reader_dispatch, builder_import, animation_import, exporter_lta, ui_anim):
     importlib.reload(_m)
 
 
@@ -53,12 +54,19 @@ class IMPORT_OT_lithtech_clean(bpy.types.Operator, ImportHelper):
     bl_options = {'REGISTER', 'UNDO'}
 
     filename_ext = ".abc"
-    filter_glob: StringProperty(default="*.abc;*.ltb;*.lta", options={'HIDDEN'})
+    filter_glob: StringProperty(default="*.abc;*.ltb;*.lta;*.lta.gz;*.lta.bz2;*.lta.xz", options={'HIDDEN'})
     import_anims: BoolProperty(
         name="Import Animations",
         description="Import each animation as its own Action on a separate NLA track",
         default=True,
     )
+    lazy_anims: BoolProperty(
+        name="Create Actions On Demand",
+        description="Only list the animations at import; each Action and NLA track "
+                    "is created when it is played from the LithTech Animations "
+                    "panel or exported",
+        default=False,
+    )
 
     def execute(self, context):
         import os
@@ -69,6 +77,8 @@ class IMPORT_OT_lithtech_clean(bpy.types.Operator, ImportHelper):
             return {'CANCELLED'}
         try:
             name = os.path.splitext(os.path.basename(self.filepath))[0]
+            if name.lower().endswith('.lta'):      # compressed hero.lta.gz
+                name = name[:-4]
             arm_obj = builder_import.build_model(model, name)
         except Exception as e:
             self.report({'ERROR'}, "Build failed: %s" % e)
@@ -77,7 +87,12 @@ class IMPORT_OT_lithtech_clean(bpy.types.Operator, ImportHelper):
         n_anims = 0
         if self.import_anims:
             try:
-                n_anims = animation_import.import_animations(model, arm_obj)
+                if self.lazy_anims:
+                    n_anims = animation_import.register_lazy_animations(
+                        model, arm_obj, self.filepath)
+                else:
+                    n_anims = animation_import.import_animations(model, arm_obj)
+                    animation_import.remember_source(arm_obj, self.filepath)
             except Exception as e:
                 self.report({'WARNING'}, "Animations failed: %s" % e)
 
@@ -1,4 +1,7 @@
+import os
 import struct
+from array import array
+import numpy as np
 from mathutils import Vector, Quaternion, Matrix
 
 '''
@@ -40,7 +43,28 @@ def build_undirected_tree(nodes):
 '''
 DATA BLOCKS
 '''
+'''
+The per-vertex classes below are created in the hundreds of thousands for
+big models, so they use __slots__, and the rarely used fields are only
+allocated when something reads or sets them.
+
+By default they still accept attributes they don't declare (kept in a
+__dict__ that is only created when one is set). Setting the
+LITHTECH_COMPACT_IR environment variable before the add-on loads opts in to
+the compact mode for importing many large models at once: no __dict__ slot
+at all, so undeclared attributes raise AttributeError.
+'''
+COMPACT_ENV = 'LITHTECH_COMPACT_IR'
+COMPACT = os.environ.get(COMPACT_ENV, '') not in ('', '0')
+
+
+def _slots(*names):
+    return names if COMPACT else names + ('__dict__',)
+
+
 class Weight(object):
+    __slots__ = _slots('node_index', 'location', 'bias')
+
     def __init__(self):
         self.node_index = 0
         self.location = Vector()
@@ -48,6 +72,9 @@ class Weight(object):
 
 
 class Vertex(object):
+    __slots__ = _slots('sublod_vertex_index', 'weights', 'location', 'normal', 'colour',
+                       'original_location', 'original_normal', '_original_weights')
+
     def __init__(self):
         self.sublod_vertex_index = 0xCDCD
         self.weights = []
@@ -61,9 +88,21 @@ class Vertex(object):
         self.original_normal = None    # Original object-space normal from LTB
         
         # ABC IMPORT FIX: Store original weight.location data
-        self.original_weights = []  # ← NEU HINZUFÜGEN!
+        self._original_weights = None
+
+    @property
+    def original_weights(self):
+        if self._original_weights is None:
+            self._original_weights = []
+        return self._original_weights
+
+    @original_weights.setter
+    def original_weights(self, weights):
+        self._original_weights = weights
 
 class FaceVertex(object):
+    __slots__ = _slots('texcoord', 'vertex_index', 'reversed', '_extra_texcoords')
+
     def __init__(self):
         self.texcoord = Vector()
         self.vertex_index = 0
@@ -72,10 +111,22 @@ class FaceVertex(object):
         # LTB specific
 
         # Supports up to 4 UVs, so let's add some more!
-        self.extra_texcoords = [Vector(), Vector(), Vector()]
+        self._extra_texcoords = None
+
+    @property
+    def extra_texcoords(self):
+        if self._extra_texcoords is None:
+            self._extra_texcoords = [Vector(), Vector(), Vector()]
+        return self._extra_texcoords
+
+    @extra_texcoords.setter
+    def extra_texcoords(self, texcoords):
+        self._extra_texcoords = texcoords
 
 
 class Face(object):
+    __slots__ = _slots('vertices', 'normal')
+
     def __init__(self):
         self.vertices = []
 
@@ -83,10 +134,123 @@ class Face(object):
         self.normal = Vector()
 
 
+'''
+Struct-of-arrays mesh data for one LOD, an alternative to the Vertex/Face
+object graph for readers that decode whole buffers at once.
+
+    positions, normals  (vertices, 3) float32
+    indices             (triangles * 3,) int32
+    texcoords           (triangles * 3, 2) float32, one (u, v) per corner
+    weight_offsets      (vertices + 1,) int32
+    weight_nodes        (weights,) int32
+    weight_biases       (weights,) float32
+
+Weights are CSR: vertex i's weights are the
+[weight_offsets[i]:weight_offsets[i + 1]] slice of nodes/biases.
+Only what the builder uses is kept (no weight locations, colours or basis).
+'''
+class LODArrays(object):
+    def __init__(self):
+        self.positions = np.zeros((0, 3), dtype=np.float32)
+        self.normals = np.zeros((0, 3), dtype=np.float32)
+        self.indices = np.zeros(0, dtype=np.int32)
+        self.texcoords = np.zeros((0, 2), dtype=np.float32)
+        self.weight_offsets = np.zeros(1, dtype=np.int32)
+        self.weight_nodes = np.zeros(0, dtype=np.int32)
+        self.weight_biases = np.zeros(0, dtype=np.float32)
+
+    @property
+    def vertex_count(self):
+        return len(self.positions)
+
+    @property
+    def triangle_count(self):
+        return len(self.indices) // 3
+
+    @property
+    def weight_count(self):
+        return len(self.weight_nodes)
+
+    def set_weights(self, weight_counts, weight_nodes, weight_biases):
+        self.weight_offsets = np.zeros(len(weight_counts) + 1, dtype=np.int32)
+        np.cumsum(weight_counts, out=self.weight_offsets[1:])
+        self.weight_nodes = np.asarray(weight_nodes, dtype=np.int32)
+        self.weight_biases = np.asarray(weight_biases, dtype=np.float32)
+
+    @staticmethod
+    def from_lod(lod):
+        '''
+        Build arrays from the Vertex/Face objects of a LOD.
+        '''
+        arrays = LODArrays()
+        vertices = lod.vertices
+        count = len(vertices)
+
+        arrays.positions = np.array([tuple(vertex.location) for vertex in vertices], dtype=np.float32).reshape(count, 3)
+        arrays.normals = np.array([tuple(vertex.normal) for vertex in vertices], dtype=np.float32).reshape(count, 3)
+
+        indices, texcoords = lod.get_triangles()
+        arrays.indices = np.array(indices, dtype=np.int32)
+        arrays.texcoords = np.array(texcoords, dtype=np.float32).reshape(-1, 2)
+
+        arrays.set_weights([len(vertex.weights) for vertex in vertices],
+                           [weight.node_index for vertex in vertices for weight in vertex.weights],
+                           [weight.bias for vertex in vertices for weight in vertex.weights])
+        return arrays
+
+    def to_vertices(self):
+        vertices = []
+        offsets = self.weight_offsets.tolist()
+        nodes = self.weight_nodes.tolist()
+        biases = self.weight_biases.tolist()
+
+        for i, (location, normal) in enumerate(zip(self.positions.tolist(), self.normals.tolist())):
+            vertex = Vertex()
+            vertex.location = Vector(location)
+            vertex.normal = Vector(normal)
+            for w in range(offsets[i], offsets[i + 1]):
+                weight = Weight()
+                weight.node_index = nodes[w]
+                weight.bias = biases[w]
+                vertex.weights.append(weight)
+            vertices.append(vertex)
+        # End For
+
+        return vertices
+
+    def to_faces(self):
+        faces = []
+        corners = zip(self.indices.tolist(), self.texcoords.tolist())
+
+        for _ in range(self.triangle_count):
+            face = Face()
+            for _ in range(3):
+                vertex_index, texcoord = next(corners)
+                face_vertex = FaceVertex()
+                face_vertex.vertex_index = vertex_index
+                face_vertex.texcoord.xy = texcoord
+                face.vertices.append(face_vertex)
+            faces.append(face)
+        # End For
+
+        return faces
+
+    def to_lod(self, lod):
+        '''
+        Fill in the Vertex/Face objects of a LOD from these arrays.
+        '''
+        lod.vertices = self.to_vertices()
+        lod.faces = self.to_faces()
+        return lod
+
+
 class LOD(object):
     def __init__(self):
-        self.faces = []
-        self.vertices = []
+        # Either the arrays or the object lists are filled by the reader,
+        # asking for the other one converts on first use.
+        self.arrays = None
+        self._faces = None
+        self._vertices = None
 
         # LTB specific
         self.texture_count = 0
@@ -104,6 +268,77 @@ class LOD(object):
         self.s = Vector()
         self.t = Vector()
 
+        # Flat triangle list, for readers that don't build Face/FaceVertex objects.
+        # Three vertex indices per triangle, and one (u, v) pair per corner.
+        self.face_indices = None
+        self.face_texcoords = None
+
+    @property
+    def vertices(self):
+        if self._vertices is None:
+            self._vertices = self.arrays.to_vertices() if self.arrays is not None else []
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, vertices):
+        self._vertices = vertices
+
+    @property
+    def faces(self):
+        if self._faces is None:
+            self._faces = self.arrays.to_faces() if self.arrays is not None else []
+        return self._faces
+
+    @faces.setter
+    def faces(self, faces):
+        self._faces = faces
+
+    def get_arrays(self):
+        '''
+        The LOD as LODArrays, converted from the objects if the reader
+        didn't provide them.
+        '''
+        if self.arrays is None:
+            self.arrays = LODArrays.from_lod(self)
+        return self.arrays
+
+    def get_vertex_count(self):
+        if self.arrays is not None:
+            return self.arrays.vertex_count
+        return len(self.vertices)
+
+    def get_weight_count(self):
+        if self.arrays is not None:
+            return self.arrays.weight_count
+        return sum([len(vertex.weights) for vertex in self.vertices])
+
+    def get_triangles(self):
+        '''
+        Returns (indices, texcoords) as flat arrays, whichever way the reader
+        stored the faces.
+        '''
+        if self.arrays is not None:
+            return (array('I', self.arrays.indices.astype(np.uintc).tobytes()),
+                    array('f', self.arrays.texcoords.astype(np.float32).tobytes()))
+
+        if self.face_indices is not None:
+            return self.face_indices, self.face_texcoords
+
+        indices = array('I')
+        texcoords = array('f')
+        for face in self.faces:
+            for face_vertex in face.vertices:
+                indices.append(face_vertex.vertex_index)
+                texcoords.extend(face_vertex.texcoord.xy)
+        return indices, texcoords
+
+    def get_triangle_count(self):
+        if self.arrays is not None:
+            return self.arrays.triangle_count
+        if self.face_indices is not None:
+            return len(self.face_indices) // 3
+        return len(self.faces)
+
     def get_face_vertices(self, face_index):
         return [self.vertices[vertex.vertex_index] for vertex in self.faces[face_index].vertices]
 
@@ -115,7 +350,7 @@ class Piece(object):
 
     @property
     def weight_count(self):
-        return sum([len(vertex.weights) for lod in self.lods for vertex in lod.vertices])
+        return sum([lod.get_weight_count() for lod in self.lods])
 
     def __init__(self):
         self.material_index = 0
@@ -191,6 +426,8 @@ class Animation(object):
         # End Class
 
         class Transform(object):
+            __slots__ = _slots('location', 'rotation')
+
             def __init__(self):
                 self.location = Vector()
                 self.rotation = Quaternion((1, 0, 0, 0))
@@ -207,13 +444,44 @@ class Animation(object):
             self.time = 0
             self.string = ''
 
+    '''
+    Read-only [node][key] access to the transform arrays, for code that still
+    expects Transform objects. They're made on demand, so changing one
+    doesn't change the animation.
+    '''
+    class TransformsView(object):
+        def __init__(self, locations, rotations):
+            self._locations = locations
+            self._rotations = rotations
+
+        def __len__(self):
+            return len(self._locations)
+
+        def __getitem__(self, index):
+            return Animation.NodeTransformsView(self._locations[index], self._rotations[index])
+
+        def __iter__(self):
+            for index in range(len(self)):
+                yield self[index]
+
+    class NodeTransformsView(TransformsView):
+        def __getitem__(self, index):
+            transform = Animation.Keyframe.Transform()
+            transform.location = Vector(self._locations[index].tolist())
+            transform.rotation = Quaternion(self._rotations[index].tolist())
+            return transform
+
     def __init__(self):
         self.extents = Vector()
         self.name = ''
         self.unknown1 = -1
         self.interpolation_time = 200
         self.keyframes = []
-        self.node_keyframe_transforms = []
+
+        # Keyframe transforms, float32 arrays indexed [node, key]:
+        # locations (nodes, keys, 3) and rotations (nodes, keys, 4) as w, x, y, z
+        self.locations = np.zeros((0, 0, 3), dtype=np.float32)
+        self.rotations = np.zeros((0, 0, 4), dtype=np.float32)
 
         # Version 6 specific
         self.bounds_min = Vector()
@@ -230,6 +498,28 @@ class Animation(object):
         self.compression_type = 0
         self.is_vertex_animation = 0
 
+    def allocate_transforms(self, node_count, keyframe_count):
+        '''
+        Fresh transform arrays, every key at the origin with no rotation.
+        '''
+        self.locations = np.zeros((node_count, keyframe_count, 3), dtype=np.float32)
+        self.rotations = np.zeros((node_count, keyframe_count, 4), dtype=np.float32)
+        self.rotations[:, :, 0] = 1.0
+
+    @property
+    def node_keyframe_transforms(self):
+        return Animation.TransformsView(self.locations, self.rotations)
+
+    @node_keyframe_transforms.setter
+    def node_keyframe_transforms(self, node_transforms):
+        # Lists of Transform lists, one per node
+        keyframe_count = max([len(transforms) for transforms in node_transforms], default=0)
+        self.allocate_transforms(len(node_transforms), keyframe_count)
+        for node_index, transforms in enumerate(node_transforms):
+            for key_index, transform in enumerate(transforms):
+                self.locations[node_index, key_index] = tuple(transform.location)
+                self.rotations[node_index, key_index] = tuple(transform.rotation)
+
 
 class AnimBinding(object):
     def __init__(self):
@@ -279,15 +569,15 @@ class Model(object):
 
     @property
     def face_count(self): #TODO: this is actually probably per LOD as well
-        return sum([len(lod.faces) for piece in self.pieces for lod in piece.lods])
+        return sum([lod.get_triangle_count() for piece in self.pieces for lod in piece.lods])
 
     @property
     def vertex_count(self):
-        return sum([len(lod.vertices) for piece in self.pieces for lod in piece.lods])
+        return sum([lod.get_vertex_count() for piece in self.pieces for lod in piece.lods])
 
     @property
     def weight_count(self):
-        return sum([len(vertex.weights) for piece in self.pieces for lod in piece.lods for vertex in lod.vertices])
+        return sum([lod.get_weight_count() for piece in self.pieces for lod in piece.lods])
 
     @property
     def lod_count(self):
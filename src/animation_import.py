@@ -9,32 +9,211 @@ produce them). Per bone/keyframe:
     matrix_basis = rest_rel^-1 @ swap_matrix(L_local)
                  = rest_rel^-1 @ LocRotScale(swap_vec(loc), swap_quat(rot))
 
-decomposed into location + rotation_quaternion and keyed. Because swap_* is
+decomposed into location + rotation_quaternion and written straight into the
+action's F-Curves (keyframe_points.add + foreach_set, no keyframe_insert per
+bone and key). Because swap_* is
 multiplicative + self-inverse, converting each LOCAL transform once is enough;
 Blender composes the hierarchy correctly. Verified on real hero_action data:
 the 'base' frame-0 rotation matches the bind pose exactly (no spurious flip).
 
 Quaternion sign continuity is enforced per bone to avoid 360-degree interpolation
 spins between keyframes.
+
+Rest matrices are rigid (bone matrix_local carries no scale), so the matrix
+form above reduces to quaternion algebra with rest_rel = (t_r, q_r):
+
+    location = q_r^-1 * (swap_vec(loc) - t_r)
+    rotation = q_r^-1 * swap_quat(rot)
+
+which is evaluated for all bones and keys of an animation at once on the
+(nodes, keys) arrays of abc.Animation.
+
+Lazy mode (register_lazy_animations) builds nothing at import: the armature
+only remembers its source file and the animation names, and their decoded
+keyframe arrays (no mesh data) stay in an in-memory cache keyed to that file.
+materialize_animations() turns pending names into Actions + NLA tracks when
+the animation panel plays one or the exporter needs them, and drops them from
+the cache; after reopening a .blend the source file is simply read again. AnimationSampler evaluates the same data at any time for
+the panel's preview mode without building anything at all.
 """
 
+import os
+
 import bpy
-from mathutils import Matrix, Quaternion
+import numpy as np
+from mathutils import Quaternion
 
 try:
-    from .coordinates import swap_vec, swap_quat
+    from .coordinates import swap_vec_array, swap_quat_array
 except ImportError:
-    from coordinates import swap_vec, swap_quat
+    from coordinates import swap_vec_array, swap_quat_array
 
 
 _FPS_FALLBACK = 30
 
+# Armature custom properties used by the lazy mode
+SOURCE_PATH_KEY = 'lt_source_path'    # model file the animations come from
+ANIM_NAMES_KEY = 'lt_anim_names'      # lazy animation names, in file order
+LAZY_NAMES_KEY = 'lt_lazy_anims'      # names with no Action/NLA track yet
 
 def _frame_for(time_ms, fps):
     return round(time_ms * fps / 1000.0)
 
 
-def import_animations(model, arm_obj, fps=None):
+def _quat_multiply(a, b):
+    """Hamilton product of (..., 4) w, x, y, z arrays (broadcasting)."""
+    aw, ax, ay, az = np.moveaxis(a, -1, 0)
+    bw, bx, by, bz = np.moveaxis(b, -1, 0)
+    return np.stack((aw * bw - ax * bx - ay * by - az * bz,
+                     aw * bx + ax * bw + ay * bz - az * by,
+                     aw * by - ax * bz + ay * bw + az * bx,
+                     aw * bz + ax * by - ay * bx + az * bw), axis=-1)
+
+
+def _quat_rotate(q, v):
+    """Rotate (..., 3) vectors by unit (..., 4) quaternions."""
+    w = q[..., :1]
+    u = q[..., 1:]
+    t = 2.0 * np.cross(u, v)
+    return v + w * t + np.cross(u, t)
+
+
+def _rest_arrays(model, arm_obj):
+    """Node indices of the model's bones in the armature, with each bone's
+    rest transform relative to its parent (Blender armature space) as a
+    translation (b, 3) and an inverse rotation (b, 4)."""
+    bones = arm_obj.data.bones
+    node_indices, rest_t, rest_q_inv = [], [], []
+    for ni, nd in enumerate(model.nodes):
+        if nd.name not in bones:
+            continue
+        bl = bones[nd.name].matrix_local
+        if nd.parent is not None and nd.parent.name in bones:
+            rel = bones[nd.parent.name].matrix_local.inverted() @ bl
+        else:
+            rel = bl
+        loc, rot, _ = rel.decompose()
+        node_indices.append(ni)
+        rest_t.append(tuple(loc))
+        rest_q_inv.append(tuple(rot.conjugated()))
+    rest_t = np.array(rest_t, dtype=np.float64).reshape(-1, 3)
+    rest_q_inv = np.array(rest_q_inv, dtype=np.float64).reshape(-1, 4)
+    return node_indices, rest_t, rest_q_inv
+
+
+def _quat_slerp(a, b, factor):
+    """Spherical interpolation between (..., 4) unit quaternions."""
+    dot = (a * b).sum(axis=-1, keepdims=True)
+    b = np.where(dot < 0.0, -b, b)
+    dot = np.abs(dot)
+    theta = np.arccos(np.clip(dot, -1.0, 1.0))
+    sin_theta = np.sin(theta)
+    # nearly parallel: plain lerp is exact enough and avoids 0/0
+    near = sin_theta < 1e-6
+    safe = np.where(near, 1.0, sin_theta)
+    wa = np.where(near, 1.0 - factor, np.sin((1.0 - factor) * theta) / safe)
+    wb = np.where(near, factor, np.sin(factor * theta) / safe)
+    out = wa * a + wb * b
+    return out / np.linalg.norm(out, axis=-1, keepdims=True)
+
+
+def _basis_arrays(anim, node_indices, rest_t, rest_q_inv):
+    """Pose-bone basis location (b, k, 3) and rotation (b, k, 4) for the given
+    nodes of an animation, with per-bone hemisphere continuity applied.
+    """
+    key_count = len(anim.keyframes)
+    locations = swap_vec_array(anim.locations[node_indices, :key_count].astype(np.float64))
+    rotations = swap_quat_array(anim.rotations[node_indices, :key_count].astype(np.float64))
+
+    # LocRotScale + decompose() normalized the rotation along the way
+    norm = np.linalg.norm(rotations, axis=-1, keepdims=True)
+    rotations /= np.where(norm > 0.0, norm, 1.0)
+
+    q_inv = rest_q_inv[:, None, :]
+    locations = _quat_rotate(q_inv, locations - rest_t[:, None, :])
+    rotations = _quat_multiply(q_inv, rotations)
+
+    # decompose() returns w >= 0; then keep each key on the same hemisphere
+    # as the previous one. A flip carries over to every later key, so the
+    # running sign is the product of the per-step signs.
+    rotations[rotations[..., 0] < 0.0] *= -1.0
+    steps = np.ones(rotations.shape[:2])
+    steps[:, 1:] = np.where((rotations[:, 1:] * rotations[:, :-1]).sum(axis=-1) < 0.0, -1.0, 1.0)
+    rotations *= np.cumprod(steps, axis=1)[..., None]
+    return locations, rotations
+
+
+class AnimationSampler(object):
+    """Pose-bone basis of one animation at any time, taken straight from the
+    decoded keyframes: locations are lerped and rotations slerped between the
+    two surrounding keys. Nothing is written to Blender data.
+    """
+    def __init__(self, model, arm_obj, anim):
+        node_indices, rest_t, rest_q_inv = _rest_arrays(model, arm_obj)
+        self.name = anim.name
+        self.bone_names = [model.nodes[ni].name for ni in node_indices]
+        self.times = np.array([kf.time for kf in anim.keyframes], dtype=np.float64)
+        self.locations, self.rotations = _basis_arrays(anim, node_indices, rest_t, rest_q_inv)
+
+    @property
+    def duration(self):
+        return float(self.times[-1]) if len(self.times) else 0.0
+
+    def sample(self, time_ms):
+        """(b, 3) locations and (b, 4) rotations at `time_ms`."""
+        times = self.times
+        if len(times) < 2:
+            return self.locations[:, 0], self.rotations[:, 0]
+        i = np.searchsorted(times, time_ms, side='right') - 1
+        i = min(max(int(i), 0), len(times) - 2)
+        span = times[i + 1] - times[i]
+        factor = 0.0 if span <= 0.0 else min(max((time_ms - times[i]) / span, 0.0), 1.0)
+
+        loc = self.locations[:, i] + (self.locations[:, i + 1] - self.locations[:, i]) * factor
+        rot = _quat_slerp(self.rotations[:, i], self.rotations[:, i + 1], factor)
+        return loc, rot
+
+
+def _new_fcurve(action, arm_obj, data_path, index, group):
+    # 4.4+ layered actions: create the curve in the slot for this armature.
+    # Older versions only have the flat action.fcurves list.
+    if hasattr(action, 'fcurve_ensure_for_datablock'):
+        return action.fcurve_ensure_for_datablock(arm_obj, data_path, index=index, group_name=group)
+    return action.fcurves.new(data_path, index=index, action_group=group)
+
+
+def _fill_fcurve(fc, frames, values, interpolation):
+    """Size the curve once and write all keys as interleaved (frame, value)."""
+    count = len(frames)
+    co = np.empty(count * 2, dtype=np.float32)
+    co[0::2] = frames
+    co[1::2] = values
+    points = fc.keyframe_points
+    points.add(count)
+    points.foreach_set('co', co)
+
+    if interpolation is not None:
+        # Enum properties go through foreach_set as their integer value
+        try:
+            value = points[0].bl_rna.properties['interpolation'].enum_items[interpolation].value
+            points.foreach_set('interpolation', np.full(count, value, dtype=np.int32))
+        except Exception:
+            for kp in points:
+                kp.interpolation = interpolation
+    fc.update()
+
+
+def _new_key_interpolation():
+    """Interpolation keyframe_insert would use, from the user preferences."""
+    try:
+        return bpy.context.preferences.edit.keyframe_new_interpolation_type
+    except AttributeError:
+        return None
+
+
+def import_animations(model, arm_obj, fps=None, names=None):
+    """Build an Action + muted NLA track for every animation of the model, or
+    only for those whose name is in `names`. Returns the number built."""
     anims = getattr(model, 'animations', [])
     if not anims:
         print("animation_import: no animations in model")
@@ -47,7 +226,6 @@ def import_animations(model, arm_obj, fps=None):
         arm_obj.animation_data_create()
     ad = arm_obj.animation_data
 
-    bones = arm_obj.data.bones
     pbs = arm_obj.pose.bones
 
     # quaternion rotation mode for all posed bones
@@ -55,16 +233,7 @@ def import_animations(model, arm_obj, fps=None):
         if nd.name in pbs:
             pbs[nd.name].rotation_mode = 'QUATERNION'
 
-    # rest transform relative to parent, Blender armature space
-    rest_rel = {}
-    for nd in model.nodes:
-        if nd.name not in bones:
-            continue
-        bl = bones[nd.name].matrix_local
-        if nd.parent is not None and nd.parent.name in bones:
-            rest_rel[nd.name] = bones[nd.parent.name].matrix_local.inverted() @ bl
-        else:
-            rest_rel[nd.name] = bl
+    node_indices, rest_t, rest_q_inv = _rest_arrays(model, arm_obj)
 
     # anim-binding metadata (dims/translation) by animation name, for round-trip
     bindings = {}
@@ -76,10 +245,14 @@ def import_animations(model, arm_obj, fps=None):
             list(org) if org is not None else None,
         )
 
+    interpolation = _new_key_interpolation()
+
     made = 0
     for anim in anims:
         if not anim.keyframe_count:
             continue
+        if names is not None and anim.name not in names:
+            continue
 
         action = bpy.data.actions.new(name=anim.name)
         action.use_fake_user = True            # survive even when not active
@@ -102,28 +275,28 @@ def import_animations(model, arm_obj, fps=None):
         # property on the action so they survive untouched.
         action['lta_keyframe_strings'] = [kf.string or '' for kf in anim.keyframes]
 
-        prev_q = {}                            # per-bone quaternion continuity
+        # Keys landing on the same frame: the later one wins, as it did with
+        # keyframe_insert; F-Curve keys must be sorted by frame.
+        frame_to_key = {}
         for ki, kf in enumerate(anim.keyframes):
-            frame = _frame_for(kf.time, fps)
-            for ni, nd in enumerate(model.nodes):
-                if nd.name not in pbs:
-                    continue
-                t = anim.node_keyframe_transforms[ni][ki]
-                L_b = Matrix.LocRotScale(swap_vec(t.location), swap_quat(t.rotation), None)
-                basis = rest_rel[nd.name].inverted() @ L_b
-                loc, rot, _ = basis.decompose()
-
-                # keep quaternion on the same hemisphere as the previous key
-                pq = prev_q.get(nd.name)
-                if pq is not None and pq.dot(rot) < 0.0:
-                    rot.negate()
-                prev_q[nd.name] = rot.copy()
-
-                pb = pbs[nd.name]
-                pb.location = loc
-                pb.rotation_quaternion = rot
-                pb.keyframe_insert('location', frame=frame, group=nd.name)
-                pb.keyframe_insert('rotation_quaternion', frame=frame, group=nd.name)
+            frame_to_key[_frame_for(kf.time, fps)] = ki
+        frames = sorted(frame_to_key)
+        keys = [frame_to_key[frame] for frame in frames]
+
+        locations, rotations = _basis_arrays(anim, node_indices, rest_t, rest_q_inv)
+        locations = locations[:, keys].astype(np.float32)
+        rotations = rotations[:, keys].astype(np.float32)
+
+        for bi, ni in enumerate(node_indices):
+            nd = model.nodes[ni]
+            locs, rots = locations[bi], rotations[bi]
+            base = 'pose.bones["%s"].' % bpy.utils.escape_identifier(nd.name)
+            for i in range(3):
+                fc = _new_fcurve(action, arm_obj, base + 'location', i, nd.name)
+                _fill_fcurve(fc, frames, locs[:, i], interpolation)
+            for i in range(4):
+                fc = _new_fcurve(action, arm_obj, base + 'rotation_quaternion', i, nd.name)
+                _fill_fcurve(fc, frames, rots[:, i], interpolation)
 
         # Visible reference markers for non-empty frame strings (e.g.
         # "cmd msg c2cam2 trigger") so they show up on the action's timeline
@@ -150,11 +323,10 @@ def import_animations(model, arm_obj, fps=None):
         ad.action = None
         made += 1
 
-    # Leave the armature in its REST pose, not the last frame of the last
-    # animation. The keyframing loop above sets pb.location / rotation as a
-    # side effect; with ad.action=None and all NLA tracks muted, those basis
-    # values would otherwise persist and the viewport would show the last
-    # sampled pose statically. Clear every pose bone back to identity.
+    # Leave the armature in its REST pose. Assigning each action above can
+    # evaluate it onto the pose bones; with ad.action=None and all NLA tracks
+    # muted, those basis values would otherwise persist and the viewport would
+    # show a sampled pose statically. Clear every pose bone back to identity.
     ident = Quaternion((1.0, 0.0, 0.0, 0.0))
     for pb in pbs:
         pb.location = (0.0, 0.0, 0.0)
@@ -165,3 +337,245 @@ def import_animations(model, arm_obj, fps=None):
     print("ANIMATIONS: %d actions imported as fake-user Actions (fps=%d)" % (made, fps))
     print("=" * 56)
     return made
+
+
+# --------------------------------------------------------------------------
+# Lazy mode
+# --------------------------------------------------------------------------
+class _DecodedNode(object):
+    """Name and parent of a model node -- all the animation code reads."""
+    __slots__ = ('name', 'parent')
+
+    def __init__(self, name, parent=None):
+        self.name = name
+        self.parent = parent
+
+
+class _DecodedAnimation(object):
+    """Keyframes and transform arrays of one animation, detached from its
+    Model (vertex deformations and bounds are not kept)."""
+    __slots__ = ('name', 'keyframes', 'interpolation_time', 'locations', 'rotations')
+
+    def __init__(self, anim):
+        self.name = anim.name
+        self.keyframes = list(anim.keyframes)
+        self.interpolation_time = getattr(anim, 'interpolation_time', None)
+        self.locations = anim.locations
+        self.rotations = anim.rotations
+
+    @property
+    def keyframe_count(self):
+        return len(self.keyframes)
+
+
+class _AnimationSource(object):
+    """What import_animations and AnimationSampler need from a Model: the node
+    hierarchy, the anim bindings and the named animations. No mesh data."""
+    def __init__(self, model, names=None):
+        nodes = {}
+        for nd in model.nodes:
+            nodes[id(nd)] = _DecodedNode(nd.name)
+        for nd in model.nodes:
+            if nd.parent is not None and id(nd.parent) in nodes:
+                nodes[id(nd)].parent = nodes[id(nd.parent)]
+        self.nodes = [nodes[id(nd)] for nd in model.nodes]
+        self.anim_bindings = list(getattr(model, 'anim_bindings', []) or [])
+        self.animations = [_DecodedAnimation(anim) for anim in getattr(model, 'animations', [])
+                           if anim.keyframe_count and (names is None or anim.name in names)]
+        self.complete = names is None     # every animation of the file
+
+    def names(self):
+        return {anim.name for anim in self.animations}
+
+
+# (path, mtime, size) -> _AnimationSource holding the animations that lazy
+# armatures still wait for; built ones are dropped (see prune_cache)
+_SOURCE_CACHE = {}
+
+# normalized source paths kept whole for the running quick preview
+_PREVIEW_PATHS = set()
+
+
+def _file_key(path):
+    st = os.stat(path)
+    return (os.path.normcase(os.path.abspath(path)), st.st_mtime_ns, st.st_size)
+
+
+def _read_model(path):
+    # the readers are only needed here, not for a normal import
+    try:
+        from .reader_dispatch import read_model
+    except ImportError:
+        from reader_dispatch import read_model
+    return read_model(path)
+
+
+def _store_source(key, source):
+    for stale in [k for k in _SOURCE_CACHE if k[0] == key[0]]:
+        del _SOURCE_CACHE[stale]
+    _SOURCE_CACHE[key] = source
+
+
+def _pending_by_path():
+    """Pending animation names of every lazy armature, by normalized source path."""
+    pending = {}
+    for obj in bpy.data.objects:
+        if obj.type != 'ARMATURE':
+            continue
+        path = obj.get(SOURCE_PATH_KEY)
+        names = pending_animations(obj)
+        if path and names:
+            pending.setdefault(os.path.normcase(os.path.abspath(path)), set()).update(names)
+    return pending
+
+
+def prune_cache():
+    """Drop cached animations no armature is waiting for any more: the ones
+    already built, and all of a file's once its armatures are deleted. The
+    file being previewed is kept as it is."""
+    if not _SOURCE_CACHE:
+        return
+    pending = _pending_by_path()
+    for key in list(_SOURCE_CACHE):
+        if key[0] in _PREVIEW_PATHS:
+            continue
+        names = pending.get(key[0])
+        source = _SOURCE_CACHE[key]
+        if names:
+            source.animations = [anim for anim in source.animations if anim.name in names]
+            source.complete = False
+        if not names or not source.animations:
+            del _SOURCE_CACHE[key]
+
+
+def source_path(arm_obj):
+    """Model file an armature was imported from. Raises ValueError if none."""
+    path = arm_obj.get(SOURCE_PATH_KEY) if arm_obj is not None else None
+    if not path:
+        raise ValueError("'%s' was not imported from a LithTech model" % getattr(arm_obj, 'name', ''))
+    return path
+
+
+def _source_for(arm_obj, names=None):
+    """Decoded animations of the armature's source file, including `names`
+    (None: all of them). The file is read again if they are not cached
+    (never loaded in this session, already built and dropped, or the file
+    changed); the new entry keeps the names lazy armatures are waiting for.
+    Raises OSError if the file is gone."""
+    prune_cache()       # armatures deleted since the last use
+    path = source_path(arm_obj)
+    key = _file_key(path)
+    source = _SOURCE_CACHE.get(key)
+    if names is None:
+        cached = source is not None and source.complete
+    else:
+        cached = source is not None and set(names) <= source.names()
+    if not cached:
+        keep = None if names is None else set(names) | _pending_by_path().get(key[0], set())
+        source = _AnimationSource(_read_model(path), keep)
+        _store_source(key, source)
+    return source
+
+
+def remember_source(arm_obj, path):
+    """Record the source file on the armature, so its animations can be
+    built or previewed later."""
+    arm_obj[SOURCE_PATH_KEY] = os.path.abspath(path)
+
+
+def load_animation(arm_obj, name):
+    """(source, animation) for previewing `name` from the armature's source
+    file; source has the `nodes` AnimationSampler needs. The animation is
+    None if the file has no such animation.
+
+    All animations of the file stay cached until release_preview_source(),
+    so previewing the next clip does not read the file again."""
+    source = _source_for(arm_obj)
+    anim = next((a for a in source.animations if a.name == name), None)
+    _PREVIEW_PATHS.clear()
+    _PREVIEW_PATHS.add(os.path.normcase(os.path.abspath(source_path(arm_obj))))
+    prune_cache()       # a file kept for an earlier preview
+    return source, anim
+
+
+def release_preview_source():
+    """Let prune_cache drop the file kept by load_animation."""
+    _PREVIEW_PATHS.clear()
+    prune_cache()
+
+
+def register_lazy_animations(model, arm_obj, path):
+    """Record the model's animations on the armature without building any
+    Actions. Returns the number of animations available."""
+    names = [anim.name for anim in getattr(model, 'animations', []) if anim.keyframe_count]
+    remember_source(arm_obj, path)
+    arm_obj[ANIM_NAMES_KEY] = names
+    arm_obj[LAZY_NAMES_KEY] = names
+    _store_source(_file_key(path), _AnimationSource(model, set(names)))
+
+    print("=" * 56)
+    print("ANIMATIONS: %d available, Actions are created on demand" % len(names))
+    print("=" * 56)
+    return len(names)
+
+
+def pending_animations(arm_obj):
+    """Names of lazy animations that have no Action yet, in file order."""
+    if arm_obj is None:
+        return []
+    return [str(name) for name in arm_obj.get(LAZY_NAMES_KEY, [])]
+
+
+def _animation_state(arm_obj):
+    """Active Action (and 4.4+ action slot) and pose-bone transforms, which
+    import_animations changes on its way."""
+    ad = arm_obj.animation_data
+    action = ad.action if ad is not None else None
+    slot = getattr(ad, 'action_slot', None) if ad is not None else None
+    pose = [(pb.name, pb.location.copy(), pb.rotation_quaternion.copy(),
+             pb.rotation_euler.copy(), tuple(pb.rotation_axis_angle), pb.scale.copy())
+            for pb in arm_obj.pose.bones]
+    return action, slot, pose
+
+
+def _restore_animation_state(arm_obj, state):
+    # rotation_mode stays QUATERNION: the new Actions key rotation_quaternion
+    action, slot, pose = state
+    ad = arm_obj.animation_data
+    if ad is not None:
+        ad.action = action
+        if action is not None and slot is not None:
+            try:
+                ad.action_slot = slot
+            except (AttributeError, TypeError, RuntimeError):
+                pass
+    pbs = arm_obj.pose.bones
+    for name, loc, quat, euler, axis_angle, scale in pose:
+        pb = pbs.get(name)
+        if pb is None:
+            continue
+        pb.location = loc
+        pb.rotation_quaternion = quat
+        pb.rotation_euler = euler
+        pb.rotation_axis_angle = axis_angle
+        pb.scale = scale
+
+
+def materialize_animations(arm_obj, names=None, fps=None):
+    """Create the Actions + NLA tracks for pending lazy animations: all of
+    them, or the ones in `names`. The armature's active Action and pose are
+    left as they were. Returns the number created."""
+    pending = pending_animations(arm_obj)
+    wanted = [name for name in pending if names is None or name in names]
+    if not wanted:
+        return 0
+
+    source = _source_for(arm_obj, wanted)
+    state = _animation_state(arm_obj)
+    try:
+        made = import_animations(source, arm_obj, fps, names=set(wanted))
+    finally:
+        _restore_animation_state(arm_obj, state)
+    arm_obj[LAZY_NAMES_KEY] = [name for name in pending if name not in wanted]
+    prune_cache()
+    return made
@@ -13,14 +13,15 @@ Works as an addon package member and standalone (path) via the import shim.
 
 import bpy
 import os
+import numpy as np
 from mathutils import Matrix
 
 try:
-    from .coordinates import (swap_vec, swap_dir, swap_quat, swap_matrix,
-                              flip_winding, geo_signature)
+    from .coordinates import (swap_vec, swap_quat, swap_matrix, swap_vec_array,
+                              WINDING_ORDER, geo_signature)
 except ImportError:
-    from coordinates import (swap_vec, swap_dir, swap_quat, swap_matrix,
-                             flip_winding, geo_signature)
+    from coordinates import (swap_vec, swap_quat, swap_matrix, swap_vec_array,
+                             WINDING_ORDER, geo_signature)
 
 
 # --------------------------------------------------------------------------
@@ -120,59 +121,66 @@ def build_piece(model, piece, arm_obj, collection):
     # Null-mesh LODs (LOD.type == 7) carry no vertices/faces at all. Bail out
     # before touching Blender mesh APIs -- an empty mesh fed into
     # normals_split_custom_set_from_vertices() is a known crash trigger.
-    if not lod.vertices or not lod.faces:
+    arrays = lod.get_arrays()
+    if not arrays.vertex_count or not arrays.triangle_count:
         print("  [skip] piece '%s': empty LOD (type=%s, %d verts, %d faces)"
-              % (piece.name, getattr(lod, 'type', '?'), len(lod.vertices), len(lod.faces)))
+              % (piece.name, getattr(lod, 'type', '?'), arrays.vertex_count, arrays.triangle_count))
         return None
 
-    verts = [tuple(swap_vec(v.location)) for v in lod.vertices]
-    normals = [tuple(swap_dir(v.normal)) for v in lod.vertices]
+    verts = np.ascontiguousarray(swap_vec_array(arrays.positions), dtype=np.float32)
+    normals = np.ascontiguousarray(swap_vec_array(arrays.normals), dtype=np.float32)
 
     # DIAGNOSTIC: some LTB vertex-format masks omit VTX_Normal entirely, in
     # which case abc.py:Vertex.normal stays at its default (0,0,0). Feeding a
     # zero/NaN vector into normals_split_custom_set_from_vertices() is the
     # other known crash trigger -- sanitize and report instead of crashing.
-    bad_idx = [i for i, n in enumerate(normals)
-               if not all(c == c for c in n)                 # NaN check
-               or (n[0] * n[0] + n[1] * n[1] + n[2] * n[2]) < 1e-8]  # zero-length
-    if bad_idx:
+    n64 = normals.astype(np.float64)
+    bad = np.isnan(n64).any(axis=1) | ((n64 * n64).sum(axis=1) < 1e-8)   # NaN / zero-length
+    if bad.any():
+        bad_idx = np.flatnonzero(bad)
         print("  [normals] piece '%s': %d/%d degenerate normal(s), e.g. vertex idx %s -- using fallback (0,0,1)"
-              % (piece.name, len(bad_idx), len(normals), bad_idx[:5]))
-        for i in bad_idx:
-            normals[i] = (0.0, 0.0, 1.0)
+              % (piece.name, len(bad_idx), len(normals), bad_idx[:5].tolist()))
+        normals[bad] = (0.0, 0.0, 1.0)
 
     # DIAGNOSTIC: degenerate (zero-area) triangles -- duplicate vertex index
     # within one face -- also a known crash trigger for the custom-normals
     # backend. Report them; they are dropped from the face list below.
-    degenerate_faces = 0
+    tris = arrays.indices.reshape(-1, 3)
+    corner_uv = arrays.texcoords.reshape(-1, 3, 2)
+    keep = (tris[:, 0] != tris[:, 1]) & (tris[:, 1] != tris[:, 2]) & (tris[:, 0] != tris[:, 2])
+    degenerate_faces = len(tris) - int(keep.sum())
 
-    faces, corner_uv = [], []
-    for face in lod.faces:
-        idx = [fv.vertex_index for fv in face.vertices]
-        if len(set(idx)) != 3:
-            degenerate_faces += 1
-            continue
-        uv = [(fv.texcoord[0], 1.0 - fv.texcoord[1]) for fv in face.vertices]  # DX->Blender V
-        a, c, b = flip_winding(idx)
-        faces.append((a, c, b))
-        corner_uv.append(flip_winding(uv))
+    # flip_winding on every triangle; apply to indices AND per-corner UVs
+    faces = np.ascontiguousarray(tris[keep][:, WINDING_ORDER], dtype=np.int32)
+    corner_uv = np.array(corner_uv[keep][:, WINDING_ORDER], dtype=np.float32)
+    corner_uv[:, :, 1] = 1.0 - corner_uv[:, :, 1]  # DX->Blender V
 
     if degenerate_faces:
         print("  [faces] piece '%s': dropped %d degenerate (zero-area) face(s)"
               % (piece.name, degenerate_faces))
 
-    if not faces:
+    if not len(faces):
         print("  [skip] piece '%s': no valid faces after filtering" % piece.name)
         return None
 
+    # Straight from the arrays, instead of from_pydata's per-item Python loops
+    face_count = len(faces)
     mesh = bpy.data.meshes.new(piece.name)
-    mesh.from_pydata(verts, [], faces)
-    mesh.update()
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set('co', verts.ravel())
+    mesh.loops.add(face_count * 3)
+    mesh.loops.foreach_set('vertex_index', faces.ravel())
+    mesh.polygons.add(face_count)
+    mesh.polygons.foreach_set('loop_start', np.arange(0, face_count * 3, 3, dtype=np.int32))
+    try:
+        mesh.polygons.foreach_set('loop_total', np.full(face_count, 3, dtype=np.int32))
+    except (AttributeError, TypeError, RuntimeError):
+        pass  # read-only in 4.x, derived from loop_start
+    mesh.update(calc_edges=True)
 
-    for poly in mesh.polygons:
-        poly.use_smooth = True
+    mesh.polygons.foreach_set('use_smooth', np.ones(face_count, dtype=bool))
     try:
-        mesh.normals_split_custom_set_from_vertices(normals)
+        mesh.normals_split_custom_set_from_vertices(normals.tolist())
     except Exception as e:
         print("  [normals] skipped: %s" % e)
 
@@ -182,19 +190,16 @@ def build_piece(model, piece, arm_obj, collection):
     # too; the exporter reads this back for exact, robust normal preservation.
     try:
         attr = mesh.attributes.new('lt_normal', 'FLOAT_VECTOR', 'POINT')
-        attr.data.foreach_set('vector', [c for n in normals for c in n])
+        attr.data.foreach_set('vector', normals.ravel())
         # geometry fingerprint so the exporter can tell if the mesh was later
         # deformed; if so it recomputes normals instead of re-using lt_normal.
-        mesh['lt_geo_sig'] = geo_signature([v.co for v in mesh.vertices])
+        # verts is float32, i.e. exactly what mesh.vertices[].co reads back.
+        mesh['lt_geo_sig'] = geo_signature(verts.tolist())
     except Exception as e:
         print("  [lt_normal] skipped: %s" % e)
 
     uv_layer = mesh.uv_layers.new(name="UVMap")
-    li = 0
-    for fi, poly in enumerate(mesh.polygons):
-        for k in range(3):
-            uv_layer.data[li].uv = corner_uv[fi][k]
-            li += 1
+    uv_layer.data.foreach_set('uv', corner_uv.ravel())
 
     obj = bpy.data.objects.new(piece.name, mesh)
     collection.objects.link(obj)
@@ -215,11 +220,7 @@ def build_piece(model, piece, arm_obj, collection):
         mat["lt_texture_index"] = tex_index
     mesh.materials.append(mat)
 
-    name_to_group = {nd.name: obj.vertex_groups.new(name=nd.name) for nd in model.nodes}
-    for vi, v in enumerate(lod.vertices):
-        for w in v.weights:
-            if w.node_index < len(model.nodes):
-                name_to_group[model.nodes[w.node_index].name].add([vi], float(w.bias), 'REPLACE')
+    build_vertex_groups(model, arrays, obj)
 
     obj.parent = arm_obj
     mod = obj.modifiers.new("Armature", 'ARMATURE')
@@ -227,6 +228,44 @@ def build_piece(model, piece, arm_obj, collection):
     return obj
 
 
+# --------------------------------------------------------------------------
+def build_vertex_groups(model, arrays, obj):
+    """Vertex groups for the nodes that influence this piece only, filled with
+    one VertexGroup.add() per (node, weight) pair instead of one per weight.
+    """
+    counts = np.diff(arrays.weight_offsets)
+    vertex_ids = np.repeat(np.arange(arrays.vertex_count, dtype=np.int64), counts)
+    nodes = arrays.weight_nodes.astype(np.int64)
+    biases = arrays.weight_biases
+
+    valid = (nodes >= 0) & (nodes < len(model.nodes))
+    vertex_ids, nodes, biases = vertex_ids[valid], nodes[valid], biases[valid]
+    if not len(nodes):
+        return
+
+    # A repeated node on one vertex used to REPLACE the earlier weight; keep
+    # the last one the same way.
+    key = nodes * arrays.vertex_count + vertex_ids
+    _, last = np.unique(key[::-1], return_index=True)
+    last = len(key) - 1 - last
+    vertex_ids, nodes, biases = vertex_ids[last], nodes[last], biases[last]
+
+    name_to_group = {}
+    for node_index in np.unique(nodes).tolist():
+        name = model.nodes[node_index].name
+        if name not in name_to_group:
+            name_to_group[name] = obj.vertex_groups.new(name=name)
+
+    order = np.lexsort((vertex_ids, biases, nodes))
+    vertex_ids, nodes, biases = vertex_ids[order], nodes[order], biases[order]
+    starts = np.flatnonzero(np.r_[True, (nodes[1:] != nodes[:-1]) | (biases[1:] != biases[:-1])])
+    ends = np.r_[starts[1:], len(nodes)]
+
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        group = name_to_group[model.nodes[int(nodes[start])].name]
+        group.add(vertex_ids[start:end].tolist(), float(biases[start]), 'REPLACE')
+
+
 # --------------------------------------------------------------------------
 def build_sockets(model, arm_obj, collection):
     for sock in getattr(model, 'sockets', []):
@@ -32,6 +32,7 @@ Verified numerically (max error 0 / 1e-15):
   - the quaternion path and the matrix path agree
 """
 
+import numpy as np
 from mathutils import Matrix, Vector, Quaternion
 
 # Y<->Z swap. Self-inverse, det = -1.
@@ -82,6 +83,26 @@ def swap_quat_xyzw(x, y, z, w):
     return Quaternion((w, -x, -z, -y))
 
 
+# --------------------------------------------------------------------------
+# Arrays: the same swaps over the last axis of a NumPy array
+# --------------------------------------------------------------------------
+def swap_vec_array(a, scale=1.0):
+    """swap_vec / swap_dir for an (..., 3) array. Returns a new array."""
+    out = a[..., [0, 2, 1]]
+    if scale != 1.0:
+        out *= scale
+    return out
+
+
+def swap_quat_array(q):
+    """swap_quat for an (..., 4) array in (w, x, y, z) order. Returns a new
+    array: (w, x, y, z) -> (w, -x, -z, -y).
+    """
+    out = q[..., [0, 1, 3, 2]]
+    out[..., 1:] *= -1.0
+    return out
+
+
 # --------------------------------------------------------------------------
 # Full transforms
 # --------------------------------------------------------------------------
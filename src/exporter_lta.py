@@ -24,9 +24,11 @@ bl_info = {
 }
 
 import os
+import re
 import time
 
 import bpy
+import numpy as np
 from bpy.props import (
     StringProperty,
     BoolProperty,
@@ -36,12 +38,18 @@ from bpy.props import (
 )
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
-from mathutils import Matrix, Vector, Quaternion
+from mathutils import Matrix, Vector, Quaternion, Euler
 
 try:
+    from . import fk
     from .coordinates import geo_signature, mat_close
+    from .animation_import import (materialize_animations, pending_animations,
+                                   ANIM_NAMES_KEY)
 except ImportError:
+    import fk
     from coordinates import geo_signature, mat_close
+    from animation_import import (materialize_animations, pending_animations,
+                                  ANIM_NAMES_KEY)
 
 
 # ---------------------------------------------------------------------------
@@ -75,39 +83,99 @@ def mat_to_lt(m, scale=1.0):
     return out
 
 
+# ---------------------------------------------------------------------------
+# Action sampling helpers
+# ---------------------------------------------------------------------------
+
+_POSE_BONE_PATH = re.compile(r'pose\.bones\["((?:[^"\\]|\\.)*)"\]\.(\w+)$')
+
+
+def _action_fcurves(action, arm_obj):
+    """F-Curves of `action` that animate `arm_obj`: the assigned slot's
+    channelbag on layered (4.4+) actions, action.fcurves before that."""
+    ad = arm_obj.animation_data
+    slot = getattr(ad, 'action_slot', None) if ad is not None else None
+    if slot is not None and getattr(action, 'layers', None):
+        for layer in action.layers:
+            for strip in layer.strips:
+                channelbag = strip.channelbag(slot)
+                if channelbag is not None:
+                    return list(channelbag.fcurves)
+    return list(action.fcurves)
+
+
 # ---------------------------------------------------------------------------
 # LTA writer
 # ---------------------------------------------------------------------------
 
+# Trailing zeros of a fixed-point number ("1.500000" -> "1.5", "2.000000" ->
+# "2") and the negative zero left over ("-0.000000" -> "-0" -> "0"). Every
+# float the writer emits has a decimal point, so integers are never touched.
+_TRAILING_ZEROS = re.compile(r'\.?0+(?=[\s)]|$)')
+_NEGATIVE_ZERO = re.compile(r'(?<![\w.])-0(?=[\s)]|$)')
+
+
+def trim_floats(text):
+    """Shortest form of every fixed-point number in `text` that parses back
+    to the same value at the written precision."""
+    return _NEGATIVE_ZERO.sub('0', _TRAILING_ZEROS.sub('', text))
+
+
 class LTAWriter:
     """Builds nicely indented LTA text. Mirrors the structure produced by
-    the original LithTech tool chain so ModelEdit's reader is happy."""
+    the original LithTech tool chain so ModelEdit's reader is happy.
+
+    Without a `stream` the whole text is kept for text(). With a text stream
+    (see open_lta_stream) lines are buffered and written out every
+    `chunk_lines` lines, so memory use doesn't grow with the output; call
+    flush() at the end.
+
+    With `trim`, floats are written in their shortest form at the chosen
+    precision (see trim_floats) instead of always with `float_digits`
+    decimals."""
 
-    def __init__(self, float_digits=6):
+    BLOCK_ROWS = 4096   # rows formatted per template application in block()
+
+    def __init__(self, float_digits=6, stream=None, chunk_lines=8192, trim=False):
         self.lines = []
         self.depth = 0
         self.ffmt = "%%.%df" % float_digits
+        self.trim = trim
+        self.stream = stream
+        self.chunk_lines = chunk_lines
 
     # -- low level --
+    def _emit(self, text):
+        self.lines.append(text)
+        if self.stream is not None and len(self.lines) >= self.chunk_lines:
+            self.flush()
+
+    def flush(self):
+        if self.stream is not None and self.lines:
+            self.stream.write('\n'.join(self.lines) + '\n')
+            self.lines = []
+
     def open(self, *head):
         base = '\t' * self.depth
-        self.lines.append(base + '( ' + ' '.join(head) if head else base + '(')
+        self._emit(base + '( ' + ' '.join(head) if head else base + '(')
         self.depth += 1
 
     def close(self):
         self.depth -= 1
-        self.lines.append('\t' * self.depth + ')')
+        self._emit('\t' * self.depth + ')')
 
     def line(self, text):
-        self.lines.append('\t' * self.depth + text)
+        self._emit('\t' * self.depth + text)
 
     def raw_block(self, text):
         base = '\t' * self.depth
         for ln in text.splitlines():
-            self.lines.append(base + ln)
+            self._emit(base + ln)
 
     def f(self, v):
         s = self.ffmt % v
+        if self.trim:
+            s = trim_floats(s)
         return s
 
     def s(self, v):
@@ -116,13 +184,67 @@ class LTAWriter:
     def vec(self, v):
         return '( ' + ' '.join(self.f(c) for c in v) + ' )'
 
+    def block(self, rows, groups=None):
+        """One '( a b c )' line per row of an (n, k) float array-like, as
+        vec() would write it, but formatted with a single precompiled
+        template per chunk of rows instead of one % per number. `groups`
+        nests each row, e.g. (3, 4) -> '( ( x y z ) ( x y z w ) )'."""
+        try:
+            values = np.asarray(rows, dtype=np.float64)
+        except ValueError:
+            values = None  # ragged rows
+        if values is None or values.ndim != 2:
+            for row in rows:
+                self.line(self.vec(row))
+            return
+        rows = values
+        if groups:
+            inner = ' '.join('( ' + ' '.join([self.ffmt] * g) + ' )' for g in groups)
+        else:
+            inner = ' '.join([self.ffmt] * rows.shape[1])
+        template = '\t' * self.depth + '( ' + inner + ' )'
+        for start in range(0, len(rows), self.BLOCK_ROWS):
+            chunk = rows[start:start + self.BLOCK_ROWS]
+            text = '\n'.join([template] * len(chunk)) % tuple(chunk.ravel().tolist())
+            self._emit(trim_floats(text) if self.trim else text)
+
     def leaf(self, name, *vals):
         self.line('( %s %s )' % (name, ' '.join(vals)))
 
     def text(self):
+        if self.stream is not None:
+            raise ValueError("text() is not available on a streaming LTAWriter")
         return '\n'.join(self.lines) + '\n'
 
 
+# compression -> (module, file suffix)
+_COMPRESSORS = {
+    'GZIP': ('gzip', '.gz'),
+    'BZ2': ('bz2', '.bz2'),
+    'LZMA': ('lzma', '.xz'),
+}
+
+
+def lta_output_path(path, compression='NONE'):
+    """Target file for an export: compressed output gets the compressor's
+    suffix (hero.lta -> hero.lta.gz) so it is recognisable as such."""
+    entry = _COMPRESSORS.get(compression)
+    if entry is None or path.lower().endswith(entry[1]):
+        return path
+    return path + entry[1]
+
+
+def open_lta_stream(path, compression='NONE'):
+    """Text stream for LTA output: a plain ASCII file, or one written through
+    the gzip / bz2 / lzma module."""
+    entry = _COMPRESSORS.get(compression)
+    if entry is None:
+        return open(path, 'w', encoding='ascii', errors='replace', newline='\n')
+    import importlib
+    return importlib.import_module(entry[0]).open(
+        path, 'wt', encoding='ascii', errors='replace', newline='\n')
+
+
 # ---------------------------------------------------------------------------
 # Scene data gathering
 # ---------------------------------------------------------------------------
@@ -533,11 +655,30 @@ class LTAExporter:
             # action. Using bpy.data.actions would drag in leftover actions from
             # other imported models (e.g. a hero rig's anims exported onto a
             # different character), which then deform the wrong skeleton.
+            # Animations imported on demand that were never played have no
+            # Action yet; build them now so they get exported too.
+            if pending_animations(self.arm_obj):
+                try:
+                    materialize_animations(self.arm_obj)
+                except Exception as ex:
+                    raise ExportError("Could not load the remaining animations "
+                                      "from the source model: %s" % ex)
             actions = []
             seen = set()
             ad = self.arm_obj.animation_data
             if ad:
-                for tr in ad.nla_tracks:
+                tracks = list(ad.nla_tracks)
+                # Tracks built on demand were appended in play order; put
+                # them back in the order of the source file, within the
+                # slots they occupy. Other tracks keep their positions.
+                order = {str(n): i for i, n in
+                         enumerate(self.arm_obj.get(ANIM_NAMES_KEY, []))}
+                slots = [i for i, tr in enumerate(tracks) if tr.name in order]
+                lazy = sorted((tracks[i] for i in slots),
+                              key=lambda tr: order[tr.name])
+                for i, tr in zip(slots, lazy):
+                    tracks[i] = tr
+                for tr in tracks:
                     for st in tr.strips:
                         a = getattr(st, 'action', None)
                         if a is not None and a.name not in seen:
@@ -614,6 +755,104 @@ class LTAExporter:
                    len(stored_strings),
                    "; ".join(label(i) for i in out_of_range)))
 
+    def _tracks_from_local(self, local):
+        """{bone: [(pos, quat xyzw)]} in LT space from a (bones, frames, 4, 4)
+        stack of parent-relative Blender matrices."""
+        local_lt = local[..., [0, 2, 1, 3], :][..., [0, 2, 1, 3]]  # mat_to_lt
+        locations, rotations = fk.decompose(local_lt)
+        locations *= self.o.scale
+        tracks = {}
+        for bi, b in enumerate(self.bones):
+            # decompose() of the conjugated matrix yields the LT rotation
+            # directly in (w,x,y,z); reorder to x y z w
+            tracks[b.name] = [((l[0], l[1], l[2]), (q[1], q[2], q[3], q[0]))
+                              for l, q in zip(locations[bi].tolist(), rotations[bi].tolist())]
+        return tracks
+
+    def _sample_depsgraph(self, frames):
+        """Bone-local LT transforms per frame by evaluating the whole scene
+        at each frame. Works for any rig (constraints, drivers, ...)."""
+        scn = self.context.scene
+        arm_obj = self.arm_obj
+        pose_arm = np.empty((len(self.bones), len(frames), 4, 4))
+        for fi, f in enumerate(frames):
+            scn.frame_set(f)
+            depsgraph = self.context.evaluated_depsgraph_get()
+            pbs = arm_obj.evaluated_get(depsgraph).pose.bones
+            for bi, b in enumerate(self.bones):
+                pose_arm[bi, fi] = pbs[b.name].matrix
+        return self._tracks_from_local(fk.world_to_local(pose_arm, fk.parent_indices(self.bones)))
+
+    def _sample_fcurves(self, action, frames):
+        """Same result as _sample_depsgraph, straight from the action's bone
+        F-Curves. With plain parenting a bone's pose relative to its parent
+        is rest_rel @ basis, independent of the parent's pose, so every bone
+        and frame is one matrix product -- no scene evaluation at all.
+
+        Returns None when the pose depends on more than the action
+        (constraints, drivers, non-default inheritance, rest position); the
+        caller then falls back to the depsgraph."""
+        arm_obj = self.arm_obj
+        if arm_obj.data.pose_position != 'POSE':
+            return None
+        ad = arm_obj.animation_data
+        if ad is not None and len(ad.drivers):
+            return None
+        pbs = arm_obj.pose.bones
+        for b in self.bones:
+            pb = pbs.get(b.name)
+            if pb is None or len(pb.constraints):
+                return None
+            bone = pb.bone
+            if not bone.use_inherit_rotation or bone.inherit_scale != 'FULL' \
+                    or not bone.use_local_location or bone.use_relative_parent:
+                return None
+
+        curves = {}
+        if action is not None:
+            for fc in _action_fcurves(action, arm_obj):
+                m = _POSE_BONE_PATH.match(fc.data_path)
+                if m is None or fc.mute:
+                    continue
+                key = (bpy.utils.unescape_identifier(m.group(1)), m.group(2))
+                curves.setdefault(key, {})[fc.array_index] = fc
+
+        frames = [float(f) for f in frames]
+
+        def channel(name, prop, current):
+            # unkeyed channels keep the pose bone's current value, as they
+            # do when the action is evaluated
+            out = np.empty((len(frames), len(current)))
+            keyed = curves.get((name, prop), {})
+            for i, value in enumerate(current):
+                fc = keyed.get(i)
+                out[:, i] = [fc.evaluate(f) for f in frames] if fc is not None else value
+            return out
+
+        rest_rel = fk.world_to_local(
+            fk.matrix_stack([pbs[b.name].bone.matrix_local for b in self.bones]),
+            fk.parent_indices(self.bones))
+        basis = np.empty((len(self.bones), len(frames), 4, 4))
+        for bi, b in enumerate(self.bones):
+            pb = pbs[b.name]
+            bone = pb.bone
+            loc = channel(b.name, 'location', tuple(pb.location))
+            if bone.use_connect:
+                loc[:] = 0.0  # connected bones ignore their location
+            scale = channel(b.name, 'scale', tuple(pb.scale))
+            mode = pb.rotation_mode
+            if mode == 'QUATERNION':
+                quat = channel(b.name, 'rotation_quaternion', tuple(pb.rotation_quaternion))
+            elif mode == 'AXIS_ANGLE':
+                axis_angle = channel(b.name, 'rotation_axis_angle', tuple(pb.rotation_axis_angle))
+                quat = np.array([tuple(Quaternion(aa[1:], aa[0])) for aa in axis_angle.tolist()])
+            else:
+                euler = channel(b.name, 'rotation_euler', tuple(pb.rotation_euler))
+                quat = np.array([tuple(Euler(e, mode).to_quaternion()) for e in euler.tolist()])
+            basis[bi] = fk.compose(loc, quat, scale)
+
+        return self._tracks_from_local(rest_rel[:, None] @ basis)
+
     def sample_action(self, action):
         """Sample an action (or rest pose if None) into
         (name, times_ms, {bone: [(pos, quat)]}, binding dict)."""
@@ -699,38 +938,25 @@ class LTAExporter:
         else:
             ad.action = None
 
-        tracks = {b.name: [] for b in self.bones}
         f_start = frames[0]
         times = []
         strings = []
+        for fi, f in enumerate(frames):
+            if explicit_times is not None:
+                times.append(int(round(explicit_times[fi])))
+            else:
+                times.append(int(round((f - f_start) * 1000.0 / fps)))
+            if explicit_strings is not None and fi < len(explicit_strings):
+                strings.append(str(explicit_strings[fi]))
+            else:
+                strings.append('')
+
+        frame_changed = False
         try:
-            for fi, f in enumerate(frames):
-                scn.frame_set(f)
-                depsgraph = self.context.evaluated_depsgraph_get()
-                ev = arm_obj.evaluated_get(depsgraph)
-                pose_arm = {pb.name: pb.matrix.copy()
-                            for pb in ev.pose.bones}
-                for b in self.bones:
-                    P = pose_arm[b.name]
-                    if b.parent:
-                        local_b = pose_arm[b.parent.name].inverted_safe() @ P
-                    else:
-                        local_b = P
-                    local_lt = mat_to_lt(local_b, self.o.scale)
-                    loc, rot, _s = local_lt.decompose()
-                    # decompose() of the conjugated matrix yields the LT
-                    # rotation directly in (w,x,y,z); reorder to x y z w
-                    tracks[b.name].append(
-                        ((loc.x, loc.y, loc.z),
-                         (rot.x, rot.y, rot.z, rot.w)))
-                if explicit_times is not None:
-                    times.append(int(round(explicit_times[fi])))
-                else:
-                    times.append(int(round((f - f_start) * 1000.0 / fps)))
-                if explicit_strings is not None and fi < len(explicit_strings):
-                    strings.append(str(explicit_strings[fi]))
-                else:
-                    strings.append('')
+            tracks = self._sample_fcurves(action, frames)
+            if tracks is None:
+                frame_changed = True
+                tracks = self._sample_depsgraph(frames)
         finally:
             ad.action = prev_action
             if prev_slot is not None and hasattr(ad, "action_slot"):
@@ -749,7 +975,8 @@ class LTAExporter:
                     ad.use_nla = prev_use_nla
                 except Exception:
                     pass
-            scn.frame_set(prev_frame)
+            if frame_changed:
+                scn.frame_set(prev_frame)
 
         # quaternion continuity per track
         for tk in tracks.values():
@@ -772,8 +999,11 @@ class LTAExporter:
 
     # -- writing ----------------------------------------------------------------
 
-    def write(self, shapes, sockets, anims):
-        w = LTAWriter(self.o.float_digits)
+    def write(self, shapes, sockets, anims, stream=None):
+        """LTA text for the gathered data. With `stream`, the text is
+        written to it as it is generated and None is returned."""
+        w = LTAWriter(self.o.float_digits, stream,
+                      trim=getattr(self.o, 'trim_floats', False))
         model_name = self.o.model_name.strip() or \
             os.path.splitext(os.path.basename(self.filepath))[0]
 
@@ -933,6 +1163,9 @@ class LTAExporter:
             w.close()
 
         w.close()  # lt-model-0
+        if stream is not None:
+            w.flush()
+            return None
         return w.text()
 
     def _write_transform(self, w, bone):
@@ -965,32 +1198,28 @@ class LTAExporter:
 
         w.open('vertex')
         w.open()
-        for v in shape['verts']:
-            w.line(w.vec(v))
+        w.block(shape['verts'])
         w.close()
         w.close()
 
         if shape['normals']:
             w.open('normals')
             w.open()
-            for n in shape['normals']:
-                w.line(w.vec(n))
+            w.block(shape['normals'])
             w.close()
             w.close()
 
         if shape['uvs']:
             w.open('uvs')
             w.open()
-            for uv in shape['uvs']:
-                w.line(w.vec(uv))
+            w.block(shape['uvs'])
             w.close()
             w.close()
 
         if shape['colors']:
             w.open('colors')
             w.open()
-            for c in shape['colors']:
-                w.line(w.vec(c))
+            w.block(shape['colors'])
             w.close()
             w.close()
 
@@ -1067,8 +1296,8 @@ class LTAExporter:
             w.open('frames')
             w.open('posquat')
             w.open()
-            for (pos, quat) in track:
-                w.line('( %s %s )' % (w.vec(pos), w.vec(quat)))
+            w.block([tuple(pos) + tuple(quat) for pos, quat in track],
+                    groups=(3, 4))
             w.close()
             w.close()
             w.close()
@@ -1099,14 +1328,23 @@ class LTAExporter:
         anims = []
         for action in self.collect_actions():
             anims.append(self.sample_action(action))
-        text = self.write(shapes, sockets, anims)
-        with open(self.filepath, 'w', encoding='ascii', errors='replace',
-                  newline='\n') as f:
-            f.write(text)
+        # Stream into a temporary file next to the target, so a failure
+        # halfway leaves any existing file untouched.
+        compression = getattr(self.o, 'compression', 'NONE')
+        out_path = lta_output_path(self.filepath, compression)
+        tmp_path = out_path + '.tmp'
+        try:
+            with open_lta_stream(tmp_path, compression) as f:
+                self.write(shapes, sockets, anims, stream=f)
+            os.replace(tmp_path, out_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         self.op.report(
             {'INFO'},
             "Exported '%s': %d nodes, %d shapes, %d sockets, %d animations "
-            "in %.2fs" % (os.path.basename(self.filepath), len(self.bones),
+            "in %.2fs" % (os.path.basename(out_path), len(self.bones),
                           len(shapes), len(sockets), len(anims),
                           time.time() - t0))
         if self.warnings:
@@ -1267,6 +1505,23 @@ class EXPORT_SCENE_OT_lta_jupiter(Operator, ExportHelper):
         description="Decimal places written for floats",
         default=6, min=3, max=9)
 
+    trim_floats: BoolProperty(
+        name="Trim Float Zeros",
+        description="Write floats in their shortest form at the chosen "
+                    "precision (0.500000 -> 0.5, 1.000000 -> 1) for "
+                    "smaller files",
+        default=False)
+
+    compression: EnumProperty(
+        name="Compression",
+        description="Write the file through a compressor (ModelEdit only "
+                    "reads uncompressed .lta; this add-on imports all of them)",
+        items=[('NONE', "None", "Plain text .lta"),
+               ('GZIP', "gzip", "gzip-compressed text (.lta.gz)"),
+               ('BZ2', "bzip2", "bzip2-compressed text (.lta.bz2)"),
+               ('LZMA', "xz", "xz/LZMA-compressed text (.lta.xz)")],
+        default='NONE')
+
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
@@ -1279,6 +1534,8 @@ class EXPORT_SCENE_OT_lta_jupiter(Operator, ExportHelper):
         box.prop(self, "use_selection")
         box.prop(self, "scale")
         box.prop(self, "float_digits")
+        box.prop(self, "trim_floats")
+        box.prop(self, "compression")
 
         box = layout.box()
         box.label(text="Geometry", icon='MESH_DATA')
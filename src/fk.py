@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""
+fk.py  --  Node-hierarchy transforms on NumPy stacks.
+
+The hierarchy is flattened once into a parent-index array (parents[i] is the
+index of node i's parent, -1 for roots). Transforms are (nodes, ..., 4, 4)
+stacks of row-major matrices in the mathutils convention (m[row][col],
+column vectors, world = parent_world @ local), so a whole animation --
+(nodes, keys, 4, 4) -- converts to parent-relative transforms with one
+batched inverse + matmul (world_to_local), no hierarchy ordering needed.
+
+Nothing here knows about Blender or coordinates; it works on raw LithTech
+matrices (readers) and Blender armature-space ones (exporter) alike.
+"""
+
+import numpy as np
+
+
+# --------------------------------------------------------------------------
+# Hierarchy
+# --------------------------------------------------------------------------
+def parent_indices(nodes):
+    """int32 parent-index array for abc.Node-like objects with a `.parent`
+    (node or None). Parents are looked up by identity, not by `.index`."""
+    position = {id(node): i for i, node in enumerate(nodes)}
+    parents = np.full(len(nodes), -1, dtype=np.int32)
+    for i, node in enumerate(nodes):
+        parent = getattr(node, 'parent', None)
+        if parent is not None and id(parent) in position:
+            parents[i] = position[id(parent)]
+    return parents
+
+
+def matrix_stack(matrices):
+    """(n, 4, 4) float64 array from a sequence of mathutils 4x4 matrices."""
+    return np.array([[tuple(row) for row in m] for m in matrices], dtype=np.float64).reshape(-1, 4, 4)
+
+
+# --------------------------------------------------------------------------
+# World -> local
+# --------------------------------------------------------------------------
+def _inverse(m):
+    # like Matrix.inverted_safe(): singular matrices don't raise
+    try:
+        return np.linalg.inv(m)
+    except np.linalg.LinAlgError:
+        return np.linalg.pinv(m)
+
+
+def world_to_local(world, parents):
+    """Local (parent-relative) stack from a (nodes, ..., 4, 4) world stack.
+    Roots keep their world matrix."""
+    parents = np.asarray(parents)
+    local = world.copy()
+    children = np.flatnonzero(parents >= 0)
+    local[children] = _inverse(world[parents[children]]) @ world[children]
+    return local
+
+
+# --------------------------------------------------------------------------
+# Matrices <-> location / rotation
+# --------------------------------------------------------------------------
+def compose(locations, rotations, scales=None):
+    """(..., 4, 4) matrices T @ R @ S from (..., 3) locations, (..., 4)
+    w x y z rotations (normalized here, zero -> identity) and optional
+    (..., 3) scales."""
+    locations = np.asarray(locations, dtype=np.float64)
+    rotations = np.asarray(rotations, dtype=np.float64)
+    norm = np.linalg.norm(rotations, axis=-1, keepdims=True)
+    rotations = np.where(norm > 0.0, rotations / np.where(norm > 0.0, norm, 1.0), (1.0, 0.0, 0.0, 0.0))
+    w, x, y, z = np.moveaxis(rotations, -1, 0)
+
+    m = np.zeros(locations.shape[:-1] + (4, 4))
+    m[..., 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    m[..., 0, 1] = 2.0 * (x * y - w * z)
+    m[..., 0, 2] = 2.0 * (x * z + w * y)
+    m[..., 1, 0] = 2.0 * (x * y + w * z)
+    m[..., 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    m[..., 1, 2] = 2.0 * (y * z - w * x)
+    m[..., 2, 0] = 2.0 * (x * z - w * y)
+    m[..., 2, 1] = 2.0 * (y * z + w * x)
+    m[..., 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    if scales is not None:
+        m[..., :3, :3] *= np.asarray(scales, dtype=np.float64)[..., None, :]
+    m[..., :3, 3] = locations
+    m[..., 3, 3] = 1.0
+    return m
+
+
+def rotation_of(m):
+    """Rotation part of (..., 3, 3) or (..., 4, 4) matrices as w x y z
+    quaternions with w >= 0, like Matrix.decompose() / to_quaternion():
+    scale (and a mirroring sign) is divided out of the columns first."""
+    m = np.asarray(m, dtype=np.float64)[..., :3, :3]
+    size = np.linalg.norm(m, axis=-2, keepdims=True)
+    r = m / np.where(size > 0.0, size, 1.0)
+    r = np.where((np.linalg.det(r) < 0.0)[..., None, None], -r, r)
+
+    m00, m01, m02 = r[..., 0, 0], r[..., 0, 1], r[..., 0, 2]
+    m10, m11, m12 = r[..., 1, 0], r[..., 1, 1], r[..., 1, 2]
+    m20, m21, m22 = r[..., 2, 0], r[..., 2, 1], r[..., 2, 2]
+    trace = m00 + m11 + m22
+
+    # Shepperd: build the quaternion from its largest component
+    candidates = np.stack((
+        np.stack((1.0 + trace, m21 - m12, m02 - m20, m10 - m01), axis=-1),
+        np.stack((m21 - m12, 1.0 + m00 - m11 - m22, m01 + m10, m02 + m20), axis=-1),
+        np.stack((m02 - m20, m01 + m10, 1.0 - m00 + m11 - m22, m12 + m21), axis=-1),
+        np.stack((m10 - m01, m02 + m20, m12 + m21, 1.0 - m00 - m11 + m22), axis=-1),
+    ), axis=-2)
+    case = np.argmax(np.stack((trace, m00, m11, m22), axis=-1), axis=-1)
+    q = np.take_along_axis(candidates, case[..., None, None], axis=-2)[..., 0, :]
+    q /= np.linalg.norm(q, axis=-1, keepdims=True)
+    return np.where(q[..., :1] < 0.0, -q, q)
+
+
+def decompose(m):
+    """(..., 3) locations and (..., 4) w x y z rotations of (..., 4, 4)
+    matrices (see rotation_of)."""
+    m = np.asarray(m, dtype=np.float64)
+    return m[..., :3, 3].copy(), rotation_of(m)
@@ -1,4108 +1,169 @@
+import glob
+import os
 from ctypes import c_int
 
 # Lookup table for our hashin'
 # These values must be datamined,
 # I've included known values for the new PS2 stuff in NOLF 1.
-HASH_LOOKUP = {
-    "pieces" : [
-    # piece names
-        # baron_formal (verified vs PS2 hashes, magic=9)
-        "torso3_3",
-        "left_leg2",
-        "left_leg8",
-        "HandLeft_zTex1",
-        "HandRight_zTex1",
-        "Head_zTex1",
-        "head_zTex1_1",
-        "torso",
-        "torso2",
-        "stitch69",
-        "stitch70",
-        "stitch73",
-        "364",
-        "_dial",
-        "_zN_Eyelid",
-        "_zN_HitBodyLF",
-        "_zN_HitBodyLR",
-        "_zN_HitBodyRF",
-        "_zN_HitBodyRR",
-        "_zN_HitTail4",
-        "_zN_HitTailRotor",
-        "_zN_LowerBody",
-        "_zN_Skeleton",
-        "_zN_Skeleton_1",
-        "_zN_Skeleton_1_1",
-        "_zN_WingLeft",
-        "1_1",
-        "1_2",
-        "1_3",
-        "10_1",
-        "10_2",
-        "10_3",
-        "11_1",
-        "11_2",
-        "11_3",
-        "12_1",
-        "12_2",
-        "12_3",
-        "14_point1",
-        "14_point2",
-        "2_1",
-        "2_2",
-        "2_3",
-        "3_1",
-        "3_2",
-        "3_3",
-        "4_1",
-        "4_2",
-        "4_3",
-        "5_1",
-        "5_2",
-        "5_3",
-        "6_1",
-        "6_2",
-        "6_3",
-        "7_1",
-        "7_2",
-        "7_3",
-        "8_1",
-        "8_2",
-        "8_3",
-        "9_1",
-        "9_2",
-        "9_3",
-        "armL",
-        "armL_1",
-        "ashtray",
-        "Back",
-        "backbox",
-        "backsight2",
-        "backsight4",
-        "backtip",
-        "band1",
-        "band2",
-        "bar",
-        "bar3",
-        "barrel",
-        "barrelback",
-        "barretmain",
-        "barretmain2",
-        "barretsticker",
-        "barretsticker2",
-        "barretsticker3",
-        "barretsticker4",
-        "barretsticker5",
-        "Base",
-        "base1",
-        "base2",
-        "base3",
-        "baseskel",
-        "baseskel_1",
-        "baseskel_1_1",
-        "baseskel_2",
-        "baseskel_3",
-        "baseskel_5",
-        "baseskel_6",
-        "bmerge1",
-        "bmerge10",
-        "bmerge11",
-        "bmerge2",
-        "bmerge3",
-        "bmerge3_1_2",
-        "bmerge9",
-        "board",
-        "body",
-        "Body",
-        "body1",
-        "body2",
-        "bolt",
-        "bool1",
-        "bool1_1_2",
-        "bool1_2",
-        "Bottle",
-        "bottom",
-        "bottombody",
-        "brace",
-        "brace3_2",
-        "brackets",
-        "brackets2",
-        "brake",
-        "Brnchs_1",
-        "Brnchs_1_1",
-        "Brnchs_2",
-        "Brnchs_3",
-        "Brnchs_4",
-        "Brnchs_4_1",
-        "Brnchs_5",
-        "Brnchs_5_2",
-        "bucklebutton",
-        "bucklebutton_1",
-        "bucklelatch",
-        "bucklelatch1",
-        "bucklelatch1_1",
-        "bucklemain",
-        "bucklemain_1",
-        "butt",
-        "button",
-        "cable",
-        "cable1",
-        "CaphandleJnt",
-        "case",
-        "center",
-        "Center",
-        "chunks",
-        "cigar",
-        "clip",
-        "clip3",
-        "clutch",
-        "clutch1",
-        "cone1",
-        "cone1_1",
-        "cone1_2",
-        "cone10",
-        "cone11",
-        "cone12",
-        "cone13",
-        "cone14",
-        "cone15",
-        "cone16",
-        "cone17",
-        "cone2",
-        "cone3",
-        "cone4",
-        "cone5",
-        "cone8",
-        "cone9",
-        "console",
-        "cork",
-        "cube1",
-        "cube1_1",
-        "cube1_1_1",
-        "cube1_1_2",
-        "cube1_1_2_1",
-        "cube1_10",
-        "cube1_11",
-        "cube1_12",
-        "cube1_13",
-        "cube1_14",
-        "cube1_15",
-        "cube1_16",
-        "cube1_2",
-        "cube1_2_1",
-        "cube1_2_2",
-        "cube1_3",
-        "cube1_4",
-        "cube1_5",
-        "cube1_6",
-        "cube1_7",
-        "cube1_8",
-        "cube1_9",
-        "cube1_zTex1",
-        "cube10",
-        "cube10_1",
-        "cube10_1_2",
-        "cube10_2",
-        "cube11",
-        "cube12",
-        "cube12_1",
-        "cube12_2",
-        "cube13",
-        "cube13_1",
-        "cube13_1_1",
-        "cube13_2",
-        "cube13_3",
-        "cube13_5",
-        "cube13_zTex1",
-        "cube14",
-        "cube14_zTex1",
-        "cube15",
-        "cube15_1_zTex1",
-        "cube15_1_zTex2",
-        "cube15_zTex1",
-        "cube16",
-        "cube16_zTex1",
-        "cube16_zTex2",
-        "cube17",
-        "cube17_zTex1",
-        "cube17_zTex2",
-        "cube18",
-        "cube18_zTex1",
-        "cube19",
-        "cube19_1",
-        "cube19_2",
-        "cube2",
-        "cube2_1",
-        "cube2_1_2",
-        "cube2_2",
-        "cube2_4_1",
-        "cube2_zTex1",
-        "cube20",
-        "cube21",
-        "cube21_zTex2",
-        "cube21_zTex3",
-        "cube21_zTex4",
-        "cube21_zTex5",
-        "cube21_zTex6",
-        "cube21_zTex7",
-        "cube22",
-        "cube22_1",
-        "cube23",
-        "cube23_1",
-        "cube23_zTex1",
-        "cube24",
-        "cube25",
-        "cube26",
-        "cube26_zTex1",
-        "cube27",
-        "cube28",
-        "cube29",
-        "cube3",
-        "cube3_1",
-        "cube3_2",
-        "cube3_3",
-        "cube3_4",
-        "cube3_4_1",
-        "cube30",
-        "cube31",
-        "cube31_zTex1",
-        "cube32",
-        "cube33",
-        "cube33_1",
-        "cube33_2",
-        "cube34",
-        "cube35",
-        "cube36",
-        "cube37",
-        "cube38",
-        "cube39",
-        "cube39_1",
-        "cube4",
-        "cube4_1",
-        "cube4_2",
-        "cube4_2_1",
-        "cube40",
-        "cube41",
-        "cube42",
-        "cube43",
-        "cube44",
-        "cube45",
-        "cube46",
-        "cube47",
-        "cube48",
-        "cube49",
-        "cube5",
-        "cube5_1",
-        "cube50",
-        "cube51",
-        "cube52",
-        "cube53",
-        "cube54",
-        "cube55",
-        "cube56",
-        "cube57",
-        "cube58",
-        "cube59",
-        "cube6",
-        "cube6_1",
-        "cube6_2",
-        "cube6_3",
-        "cube6_4",
-        "cube6_4_1",
-        "cube6_zTex1",
-        "cube60",
-        "cube61",
-        "cube62",
-        "cube7",
-        "cube7_1",
-        "cube7_10",
-        "cube7_2",
-        "cube7_3",
-        "cube7_4",
-        "cube7_5",
-        "cube7_7",
-        "cube7_8",
-        "cube7_9",
-        "cube7_zTex1",
-        "cube8",
-        "cube8_1",
-        "cube8_2",
-        "cube9",
-        "cube9_1_2",
-        "cyl1",
-        "cyl1_1",
-        "cyl1_2",
-        "cyl1_3",
-        "cyl1_4",
-        "cyl1_4_1",
-        "cyl1_zTex1",
-        "cyl10",
-        "cyl10_1",
-        "cyl10_1_2",
-        "cyl10_zTex1",
-        "cyl101",
-        "cyl102",
-        "cyl104",
-        "cyl105",
-        "cyl106",
-        "cyl11",
-        "cyl11_1",
-        "cyl11_zTex1",
-        "cyl12",
-        "cyl121",
-        "cyl122",
-        "cyl123",
-        "cyl124",
-        "cyl125",
-        "cyl126",
-        "cyl127",
-        "cyl128",
-        "cyl129",
-        "cyl129_1",
-        "cyl13",
-        "cyl13_1",
-        "cyl130",
-        "cyl130_1",
-        "cyl131",
-        "cyl132",
-        "cyl134",
-        "cyl134_1",
-        "cyl135",
-        "cyl137",
-        "cyl138",
-        "cyl14",
-        "cyl14_1",
-        "cyl14_1_1",
-        "cyl14_1_2",
-        "cyl14_1_3",
-        "cyl14_11",
-        "cyl14_13",
-        "cyl14_2",
-        "cyl14_3",
-        "cyl14_4",
-        "cyl14_5",
-        "cyl14_6",
-        "cyl140",
-        "cyl141",
-        "cyl142",
-        "cyl143",
-        "cyl15",
-        "cyl15_1",
-        "cyl16",
-        "cyl16_1",
-        "cyl17",
-        "cyl18",
-        "cyl18_1",
-        "cyl18_2",
-        "cyl18_2_1",
-        "cyl19",
-        "cyl19_2",
-        "cyl2",
-        "cyl2_1",
-        "cyl2_1_2_1",
-        "cyl2_1_zTex1",
-        "cyl2_2",
-        "cyl2_2_1",
-        "cyl2_zTex1",
-        "cyl2_zTex1_1",
-        "cyl20",
-        "cyl20_1_1",
-        "cyl21",
-        "cyl22",
-        "cyl23",
-        "cyl24",
-        "cyl24_2",
-        "cyl25",
-        "cyl26",
-        "cyl26_2",
-        "cyl27",
-        "cyl27_2",
-        "cyl28",
-        "cyl29",
-        "cyl3",
-        "cyl3_1",
-        "cyl3_1_2",
-        "cyl3_10",
-        "cyl3_11",
-        "cyl3_12",
-        "cyl3_13",
-        "cyl3_14",
-        "cyl3_15",
-        "cyl3_16",
-        "cyl3_17",
-        "cyl3_18",
-        "cyl3_2",
-        "cyl3_3",
-        "cyl3_4",
-        "cyl3_5",
-        "cyl3_6",
-        "cyl3_7",
-        "cyl3_8",
-        "cyl3_9",
-        "cyl3_zTex1",
-        "cyl3_zTex2",
-        "cyl30",
-        "cyl31",
-        "cyl315",
-        "cyl32",
-        "cyl33",
-        "cyl34",
-        "cyl4",
-        "cyl4_1",
-        "cyl4_1_zTex2",
-        "cyl4_2",
-        "cyl4_3",
-        "cyl4_4_1",
-        "cyl4_zTex1",
-        "cyl4_zTex1_1",
-        "cyl5",
-        "cyl5_1",
-        "cyl5_2_1",
-        "cyl6",
-        "cyl6_1",
-        "cyl6_4_1",
-        "cyl6_zTex1",
-        "cyl7",
-        "cyl7_1_2",
-        "cyl7_2_1",
-        "cyl8",
-        "cyl8_2_1",
-        "cyl8_5",
-        "cyl8_zTex1",
-        "cyl84",
-        "cyl86",
-        "cyl87",
-        "cyl9",
-        "cyl9_1",
-        "cyl9_2",
-        "cyl90",
-        "cyl91",
-        "cyl92",
-        "cyl93",
-        "cyl95",
-        "cyl97",
-        "d_drawstringer1",
-        "d_eighter1",
-        "d_topstringer_2",
-        "d_topstringer_4",
-        "dadnull",
-        "dail",
-        "dail2",
-        "Dec1",
-        "Dec10",
-        "Dec11",
-        "Dec12",
-        "Dec13",
-        "Dec14",
-        "Dec15",
-        "Dec16",
-        "Dec17",
-        "Dec18",
-        "Dec19",
-        "Dec2",
-        "Dec20",
-        "Dec21",
-        "Dec22",
-        "Dec23",
-        "Dec24",
-        "Dec25",
-        "Dec26",
-        "Dec3",
-        "Dec4",
-        "Dec5",
-        "Dec6",
-        "Dec7",
-        "Dec8",
-        "Dec9",
-        "Delisle_7",
-        "Delisle_8",
-        "Delisle_barrel2",
-        "Delisle_bolt2",
-        "Delisle_bolthandle2",
-        "Delisle_butt2",
-        "Delisle_butt3",
-        "Delisle_magazine2",
-        "Delisle_reciever2",
-        "Delisle_recievernut2",
-        "Delisle_trigger2",
-        "Delsile_triggerguard2",
-        "Dial1",
-        "Dial2",
-        "dial2",
-        "Dial3",
-        "dials",
-        "dials1",
-        "dis1",
-        "dis10",
-        "dis11",
-        "dis12",
-        "dis13",
-        "dis2",
-        "dis3",
-        "dis4",
-        "dis5",
-        "dis6",
-        "dis7",
-        "dis8",
-        "dis9",
-        "DoorL",
-        "doorpiece",
-        "DoorR",
-        "Dummy_a",
-        "Dummy_b",
-        "Dummy_c",
-        "Dummy_d",
-        "Dummy_e",
-        "extru1_1",
-        "extru1_2",
-        "extru1_2_1",
-        "extru1_2_2",
-        "extru1_2_2_1",
-        "extru1_21",
-        "extru1_22",
-        "extru10_1_2",
-        "extru10_2_1",
-        "extru11",
-        "extru11_1",
-        "extru11_1_1",
-        "extru11_2_1",
-        "extru12",
-        "extru13_1",
-        "extru13_2_1",
-        "extru14",
-        "extru15",
-        "extru15_2",
-        "extru15_2_1",
-        "extru16",
-        "extru16_2_1",
-        "extru17",
-        "extru17_2_1",
-        "extru18",
-        "extru2",
-        "extru2_1",
-        "extru2_2_1",
-        "extru20",
-        "extru21",
-        "extru23",
-        "extru3",
-        "extru3_1",
-        "extru3_2",
-        "extru3_2_1",
-        "extru4",
-        "extru4_1",
-        "extru4_2",
-        "extru5",
-        "extru5_1_2",
-        "extru5_2",
-        "extru5_2_1",
-        "extru6",
-        "extru6_1_1",
-        "extru7_2",
-        "extru7_2_1",
-        "extru8_2",
-        "extru8_2_1",
-        "extru9",
-        "extru9_1_2",
-        "extru9_2",
-        "extru9_2_1",
-        "eyebrowL",
-        "eyebrowR",
-        "Eyelid",
-        "eyewear_zTex1",
-        "face2",
-        "face2_1",
-        "face2_2",
-        "face2_3",
-        "face3",
-        "face3_1",
-        "face3_2",
-        "face3_3",
-        "face4",
-        "face4_1",
-        "face4_2",
-        "face4_3",
-        "face5",
-        "face5_1",
-        "face5_2",
-        "face5_3",
-        "fedora",
-        "fender",
-        "flipperL",
-        "flipperR",
-        "Fly1Null",
-        "forearm",
-        "forearm_1",
-        "forearmL",
-        "forearmR",
-        "forearmR_1",
-        "fork",
-        "fork1",
-        "frame",
-        "Front",
-        "frontbarrel2",
-        "frontdial",
-        "Fucker",
-        "Gadget",
-        "gas",
-        "GasTank",
-        "glasses2",
-        "globe1_1",
-        "grip",
-        "grip1",
-        "grip2",
-        "grip7",
-        "grip8",
-        "handle",
-        "Handle",
-        "handlebar",
-        "handlebar1",
-        "Hardhat",
-        "hat",
-        "Hat",
-        "hat1",
-        "head",
-        "Head",
-        "Head_4",
-        "Head_node",
-        "Head_zTex3",
-        "headlight",
-        "Heli_01a",
-        "Heli_01b",
-        "Heli_01c",
-        "Heli_02a",
-        "Heli_02b",
-        "Heli_02c",
-        "Heli_02d",
-        "heli_02e",
-        "HitNose_zTex1",
-        "HitTail1",
-        "HitTail2",
-        "HitTail3",
-        "horse",
-        "icosa1",
-        "innards",
-        "jaw",
-        "jnt1_1",
-        "jnt1_1_tail",
-        "jnt1_2",
-        "jnt1_2_tail",
-        "jnt1_3",
-        "jnt1_3_tail",
-        "jnt1_4_tail",
-        "jnt1_5_tail",
-        "jnt1_6_tail",
-        "jnt10_1",
-        "jnt10_2",
-        "jnt10_3",
-        "jnt13_1",
-        "jnt16_1",
-        "jnt16_2",
-        "jnt16_3",
-        "jnt17_1",
-        "jnt2_1",
-        "jnt24_1",
-        "jnt24_2",
-        "jnt25_1",
-        "jnt25_2",
-        "jnt3_1",
-        "jnt3_2",
-        "jnt32_1",
-        "jnt32_2",
-        "jnt33_1",
-        "jnt33_2",
-        "jnt34_1",
-        "jnt34_3",
-        "jnt4_1",
-        "jnt4_2",
-        "jnt5_1",
-        "jnt5_1_head",
-        "jnt52_1",
-        "jnt53_1",
-        "jnt53_2",
-        "jnt53_3",
-        "jnt53_4",
-        "jnt53_5",
-        "jnt53_6",
-        "jnt53_7",
-        "jnt53_8",
-        "jnt53_9",
-        "jnt54_1",
-        "jnt54_2",
-        "jnt54_3",
-        "jnt55_1",
-        "jnt55_2",
-        "jnt55_3",
-        "jnt55_4",
-        "jnt55_5",
-        "jnt55_6",
-        "jnt55_7",
-        "jnt55_8",
-        "jnt55_9",
-        "jnt59_1",
-        "jnt6_1",
-        "jnt6_1_body",
-        "jnt6_2_body",
-        "jnt60_1",
-        "jnt63_1",
-        "jnt64_1",
-        "jnt69_1",
-        "jnt69_1_1",
-        "jnt69_2",
-        "jnt69_2_1",
-        "jnt7_1",
-        "jnt7_1_larm",
-        "jnt7_2_larm",
-        "jnt7_3_larm",
-        "jnt71_1",
-        "jnt71_2",
-        "jnt73_1",
-        "jnt73_2",
-        "jnt8_1",
-        "jnt8_1_rarm",
-        "jnt8_2_rarm",
-        "jnt8_3_rarm",
-        "joint1",
-        "joint2",
-        "keys1",
-        "keys2",
-        "knob",
-        "knob1",
-        "laser",
-        "lasermount",
-        "latchwork2",
-        "ledger5",
-        "Left_arml_hand_node",
-        "Left_arml_node",
-        "Left_armu_node",
-        "Left_armu_shoulder_node",
-        "Left_legl_foot_node",
-        "Left_legl_node",
-        "Left_legu_node",
-        "Left_legu_pelvis_node",
-        "LeftBack1_4",
-        "LeftBack1_5",
-        "LeftBack2_4",
-        "LeftBack2_5",
-        "leftear",
-        "leftendeff",
-        "leftendeff_1",
-        "leftendeff_1_1",
-        "leftendeff_2",
-        "leftendeff_3",
-        "leftendeff_5",
-        "leftendeff_6",
-        "LeftForeArm",
-        "LeftFront1_4",
-        "LeftFront1_5",
-        "LeftFront2_4",
-        "LeftFront2_5",
-        "LeftHand",
-        "LeftHandBase1",
-        "LeftHip1_4",
-        "LeftHip2_4",
-        "LeftHoof1_4",
-        "LeftHoof1_5",
-        "LeftHoof2_4",
-        "LeftHoof2_5",
-        "Leftjoint25",
-        "Leftjoint26",
-        "Leftjoint27",
-        "Leftjoint28",
-        "LeftMiddle3",
-        "LeftMiddle4",
-        "LeftMiddleBase1",
-        "LeftMiddleTip1",
-        "LeftPinky3",
-        "LeftPinky4",
-        "LeftPinkyBase3",
-        "LeftPinkyBase4",
-        "LeftPinkyBase5",
-        "LeftPointer3",
-        "LeftPointer4",
-        "LeftPointerBase1",
-        "LeftPointerTip1",
-        "LeftRing3",
-        "LeftRing4",
-        "LeftRingBase1",
-        "LeftRingBase2",
-        "LeftShoulder1_4",
-        "LeftShoulder2_4",
-        "LeftThumb2",
-        "LeftThumbBase1",
-        "LeftThumbBase2",
-        "LeftToolJnt",
-        "LeftWristBase1",
-        "legballs1",
-        "lens",
-        "lensin",
-        "lensout",
-        "lgfan",
-        "lglaser",
-        "lgmain_1",
-        "lgmain_1_1",
-        "lgmain_1_2",
-        "lgmain_1_3",
-        "light",
-        "linjt",
-        "linjt_1",
-        "linjt_1_1",
-        "linjt_2",
-        "linjt_3",
-        "linjt_5",
-        "linjt_6",
-        "linnnereff_1_1",
-        "linnnereff_3",
-        "linnnereff_5",
-        "linnnereff_6",
-        "lowerbarrel",
-        "LowerJaw",
-        "lowpiece",
-        "lsbase1",
-        "lsbase2",
-        "lsbottom",
-        "lscore",
-        "lsmiddle",
-        "lstop",
-        "lstop1",
-        "LwristVolY",
-        "LwristVolY_1",
-        "MagScale999",
-        "MagScale999_1",
-        "main",
-        "MainBody",
-        "Mentor_action_null2",
-        "mesh2_zTex1",
-        "meter",
-        "meter1",
-        "middle1",
-        "middle2",
-        "middle3",
-        "middle4",
-        "middle5",
-        "middle6",
-        "middle7",
-        "middle8",
-        "middleL1",
-        "middleL1_1",
-        "middleL2",
-        "middleL2_1",
-        "middleL3",
-        "middleL3_1",
-        "middleL4",
-        "middleL4_1",
-        "middleR1",
-        "middleR1_1",
-        "middleR10",
-        "middleR11",
-        "middleR12",
-        "middleR2",
-        "middleR2_1",
-        "middleR3",
-        "middleR3_1",
-        "middleR4",
-        "middleR4_1",
-        "middleR9",
-        "mount",
-        "muzzlenode",
-        "neck",
-        "Neck",
-        "Neck_node",
-        "Neck1_4",
-        "Neck2_4",
-        "Neck3_4",
-        "NibJnt",
-        "nose",
-        "nozzle_1",
-        "nozzle_1_1",
-        "nozzle_1_1_1",
-        "null",
-        "null_1",
-        "null_2",
-        "null_3",
-        "null_a",
-        "null_b",
-        "null_c",
-        "null_d",
-        "null_e",
-        "null_Parent",
-        "null_Parent_1",
-        "null1",
-        "null1_1",
-        "null1_1_1",
-        "null1_1_1_3_1",
-        "null1_1_1_3_1_1",
-        "null1_1_2",
-        "null1_1_2_2",
-        "null1_2",
-        "null1_2_1",
-        "null1_2_2",
-        "null1_3",
-        "null1_3_1",
-        "null1_3_1_1_1",
-        "null1_5_1_1",
-        "null1_a",
-        "null10",
-        "null11",
-        "null15",
-        "null16",
-        "null19",
-        "null2",
-        "null2_1",
-        "null2_2",
-        "null2_3",
-        "null20",
-        "null21",
-        "null22",
-        "null23",
-        "null24",
-        "null25",
-        "null26",
-        "null27",
-        "null28",
-        "null29",
-        "null3",
-        "null3_1",
-        "null3_1_1",
-        "null3_2",
-        "null30",
-        "null31",
-        "null32",
-        "null37",
-        "null38",
-        "null39",
-        "null4",
-        "null4_1",
-        "null5",
-        "null5_2_1_3_1_1_1_1",
-        "null6",
-        "null7",
-        "null79",
-        "null80",
-        "null9",
-        "nulla",
-        "nullb",
-        "nullc",
-        "nulld",
-        "nulle",
-        "outerljt",
-        "outerljt_1",
-        "outerljt_1_1",
-        "outerljt_2",
-        "outerljt_3",
-        "outerljt_5",
-        "outerljt_6",
-        "outerrtjt",
-        "outerrtjt_1",
-        "outerrtjt_1_1",
-        "outerrtjt_2",
-        "outerrtjt_3",
-        "outerrtjt_5",
-        "outerrtjt_6",
-        "paper",
-        "paperball2.",
-        "parent",
-        "parentnull",
-        "PenJnt",
-        "pinky1",
-        "pinky2",
-        "pinky3",
-        "pinky4",
-        "pinky5",
-        "pinky6",
-        "pinky7",
-        "pinky8",
-        "pinkyL1",
-        "pinkyL1_1",
-        "pinkyL2",
-        "pinkyL2_1",
-        "pinkyL3",
-        "pinkyL3_1",
-        "pinkyL4",
-        "pinkyL4_1",
-        "pinkyR1",
-        "pinkyR1_1",
-        "pinkyR10",
-        "pinkyR11",
-        "pinkyR12",
-        "pinkyR2",
-        "pinkyR2_1",
-        "pinkyR3",
-        "pinkyR3_1",
-        "pinkyR4",
-        "pinkyR4_1",
-        "pinkyR9",
-        "plaque",
-        "Plot_null",
-        "Plot_null_1",
-        "Plot_null_1_1",
-        "Plot_null_2",
-        "Plot_null_3",
-        "plug",
-        "plug1",
-        "pointer1",
-        "pointer2",
-        "pointer3",
-        "pointer4",
-        "pointer5",
-        "pointer6",
-        "pointer7",
-        "pointer8",
-        "pointerL1",
-        "pointerL1_1",
-        "pointerL2",
-        "pointerL2_1",
-        "pointerL3",
-        "pointerL3_1",
-        "PointerL4",
-        "PointerL4_1",
-        "pointerR1",
-        "pointerR1_1",
-        "pointerR2",
-        "pointerR2_1",
-        "pointerR3",
-        "pointerR3_1",
-        "PointerR4",
-        "PointerR4_1",
-        "PointerR6",
-        "pointerR7",
-        "pointerR8",
-        "pointerR9",
-        "poppy",
-        "post",
-        "prop",
-        "prop1",
-        "pump",
-        "push",
-        "radiator",
-        "Rear",
-        "red_hair",
-        "rendeff",
-        "rendeff_1",
-        "rendeff_1_1",
-        "rendeff_2",
-        "rendeff_3",
-        "rendeff_5",
-        "rendeff_6",
-        "revol1",
-        "revol2_1_1",
-        "right_arml_hand_node",
-        "Right_arml_node",
-        "Right_armu_node",
-        "Right_armu_shoulder_node",
-        "Right_leg4_2",
-        "Right_legl_foot_node",
-        "Right_legl_node",
-        "Right_Legu_node",
-        "Right_legu_pelvis_node",
-        "rightear_1",
-        "RightForearm",
-        "RightHand",
-        "RightToolJoint",
-        "ring1",
-        "ring2",
-        "ring3",
-        "ring4",
-        "ring5",
-        "ring6",
-        "ring7",
-        "ring8",
-        "ringL1",
-        "ringL1_1",
-        "ringL2",
-        "ringL2_1",
-        "ringL3",
-        "ringL3_1",
-        "ringL4",
-        "ringL4_1",
-        "ringR1",
-        "ringR1_1",
-        "ringR10",
-        "ringR11",
-        "ringR12",
-        "ringR2",
-        "ringR2_1",
-        "ringR3",
-        "ringR3_1",
-        "ringR4",
-        "ringR4_1",
-        "ringR9",
-        "rinnereff",
-        "rinnereff_1_1",
-        "rinnereff_3",
-        "rinnereff_6",
-        "Root",
-        "rotor",
-        "RTHandBase",
-        "rtinjt",
-        "rtinjt_1",
-        "rtinjt_1_1",
-        "rtinjt_2",
-        "rtinjt_3",
-        "rtinjt_5",
-        "rtinjt_6",
-        "RTjoint12",
-        "RTjoint16",
-        "RTjoint20",
-        "RTjoint24",
-        "RTMiddle1",
-        "RTMiddle2",
-        "RTMiddleBase",
-        "RTMiddleTip",
-        "RTPinky1",
-        "RTPinky2",
-        "RTPinkyBase",
-        "RTPinkytip",
-        "RTPointer1",
-        "RTPointer2",
-        "RTPointerBase",
-        "RTPointerTip",
-        "RTRing1",
-        "RTRing2",
-        "RTRingBase",
-        "RTRingTip",
-        "RTThumb1",
-        "RTThumb2",
-        "RTThumbBase",
-        "RTThumbTip",
-        "RTWristBase",
-        "RwristVolY",
-        "RwristVolY_1",
-        "RwristVolY2",
-        "scope",
-        "scottcoin",
-        "Seat",
-        "shell",
-        "shield",
-        "sidedial",
-        "sight",
-        "sights",
-        "Silencer",
-        "SilencerNull",
-        "slide",
-        "smallsprite",
-        "smg",
-        "socketNode",
-        "spark",
-        "spear2",
-        "speargunmain",
-        "speargunmain_1",
-        "speargunmain_2",
-        "speargunmain1",
-        "sphere1",
-        "sphere1_1",
-        "sphere1_2",
-        "sphere11",
-        "sphere11_1",
-        "sphere11_2",
-        "sphere11_3",
-        "sphere11_4",
-        "sphere12",
-        "sphere13",
-        "sphere14",
-        "sphere15",
-        "sphere2",
-        "sphere2_1",
-        "sphere3",
-        "sphere4",
-        "sphere5",
-        "sphere6",
-        "sphere7",
-        "sphere7_1",
-        "sphere7_zTex1",
-        "sphere8",
-        "sphere9",
-        "spine1",
-        "Spine1_4",
-        "spine2",
-        "Spine2_4",
-        "spine3",
-        "Spine3_4",
-        "spine4",
-        "spoon",
-        "spoon_1",
-        "stemL",
-        "stemR",
-        "Stitch12",
-        "Stitch12_1",
-        "Stitch12_1_1",
-        "Stitch13",
-        "Stitch15",
-        "Stitch16",
-        "Stitch17",
-        "Stitch51",
-        "sunglasseslow",
-        "sunglasseslow_1",
-        "sword",
-        "tail",
-        "tail1",
-        "taillow1",
-        "taillow2",
-        "tailtop1",
-        "tailtop2",
-        "tank_1",
-        "tank_1_3",
-        "tassle",
-        "tetra1",
-        "tetra2",
-        "tetra3",
-        "throttle",
-        "throttle1",
-        "thumb1",
-        "thumb2",
-        "thumb3",
-        "thumbL1",
-        "thumbL1_1",
-        "thumbL2",
-        "thumbL2_1",
-        "thumbL3",
-        "thumbL3_1",
-        "thumbR1",
-        "thumbR1_1",
-        "thumbR2",
-        "thumbR2_1",
-        "thumbR3",
-        "thumbR3_1",
-        "tinysprite",
-        "top",
-        "top_1",
-        "top_1_2",
-        "top_1_2_1",
-        "top2",
-        "topbody",
-        "topcube",
-        "topdial",
-        "topflatcube",
-        "topnull",
-        "torso_1_1_1_2_1_1",
-        "torso_4",
-        "torso_5",
-        "torso_6",
-        "Torso_node",
-        "Torso_u_node",
-        "torso3_2",
-        "torso4",
-        "torus1",
-        "torus10",
-        "torus11",
-        "torus2",
-        "torus26",
-        "torus28",
-        "torus29",
-        "torus3",
-        "torus3_1",
-        "torus30",
-        "torus4",
-        "trigpiece",
-        "trigrig",
-        "Trunk_zTex1",
-        "Trunk_zTex3",
-        "tube",
-        "tube_1",
-        "tube_2",
-        "tube_2_1",
-        "upperhandle",
-        "vasefragments",
-        "vial",
-        "vial_1",
-        "Viewer",
-        "wheels2",
-        "Wing_Left_B",
-        "Wing_Left_T",
-        "Wing_Right_B",
-        "Wing_Right_T",
-        "wing2_4",
-        "wing2_9",
-        "wing4",
-        "wing7",
-        "WingRight_zN",
-        "wmellonfrag2",
-        "wrist",
-        "wristL",
-        "wristL_1",
-        "wristR",
-        "wristR_1",
-        "zN_LowerBody",
-        "zN_Skeleton",
-        "14_point1",
-"14_point2",
-"Bottle",
-"Brnchs_1",
-"Brnchs_1_1",
-"Brnchs_2",
-"Brnchs_3",
-"Brnchs_4",
-"Brnchs_4_1",
-"Brnchs_5",
-"Brnchs_5_2",
-"Center",
-"Dec1",
-"Dec11",
-"Dec12",
-"Dec13",
-"Dec14",
-"Dec15",
-"Dec16",
-"Dec17",
-"Dec18",
-"Dec2",
-"Dec20",
-"Dec21",
-"Dec22",
-"Dec23",
-"Dec24",
-"Dec25",
-"Dec26",
-"Dec3",
-"Dec4",
-"Dec5",
-"Dec6",
-"Dec7",
-"Dec8",
-"Dec9",
-"Delisle_7",
-"Delisle_8",
-"Delisle_barrel2",
-"Delisle_bolt2",
-"Delisle_bolthandle2",
-"Delisle_butt2",
-"Delisle_butt3",
-"Delisle_magazine2",
-"Delisle_reciever2",
-"Delisle_recievernut2",
-"Delisle_trigger2",
-"Delsile_triggerguard2",
-"Dial1",
-"Dial1r",
-"Dial2",
-"Dial2r",
-"Dial3",
-"Dial3r",
-"DoorL",
-"DoorR",
-"Dummy_a",
-"Dummy_b",
-"Dummy_c",
-"Dummy_d",
-"Dummy_e",
-"Eyelid",
-"Eyelid4",
-"EyelidL",
-"EyeliduX",
-"F3uAcGZ",
-"F4AB",
-"F4a",
-"F8mB",
-"F9yAK",
-"FA2t",
-"FA7S",
-"FAGZ",
-"FAKK",
-"FATI",
-"FArna",
-"FB6Y",
-"FBJT",
-"FBbB",
-"FBmV3",
-"FBxQ",
-"FFAB",
-"FIRE",
-"FIRE5",
-"FIRE7",
-"FIREA",
-"FIREB",
-"FIREC",
-"FIREJ",
-"FIREL",
-"FIREM",
-"FIREN",
-"FIREP",
-"FIREV",
-"FIREX",
-"FIRE_KEY",
-"FIRE_KEYB",
-"FIRE_KEYC",
-"FIRE_KEYD",
-"FIRE_KEYE",
-"FIRE_KEYF",
-"FIRE_KEYH",
-"FIRE_KEYN",
-"FIRE_KEYS",
-"FIRE_KEYl",
-"FIRE_KEYo",
-"FIRE_KEYv",
-"FIREa",
-"FIREb",
-"FIREd",
-"FIREe",
-"FIREl",
-"FIREm",
-"FIREo",
-"FIREr",
-"FIREx",
-"FIREy",
-"FLLA",
-"FL_HIDEX",
-"FL_ON",
-"FL_SHOW",
-"FL_SHOWd",
-"Fly1Null",
-"Front",
-"Fucker",
-"Gadget",
-"Gadget9d",
-"GadgetGs",
-"GasTank",
-"Handle",
-"Hardhat",
-"HatJnt",
-"HbA7",
-"HdzA",
-"Head",
-"Head_4",
-"Head_node",
-"Head_nodeEb",
-"Head_nodeL",
-"Head_nodeT",
-"Head_nodeu",
-"Head_zTex3",
-"Heli_01a",
-"Heli_01b",
-"Heli_01c",
-"Heli_02a",
-"Heli_02b",
-"Heli_02c",
-"Heli_02d",
-"HitNose_zTex1",
-"HitTail1",
-"HitTail2",
-"HitTail3",
-"HlDL",
-"Hlzm",
-"INVULNERABLE",
-"LeftBack1_4",
-"LeftBack1_5",
-"LeftBack2_4",
-"LeftForeArm",
-"LeftForeArm7R",
-"LeftFront1_4",
-"LeftFront1_5q",
-"LeftFront2_4b",
-"LeftFront2_5",
-"LeftHand",
-"LeftHandBase1",
-"LeftHandBase1r",
-"LeftHip1_40b",
-"LeftHip2_4",
-"LeftHoof1_4",
-"LeftHoof1_5",
-"LeftHoof2_4v",
-"LeftHoof2_5",
-"LeftMiddle3",
-"LeftMiddle3p",
-"LeftMiddle4",
-"LeftMiddle48",
-"LeftMiddleBase1",
-"LeftMiddleTip1",
-"LeftPinky3",
-"LeftPinky4",
-"LeftPinkyBase3",
-"LeftPinkyBase3C",
-"LeftPinkyBase4",
-"LeftPinkyBase5",
-"LeftPinkyBase5Id",
-"LeftPinkyBase5h",
-"LeftPointer3",
-"LeftPointer378",
-"LeftPointer4",
-"LeftPointerBase1",
-"LeftPointerBase176",
-"LeftPointerTip1",
-"LeftRing3",
-"LeftRing4",
-"LeftRingBase1",
-"LeftRingBase2",
-"LeftShoulder2_4",
-"LeftThumb2",
-"LeftThumbBase1",
-"LeftThumbBase1CY",
-"LeftThumbBase1g",
-"LeftThumbBase2",
-"LeftWristBase1",
-"Left_arml_hand_node",
-"Left_arml_hand_node3",
-"Left_arml_hand_node6",
-"Left_arml_hand_nodeEf",
-"Left_arml_hand_nodeH",
-"Left_arml_hand_noded",
-"Left_arml_hand_nodei",
-"Left_arml_hand_nodeiS",
-"Left_arml_hand_nodeq",
-"Left_arml_node",
-"Left_arml_nodeG",
-"Left_arml_nodeIM",
-"Left_arml_nodej",
-"Left_arml_nodek",
-"Left_arml_nodeu",
-"Left_armu_node",
-"Left_armu_node7q",
-"Left_armu_nodeY",
-"Left_armu_nodeg",
-"Left_armu_nodeh",
-"Left_armu_nodeu",
-"Left_armu_shoulder_node",
-"Left_armu_shoulder_nodes",
-"Left_legl_foot_node",
-"Left_legl_foot_node2q",
-"Left_legl_foot_node6",
-"Left_legl_foot_node6x",
-"Left_legl_foot_node7",
-"Left_legl_foot_nodeG",
-"Left_legl_foot_nodeX",
-"Left_legl_foot_noded",
-"Left_legl_foot_nodekE",
-"Left_legl_foot_noden",
-"Left_legl_node",
-"Left_legl_nodeI",
-"Left_legl_nodeP",
-"Left_legl_nodeT",
-"Left_legl_nodec",
-"Left_legl_nodew",
-"Left_legu_node",
-"Left_legu_node6",
-"Left_legu_nodeO",
-"Left_legu_nodeWBw",
-"Left_legu_nodegc",
-"Left_legu_pelvis_node",
-"Left_legu_pelvis_nodea",
-"Left_legu_pelvis_nodet",
-"Leftjoint25",
-"Leftjoint25O",
-"Leftjoint26",
-"Leftjoint27",
-"Leftjoint28",
-"LowerJaw",
-"LowerJaw3",
-"LowerJawBz",
-"LowerJawq",
-"LowerJawu",
-"LowerJawz6",
-"LwristVolY",
-"LwristVolYGU",
-"LwristVolYOXb",
-"LwristVolY_1",
-"LwristVolYb1",
-"LwristVolYd",
-"LwristVolYm",
-"MYA2",
-"MagScale999",
-"MagScale999_1",
-"MainBody",
-"MainBodyr",
-"Mentor_action_null2",
-"NOISE",
-"NOISE1",
-"NOISE5",
-"NOISEL",
-"NOISEW",
-"NOISEm",
-"NOISEq",
-"NOISEx",
-"Neck1_4",
-"Neck2_4",
-"Neck3_4G",
-"NeckO",
-"Neck_node",
-"Neck_nodeHm",
-"Neck_nodeL",
-"Neck_nodeW",
-"Neck_nodei",
-"NoAnimation",
-"NoAnimationM",
-"NoAnimationgO",
-"PICKUP",
-"PUNCH",
-"Plot_null",
-"Plot_null_1",
-"Plot_null_1_1",
-"Plot_null_2",
-"Plot_null_3",
-"PointerL4",
-"PointerL4I",
-"PointerL4N",
-"PointerL4_1MiM",
-"PointerL4f",
-"PointerL4j",
-"PointerL4p",
-"PointerR4",
-"PointerR4A",
-"PointerR4B",
-"PointerR4O",
-"PointerR4P",
-"PointerR4_",
-"PointerR4_1",
-"PointerR4b",
-"PointerR4g",
-"PointerR4p",
-"PointerR6",
-"RTHandBase1_",
-"RTHandBasex",
-"RTMiddle1",
-"RTMiddle1fk",
-"RTMiddle2",
-"RTMiddle2vk",
-"RTMiddleBase",
-"RTMiddleBase9d",
-"RTMiddleBasefk",
-"RTMiddleTip",
-"RTMiddleTipfk",
-"RTPinky1",
-"RTPinky1l",
-"RTPinky2",
-"RTPinkyBase",
-"RTPinkytip",
-"RTPointer1",
-"RTPointer1If",
-"RTPointer2",
-"RTPointer2oG",
-"RTPointerBase",
-"RTPointerTip",
-"RTRing1",
-"RTRing19",
-"RTRing2",
-"RTRingBase",
-"RTRingBase9",
-"RTRingTip",
-"RTThumb1",
-"RTThumb14",
-"RTThumb2",
-"RTThumb29",
-"RTThumbBase",
-"RTThumbTip",
-"RTThumbTipR",
-"RTWristBase",
-"RTWristBase1_",
-"RTjoint12",
-"RTjoint16",
-"RTjoint16fk",
-"RTjoint20",
-"RTjoint24",
-"Rear",
-"RightForearm",
-"RightHand",
-"RightToolJoint",
-"Right_Legu_node",
-"Right_Legu_nodeT",
-"Right_Legu_nodee",
-"Right_Legu_nodemp",
-"Right_Legu_noden",
-"Right_arml_node",
-"Right_arml_node1",
-"Right_arml_node2",
-"Right_arml_node80",
-"Right_arml_nodeh",
-"Right_arml_noden5",
-"Right_armu_node",
-"Right_armu_node3",
-"Right_armu_node4",
-"Right_armu_node6",
-"Right_armu_nodeC",
-"Right_armu_nodeX",
-"Right_armu_nodea",
-"Right_armu_nodeg",
-"Right_armu_nodei",
-"Right_armu_nodem",
-"Right_armu_nodew",
-"Right_armu_shoulder_node",
-"Right_armu_shoulder_node5",
-"Right_armu_shoulder_noden",
-"Right_leg4_2",
-"Right_legl_foot_node",
-"Right_legl_foot_nodeD",
-"Right_legl_foot_nodeRa",
-"Right_legl_foot_nodec",
-"Right_legl_foot_nodee",
-"Right_legl_foot_nodenO",
-"Right_legl_foot_noderM",
-"Right_legl_node",
-"Right_legl_nodeD",
-"Right_legl_nodefM",
-"Right_legu_pelvis_node",
-"Right_legu_pelvis_nodeeVk",
-"Right_legu_pelvis_nodeuVk",
-"RwristVolY",
-"RwristVolY2",
-"RwristVolY2J",
-"RwristVolY6",
-"RwristVolYJ",
-"RwristVolYK",
-"RwristVolYRE",
-"RwristVolY_1A",
-"RwristVolYj",
-"RwristVolYo",
-"RwristVolYq",
-"SWING",
-"Seat",
-"Silencer",
-"SilencerNull",
-"Spine1_4",
-"Spine2_4",
-"Spine3_4",
-"Stitch12",
-"Stitch12_1",
-"Stitch12_1_1",
-"Stitch13",
-"Stitch15",
-"Stitch16",
-"Stitch17",
-"Stitch51",
-"Torso_node",
-"Torso_nodeI",
-"Torso_nodee",
-"Torso_nodev",
-"Torso_u_node",
-"Torso_u_nodeZ",
-"Torso_u_noden",
-"Trunk_zTex1",
-"Trunk_zTex3",
-"VULNERABLE",
-"Viewer",
-"WFHAF",
-"WHISTLE",
-"WingRight_zN",
-"Wing_Left_B",
-"Wing_Left_T",
-"Wing_Right_BO",
-"Wing_Right_TO",
-"_dial",
-"_zN_Eyelid",
-"_zN_HitBodyLF",
-"_zN_HitBodyLR",
-"_zN_HitBodyRF",
-"_zN_HitBodyRR",
-"_zN_HitTail4",
-"_zN_HitTailRotor",
-"_zN_LowerBody",
-"_zN_Skeleton",
-"_zN_Skeleton_1",
-"_zN_Skeleton_1_1",
-"armL",
-"armLG",
-"armLJ",
-"armLXV",
-"armL_1",
-"armL",
-"ashtray",
-"backbox",
-"backsight2",
-"backsight4",
-"backtip",
-"backwings",
-"band1",
-"band2",
-"barrel",
-"barrelback",
-"barretmain",
-"barretmain2",
-"barretsticker",
-"barretsticker2",
-"barretsticker3",
-"barretsticker4",
-"barretsticker5",
-"base1",
-"base2",
-"base3",
-"baseskel",
-"baseskel_1",
-"baseskel_1_1",
-"baseskel_2",
-"baseskel_3",
-"baseskel_5",
-"baseskel_6",
-"beZ",
-"bmerge1",
-"bmerge10",
-"bmerge11",
-"bmerge2",
-"bmerge3Q",
-"bmerge3_1_2",
-"bmerge9",
-"board",
-"body",
-"body1",
-"body2",
-"body_1",
-"bolt",
-"bool1G",
-"bool1_1_2",
-"bottom",
-"bottombody",
-"brace5",
-"brace6",
-"brackets",
-"brackets2",
-"briefcase",
-"bucklebutton_1",
-"bucklelatch",
-"bucklelatch1",
-"bucklelatch1_1",
-"bucklemain_1",
-"butt",
-"button",
-"bwheel",
-"cable",
-"case",
-"chunks",
-"cigar",
-"circleshape",
-"clip3Q",
-"clutch",
-"clutch1",
-"cone1",
-"cone10",
-"cone11",
-"cone12",
-"cone13",
-"cone14",
-"cone15",
-"cone16",
-"cone17",
-"cone1_1",
-"cone1_2",
-"cone1f",
-"cone2",
-"cone3",
-"cone4",
-"cone4V",
-"cone5",
-"cone8",
-"cone9",
-"console",
-"cork",
-"cube1",
-"cube10",
-"cube10_1",
-"cube10_1_2",
-"cube10_2",
-"cube11",
-"cube12",
-"cube12_1",
-"cube12_2",
-"cube13",
-"cube13Q",
-"cube13_1",
-"cube13_1_1",
-"cube13_2",
-"cube13_3",
-"cube13_5",
-"cube13_zTex1",
-"cube14",
-"cube14Q",
-"cube14_zTex1",
-"cube15",
-"cube15Q",
-"cube15_1_zTex1",
-"cube15_1_zTex2",
-"cube15_zTex1",
-"cube15_zTex2",
-"cube16",
-"cube16Q",
-"cube16_zTex1",
-"cube16_zTex2",
-"cube17",
-"cube17Q",
-"cube17_zTex1",
-"cube17_zTex2",
-"cube18",
-"cube18_zTex1",
-"cube19",
-"cube19_1",
-"cube19_2",
-"cube1_1",
-"cube1_10",
-"cube1_11",
-"cube1_12",
-"cube1_13",
-"cube1_14",
-"cube1_15",
-"cube1_16",
-"cube1_1_1",
-"cube1_1_2",
-"cube1_1_2_1",
-"cube1_1_2_1Y",
-"cube1_2",
-"cube1_2BA",
-"cube1_2_1",
-"cube1_2_2",
-"cube1_3",
-"cube1_4",
-"cube1_5",
-"cube1_6",
-"cube1_7",
-"cube1_8",
-"cube1_9",
-"cube1_zTex1",
-"cube2",
-"cube20",
-"cube21",
-"cube21_zTex1",
-"cube21_zTex2",
-"cube21_zTex3",
-"cube21_zTex4",
-"cube21_zTex5",
-"cube21_zTex6",
-"cube21_zTex7",
-"cube22",
-"cube22_1",
-"cube23",
-"cube23_1",
-"cube23_zTex1",
-"cube24",
-"cube25",
-"cube26",
-"cube26_zTex1",
-"cube27",
-"cube28",
-"cube29",
-"cube2_1",
-"cube2_1_2",
-"cube2_2",
-"cube2_4_1",
-"cube2_4_1Y",
-"cube2_zTex1",
-"cube3",
-"cube30",
-"cube31",
-"cube31_zTex1",
-"cube32",
-"cube33",
-"cube33_1",
-"cube33_2",
-"cube34",
-"cube35",
-"cube36",
-"cube37",
-"cube38",
-"cube39",
-"cube39_1",
-"cube3_1",
-"cube3_1R",
-"cube3_2",
-"cube3_3",
-"cube3_4",
-"cube3_4_1",
-"cube3_4_1Y",
-"cube3_5",
-"cube3_6",
-"cube4",
-"cube40",
-"cube41",
-"cube42",
-"cube43",
-"cube44",
-"cube45",
-"cube46",
-"cube466",
-"cube47",
-"cube48",
-"cube49",
-"cube496",
-"cube4_1",
-"cube4_1ca",
-"cube4_2",
-"cube4_2_1Y",
-"cube5",
-"cube50",
-"cube506",
-"cube51",
-"cube516",
-"cube52",
-"cube526",
-"cube53",
-"cube54",
-"cube546",
-"cube55",
-"cube56",
-"cube56t",
-"cube57",
-"cube58",
-"cube59",
-"cube5_1",
-"cube5_2",
-"cube6",
-"cube60",
-"cube61",
-"cube62",
-"cube63",
-"cube65",
-"cube66",
-"cube67",
-"cube68",
-"cube69",
-"cube6_1",
-"cube6_2",
-"cube6_3",
-"cube6_4_1",
-"cube6_4",
-"cube6_zTex1",
-"cube7",
-"cube70",
-"cube73",
-"cube74",
-"cube7_1",
-"cube7_10",
-"cube7_2",
-"cube7_3",
-"cube7_4",
-"cube7_5",
-"cube7_7",
-"cube7_8",
-"cube7_9",
-"cube7_zTex1",
-"cube8",
-"cube8_1",
-"cube8_2",
-"cube9",
-"cube9_1_2",
-"cyl",
-"cyl1",
-"cyl10",
-"cyl101",
-"cyl102",
-"cyl104",
-"cyl105",
-"cyl106",
-"cyl10_1",
-"cyl10_1_2",
-"cyl10_zTex1",
-"cyl11",
-"cyl11_1",
-"cyl11_zTex1",
-"cyl12",
-"cyl121",
-"cyl121Q",
-"cyl122Q",
-"cyl123Q",
-"cyl124Q",
-"cyl125Q",
-"cyl126Q",
-"cyl127Q",
-"cyl128Q",
-"cyl129Q",
-"cyl129_1",
-"cyl129_16",
-"cyl13",
-"cyl130Q",
-"cyl130_1",
-"cyl130_16",
-"cyl131",
-"cyl1316",
-"cyl132",
-"cyl1326",
-"cyl134Q",
-"cyl134_1",
-"cyl134_16",
-"cyl135",
-"cyl137",
-"cyl1376",
-"cyl138",
-"cyl1386",
-"cyl13_1",
-"cyl14",
-"cyl140",
-"cyl1406",
-"cyl141",
-"cyl1416",
-"cyl142",
-"cyl1426",
-"cyl143",
-"cyl14_1",
-"cyl14_11",
-"cyl14_13",
-"cyl14_1_1",
-"cyl14_1_2",
-"cyl14_1_3",
-"cyl14_2",
-"cyl14_3",
-"cyl14_4",
-"cyl14_5",
-"cyl14_6",
-"cyl15",
-"cyl15_1",
-"cyl16",
-"cyl16_1",
-"cyl17",
-"cyl18",
-"cyl183",
-"cyl18_1",
-"cyl18_2",
-"cyl18_2_1",
-"cyl19",
-"cyl19_2",
-"cyl1_1",
-"cyl1_2",
-"cyl1_3",
-"cyl1_4",
-"cyl1_4_1",
-"cyl1_5",
-"cyl1_6",
-"cyl1_zTex1",
-"cyl2",
-"cyl20",
-"cyl20_1_1",
-"cyl21",
-"cyl22",
-"cyl23",
-"cyl23wL",
-"cyl24",
-"cyl24_2",
-"cyl25",
-"cyl26",
-"cyl26_2",
-"cyl27",
-"cyl27_2",
-"cyl28",
-"cyl29",
-"cyl2_1",
-"cyl2_1_2_1",
-"cyl2_1_zTex1",
-"cyl2_2",
-"cyl2_2_1",
-"cyl2_zTex1",
-"cyl2_zTex1_1",
-"cyl3",
-"cyl30",
-"cyl31",
-"cyl315",
-"cyl32",
-"cyl33",
-"cyl34",
-"cyl3_1",
-"cyl3_10",
-"cyl3_11",
-"cyl3_12",
-"cyl3_13",
-"cyl3_14",
-"cyl3_15",
-"cyl3_16",
-"cyl3_17",
-"cyl3_18",
-"cyl3_1_2",
-"cyl3_2",
-"cyl3_3",
-"cyl3_3R",
-"cyl3_4",
-"cyl3_5",
-"cyl3_6",
-"cyl3_7",
-"cyl3_8",
-"cyl3_9",
-"cyl3_zTex1",
-"cyl3_zTex1n",
-"cyl3_zTex2",
-"cyl3n",
-"cyl4",
-"cyl4_1",
-"cyl4_1_zTex2",
-"cyl4_2",
-"cyl4_3",
-"cyl4_4_1Y",
-"cyl4_zTex1",
-"cyl4_zTex1_1",
-"cyl4_zTex2",
-"cyl4f",
-"cyl5",
-"cyl5_1",
-"cyl5_2_1",
-"cyl6",
-"cyl6_1",
-"cyl6_4_1",
-"cyl6_zTex1",
-"cyl7",
-"cyl7_1_2",
-"cyl7_2_1",
-"cyl7_2_1",
-"cyl8",
-"cyl84",
-"cyl86",
-"cyl87",
-"cyl8_2_1",
-"cyl8_2_1",
-"cyl8_zTex1",
-"cyl8n",
-"cyl9",
-"cyl90",
-"cyl91",
-"cyl92",
-"cyl93",
-"cyl95",
-"cyl97",
-"cyl9_1",
-"cyl9_2",
-"d_drawstringer1",
-"d_eighter1",
-"d_topstringer_2",
-"d_topstringer_4",
-"dadnull",
-"dail2CX",
-"dailCX",
-"dial2",
-"dials",
-"dials1",
-"dis1",
-"dis10",
-"dis11",
-"dis12",
-"dis13",
-"dis2",
-"dis3",
-"dis4",
-"dis5",
-"dis6",
-"dis7",
-"dis8",
-"dis9",
-"doorpiece",
-"extru10_1_2",
-"extru10_2_1",
-"extru10_2_1Y",
-"extru11",
-"extru11_1",
-"extru11_1_1",
-"extru11_2_1",
-"extru11_2_1Y",
-"extru12",
-"extru13_1",
-"extru13_2_1",
-"extru14",
-"extru15Q",
-"extru15_2_1",
-"extru16",
-"extru16Q",
-"extru16_2_1",
-"extru17Q",
-"extru17_2_1",
-"extru18Q",
-"extru1_1",
-"extru1_21",
-"extru1_22",
-"extru1_2",
-"extru1_2_14",
-"extru1_2_2",
-"extru1_2_2_1",
-"extru1_2_2_1",
-"extru2",
-"extru20",
-"extru20Q",
-"extru21",
-"extru23",
-"extru2_14I",
-"extru2_2_1",
-"extru2_2_1Y",
-"extru3",
-"extru3_14I",
-"extru3_2_1",
-"extru3_2_1Y",
-"extru4",
-"extru4_1",
-"extru4_2",
-"extru5",
-"extru5_1_2",
-"extru5_2",
-"extru5_2_14I",
-"extru6",
-"extru6_1_1",
-"extru7_2",
-"extru7_2_1Y",
-"extru8_2",
-"extru8_2_1Y",
-"extru9",
-"extru96",
-"extru9_1_2",
-"extru9_2_1Y",
-"eyebrowL",
-"eyebrowR",
-"eyewear_zTex1",
-"face2",
-"face2_1",
-"face2_2",
-"face2_3",
-"face3",
-"face3_1",
-"face3_2",
-"face3_3",
-"face4",
-"face4_1",
-"face4_2",
-"face4_3",
-"face5",
-"face5_1",
-"face5_2",
-"face5_3",
-"fedora",
-"fire_key",
-"flat_debris1",
-"flat_debris2",
-"flat_debris3",
-"flipperL",
-"flower2",
-"forearmE",
-"forearmL",
-"forearmR",
-"forearmRG",
-"forearmRL",
-"forearmR_1S",
-"forearmRh",
-"forearmRn",
-"forearm_1",
-"frame",
-"frontbarrel2",
-"frontdial",
-"glasses2",
-"globe1_1",
-"handle",
-"hat1",
-"hcA9",
-"headg",
-"heli_02",
-"horse",
-"icosa1",
-"innards",
-"jnt10_1",
-"jnt10_16",
-"jnt10_2",
-"jnt13_1",
-"jnt15_1",
-"jnt15_2",
-"jnt15_3",
-"jnt16_39",
-"jnt17_1",
-"jnt17_2",
-"jnt17_3",
-"jnt1_1",
-"jnt1_1_tail",
-"jnt1_2",
-"jnt1_28",
-"jnt1_2Ox",
-"jnt1_2_tail",
-"jnt1_3",
-"jnt1_3_tailG",
-"jnt1_4_tail",
-"jnt1_6_tail",
-"jnt24_2",
-"jnt25_1",
-"jnt2_1",
-"jnt2_1m",
-"jnt2_1q",
-"jnt32_1q9",
-"jnt32_2",
-"jnt33_1",
-"jnt33_2",
-"jnt34_1",
-"jnt34_3",
-"jnt3_1",
-"jnt3_1j",
-"jnt3_2",
-"jnt4_1",
-"jnt52_17",
-"jnt53_1",
-"jnt53_1I",
-"jnt53_2",
-"jnt53_2w",
-"jnt53_4",
-"jnt53_6",
-"jnt53_8",
-"jnt53_9bf",
-"jnt54_2",
-"jnt54_3",
-"jnt55_1",
-"jnt55_2",
-"jnt55_3",
-"jnt55_5",
-"jnt55_6",
-"jnt55_7",
-"jnt55_9",
-"jnt59_1e",
-"jnt5_1",
-"jnt5_1_headx",
-"jnt60_1",
-"jnt63_1",
-"jnt64_1",
-"jnt69_1_19",
-"jnt69_2_1",
-"jnt69_2v8",
-"jnt6_1O",
-"jnt6_1_body",
-"jnt6_2_body",
-"jnt71_1",
-"jnt71_2",
-"jnt73_21a",
-"jnt7_1",
-"jnt7_1_larm",
-"jnt7_2_larm",
-"jnt7_3_larm",
-"jnt8_1",
-"jnt8_1Y",
-"jnt8_1_rarm",
-"jnt8_2_rarm",
-"jnt8_3_rarm",
-"jnt9_1",
-"jnt9_2R",
-"joint1",
-"joint1r",
-"joint2",
-"keys1",
-"keys2",
-"knife_1",
-"knob",
-"knob1",
-"landgear",
-"laser",
-"lasermount",
-"latchwork2",
-"ledger5",
-"leftear",
-"leftendeff",
-"leftendeff_1_1",
-"leftendeff_2",
-"leftendeff_3",
-"leftendeff_5",
-"legballs1",
-"lens",
-"lensin",
-"lensout",
-"lgfan",
-"lglaser",
-"lgmain_1",
-"lgmain_1_1",
-"lgmain_1_2",
-"lgmain_1_3",
-"light",
-"linjt",
-"linjt_2",
-"linjt_3",
-"linjt_5",
-"linjt_6",
-"linnnereff_3",
-"linnnereff_5",
-"linnnereff_6",
-"lnqB",
-"lowerbarrel",
-"lowpiece",
-"lrOe",
-"lsbase1",
-"lsbase2",
-"lsbottomlvl",
-"lscorelvl",
-"lsmiddlelvl",
-"lstop1",
-"main",
-"mesh2_zTex1",
-"middle1",
-"middle2",
-"middle3k",
-"middle4",
-"middle5",
-"middle6",
-"middle7r",
-"middle8",
-"middleL1",
-"middleL14",
-"middleL1L",
-"middleL1_1o",
-"middleL1a",
-"middleL1l",
-"middleL1rQ",
-"middleL2",
-"middleL23",
-"middleL2BZ",
-"middleL2O",
-"middleL2W",
-"middleL2Y",
-"middleL2_1",
-"middleL2m",
-"middleL2s",
-"middleL2y",
-"middleL3",
-"middleL38",
-"middleL3H",
-"middleL3L",
-"middleL3_1",
-"middleL3w",
-"middleL4",
-"middleL47",
-"middleL4B",
-"middleL4E",
-"middleL4Gv",
-"middleL4N",
-"middleL4Z",
-"middleL4_1",
-"middleR1",
-"middleR10",
-"middleR10nMf",
-"middleR11",
-"middleR11c",
-"middleR12",
-"middleR12z",
-"middleR1F",
-"middleR1QJ",
-"middleR1X",
-"middleR1Z",
-"middleR1_1",
-"middleR1i",
-"middleR1k",
-"middleR1l",
-"middleR1m",
-"middleR2",
-"middleR2_1R",
-"middleR2j",
-"middleR3",
-"middleR33",
-"middleR3D",
-"middleR3I",
-"middleR3_1",
-"middleR3v",
-"middleR4",
-"middleR40",
-"middleR49",
-"middleR4_1",
-"middleR4g",
-"middleR4j",
-"middleR9",
-"middleR9v3",
-"mount",
-"muzzlenode",
-"nose",
-"nozzle_1",
-"nozzle_1_1",
-"nozzle_1_1_1",
-"outerljt",
-"outerljt_1_1",
-"outerljt_2",
-"outerljt_3",
-"outerljt_5",
-"outerrtjt",
-"outerrtjt_1",
-"outerrtjt_1_1",
-"outerrtjt_3",
-"outerrtjt_5",
-"outerrtjt_6",
-"ovalshape",
-"paper",
-"parent",
-"parentnull",
-"pinky1",
-"pinky2eq",
-"pinky3",
-"pinky4",
-"pinky5f",
-"pinky6",
-"pinky7",
-"pinky8",
-"pinkyL1",
-"pinkyL17",
-"pinkyL1H",
-"pinkyL1K",
-"pinkyL1_1",
-"pinkyL1g",
-"pinkyL1w",
-"pinkyL2",
-"pinkyL2M",
-"pinkyL2R",
-"pinkyL2V",
-"pinkyL2_1",
-"pinkyL2a",
-"pinkyL2f",
-"pinkyL2sJh",
-"pinkyL3",
-"pinkyL37",
-"pinkyL3D",
-"pinkyL3IcT",
-"pinkyL3_1",
-"pinkyL3v",
-"pinkyL4",
-"pinkyL44",
-"pinkyL4G",
-"pinkyL4IJz",
-"pinkyL4P",
-"pinkyL4c",
-"pinkyL4m",
-"pinkyL4n",
-"pinkyR1",
-"pinkyR10",
-"pinkyR10f3",
-"pinkyR11",
-"pinkyR11Q",
-"pinkyR12",
-"pinkyR12EbF",
-"pinkyR1O",
-"pinkyR1_1e",
-"pinkyR1g",
-"pinkyR1s",
-"pinkyR2",
-"pinkyR22",
-"pinkyR2O",
-"pinkyR2_1",
-"pinkyR2g",
-"pinkyR2j",
-"pinkyR3",
-"pinkyR30",
-"pinkyR39",
-"pinkyR3R",
-"pinkyR3_1",
-"pinkyR3uW",
-"pinkyR4",
-"pinkyR40",
-"pinkyR44",
-"pinkyR47",
-"pinkyR4M2",
-"pinkyR4_1VJO",
-"pinkyR4a",
-"pinkyR4v",
-"pinkyR9",
-"plaque",
-"pointer2",
-"pointer3dv",
-"pointer4",
-"pointer6N",
-"pointer7",
-"pointer8",
-"pointerL1",
-"pointerL10",
-"pointerL1A",
-"pointerL1G",
-"pointerL1GU",
-"pointerL1O",
-"pointerL1V",
-"pointerL1Z",
-"pointerL1_1",
-"pointerL1zm",
-"pointerL2",
-"pointerL27",
-"pointerL2EF",
-"pointerL2F",
-"pointerL2G9",
-"pointerL2_1Fza",
-"pointerL2k",
-"pointerL2v",
-"pointerL3",
-"pointerL3B",
-"pointerL3X",
-"pointerL3_1",
-"pointerL3a",
-"pointerL3obH",
-"pointerL3q",
-"pointerR1",
-"pointerR14",
-"pointerR1E",
-"pointerR1SX",
-"pointerR1_1",
-"pointerR1dW",
-"pointerR1h",
-"pointerR1q",
-"pointerR1s",
-"pointerR1t",
-"pointerR1z",
-"pointerR1z9",
-"pointerR2",
-"pointerR2_1",
-"pointerR3",
-"pointerR33",
-"pointerR35",
-"pointerR3m",
-"pointerR3p",
-"pointerR7",
-"pointerR8",
-"pointerR9",
-"poppy",
-"pouch_1",
-"pr4B",
-"prAB",
-"prop",
-"prop1",
-"prop2",
-"prop25",
-"prop29",
-"prop30r",
-"prop31",
-"prop32z",
-"propbase",
-"ptA9",
-"pump",
-"push",
-"red_hair",
-"rendeff",
-"rendeff_1",
-"rendeff_1_1",
-"rendeff_3",
-"rendeff_5",
-"rendeff_6",
-"revol1",
-"revol2_1_1",
-"right_arml_hand_node",
-"right_arml_hand_nodeC",
-"right_arml_hand_nodea",
-"right_arml_hand_nodebi",
-"right_arml_hand_nodeeq",
-"right_arml_hand_nodef",
-"right_arml_hand_nodeh",
-"right_arml_hand_noder",
-"right_arml_hand_nodew",
-"right_arml_hand_nodey",
-"rightear_1",
-"ring1",
-"ring2",
-"ring3",
-"ring4U",
-"ring5",
-"ring6s",
-"ring70",
-"ringL1",
-"ringL1J",
-"ringL1q",
-"ringL1s",
-"ringL2",
-"ringL2C",
-"ringL2N",
-"ringL2R",
-"ringL2SBp",
-"ringL2_1",
-"ringL2b",
-"ringL2g_",
-"ringL2k",
-"ringL2z",
-"ringL3",
-"ringL30",
-"ringL38",
-"ringL3S",
-"ringL3V",
-"ringL3_1",
-"ringL3e",
-"ringL3s",
-"ringL3u",
-"ringL3v",
-"ringL4",
-"ringL43lx",
-"ringL49",
-"ringL4B",
-"ringL4_1",
-"ringL4i",
-"ringL4jOi",
-"ringL4lB",
-"ringR1",
-"ringR10",
-"ringR10irE",
-"ringR11",
-"ringR12",
-"ringR13",
-"ringR1C",
-"ringR1Cq",
-"ringR1h",
-"ringR2",
-"ringR2E",
-"ringR2L",
-"ringR2U",
-"ringR2_1",
-"ringR2y",
-"ringR3",
-"ringR37U",
-"ringR3_1",
-"ringR3h",
-"ringR3r",
-"ringR4",
-"ringR44",
-"ringR45",
-"ringR4_1",
-"ringR4z",
-"ringR9",
-"ringR94",
-"rinnereff",
-"rinnereff_1_1",
-"rinnereff_3",
-"rinnereff_6",
-"rotor",
-"rtinjt",
-"rtinjt_1",
-"rtinjt_1_1",
-"rtinjt_2",
-"rtinjt_3",
-"rtinjt_5",
-"rtinjt_6",
-"scope",
-"scottcoin",
-"shell",
-"shield",
-"sidedial",
-"sight",
-"sights",
-"slide",
-"smallsprite",
-"smg6",
-"socketNode",
-"spear2",
-"speargunmain",
-"speargunmain1",
-"speargunmain_1",
-"speargunmain_2",
-"sphere1",
-"sphere11",
-"sphere11_1",
-"sphere11_2",
-"sphere11_3",
-"sphere11_4",
-"sphere12",
-"sphere13",
-"sphere14",
-"sphere15",
-"sphere1_1",
-"sphere1_2",
-"sphere2",
-"sphere2_1",
-"sphere3",
-"sphere4",
-"sphere5",
-"sphere6",
-"sphere7",
-"sphere7_1",
-"sphere7_zTex1",
-"sphere8",
-"sphere9",
-"spine1O",
-"spine2v",
-"spine3",
-"spine4i",
-"spoon",
-"spoon_1",
-"stemL",
-"stemR",
-"sunglasseslow",
-"sunglasseslow_1",
-"sword",
-"tail",
-"tail1",
-"taillow1",
-"taillow2",
-"tailtop1",
-"tailtop2",
-"tank_1",
-"tank_1_3",
-"tank_1_3T",
-"tassle",
-"tetra1",
-"tetra2",
-"tetra3",
-"thumb1",
-"thumbL1",
-"thumbL1A",
-"thumbL1X",
-"thumbL1_1",
-"thumbL1u",
-"thumbL2",
-"thumbL2F",
-"thumbL2M",
-"thumbL2VF",
-"thumbL2_1",
-"thumbL2ao2",
-"thumbL2qUI",
-"thumbL3",
-"thumbL31",
-"thumbL3A",
-"thumbL3Mi",
-"thumbL3ji",
-"thumbL3s",
-"thumbL3y",
-"thumbR1",
-"thumbR1Bz",
-"thumbR1J",
-"thumbR1Qh",
-"thumbR1R",
-"thumbR1S",
-"thumbR1U",
-"thumbR1Z",
-"thumbR1g",
-"thumbR1z",
-"thumbR2",
-"thumbR2A",
-"thumbR2Q",
-"thumbR2_1",
-"thumbR2jL",
-"thumbR2w",
-"thumbR3",
-"thumbR35",
-"thumbR39",
-"thumbR3_1",
-"tinysprite",
-"top2",
-"top_1",
-"top_1_2",
-"top_1_2_1",
-"topbody",
-"topcube",
-"topdial",
-"topflatcube",
-"topnull",
-"torso3_2",
-"torso4",
-"torso_1_1_1_2_1_1",
-"torso_4",
-"torso_5",
-"torso_6",
-"torus1",
-"torus10",
-"torus11",
-"torus1_",
-"torus2",
-"torus26",
-"torus28",
-"torus29",
-"torus3",
-"torus30",
-"torus3_1",
-"torus4",
-"trigpiece",
-"trigrig",
-"tube",
-"tube_1",
-"tube_2",
-"tube_2_1",
-"upperhandle",
-"vasefragments",
-"viDAr",
-"vial",
-"vial_1",
-"wheel1",
-"wheel6",
-"wheels2",
-"wing2_4",
-"wing2_9",
-"wing4",
-"wing7",
-"wings",
-"wmellonfrag2",
-"wristL",
-"wristL2",
-"wristLAE",
-"wristLE",
-"wristLJ",
-"wristL_1",
-"wristLx",
-"wristR",
-"wristRJA",
-"wristRX",
-"wristRZ",
-"wristR_1",
-"wristRm",
-"wristRw",
-"wristSxP",
-"zN_LowerBody",
-"zN_Skeleton"
+#
+# The known names live in hash_ps2.txt (same folder), one "hash<TAB>name"
+# per line grouped by category, with the hash precomputed for magic 9. It's
+# only read on the first PS2 lookup, so enabling the add-on doesn't pay for it.
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'hash_ps2.txt')
+
+'''
+Dictionary files
+Extra names, usually found with research/ps2_hash_cracker.py, live in plain
+text files so they can be added without touching this module:
+
+    # comment
+    magic 9
+    [animations]
+    1a2b3c4d	RunU
+    WalkD
+
+A line is either "hash<TAB>name" or just a name. The hash column is only
+there for reference (it's valid for the last "magic" line seen); names are
+rehashed with whatever magic number the model uses.
+
+hash_ps2.txt uses the same format. When the magic number matches, the hash
+column is used as is instead of rehashing every name.
+
+Every hash_ps2_*.txt next to this module is merged in on first lookup, as
+is every file listed in the LITHTECH_PS2_HASHES environment variable
+(os.pathsep separated). Names that are already known keep priority.
+'''
+DICTIONARY_ENV = 'LITHTECH_PS2_HASHES'
+
+# {category: [(hash or None, magic or None, name)]}, loaded on first use
+_entries = None
+_known_names = {}
+
+
+def read_dictionary(path):
+    '''
+    Returns {category: [(hash or None, magic or None, name)]} in file order.
+    '''
+    entries = {}
+    category = None
+    magic = None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.rstrip('\r\n')
+            stripped = line.strip()
+
+            if not stripped or stripped.startswith('#'):
+                continue
+            elif stripped.startswith('[') and stripped.endswith(']'):
+                category = stripped[1:-1].strip()
+                entries.setdefault(category, [])
+                continue
+            elif stripped.startswith('magic '):
+                magic = int(stripped[6:].strip(), 0)
+                continue
+            # End If
+
+            if category is None:
+                raise ValueError('%s: entry "%s" is outside of a [category] section' % (path, stripped))
+
+            hash_value = None
+            name = line
+            if '\t' in line:
+                hash_text, name = line.split('\t', 1)
+                hash_value = int(hash_text.strip(), 16)
+            # End If
+
+            entries[category].append((hash_value, magic, name.strip()))
+        # End For
+
+    return entries
+
+
+def write_dictionary(path, entries, magic=None):
+    '''
+    entries is {category: [(hash, name)]}, hash may be None.
+    Hashes are written as unsigned hex.
+    '''
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('# PS2 LTB hash dictionary, see hash_ps2.py\n')
+        if magic is not None:
+            f.write('magic %d\n' % magic)
+
+        for category in sorted(entries):
+            f.write('\n[%s]\n' % category)
+            for hash_value, name in entries[category]:
+                if hash_value is None:
+                    f.write('%s\n' % name)
+                else:
+                    f.write('%08x\t%s\n' % (hash_value & 0xFFFFFFFF, name))
+            # End For
+        # End For
 
-        
-    ],
-    
-    "sockets" : [
-        # Characters
-        "Head",
-        "Eyes",
-        "Back",
-        "Nose",
-        "Chin",
-        "LeftHand",
-        "LeftFoot",
-        "RightHand",
-        "RightFoot",
-        "Snowmobile",
-        "Motorcycle",
-        "Scope",
-        "Silencer",
-        "Laser",
-        "Flash",
-        "SpotLight"
-    ],
-    "animations" : [
-        # Characters
-        "base",
-        "StandHip",
-        "Glance",
-        "Flirt",
-        "Angry",
-        # Weapons
-        "SelectMelee",
-        "AltIdle_0",
-        "AltFire",
-        "AltFire1",
-        "AltIdle_1",
-        "AltIdle_2",
-        "AltDeselect",
-        "Select1",
-        "Idle_0",
-        "Idle_1",
-        "Idle_2",
-        "Deselect",
-        "Fire",
-        "AltSelect",
-        "Select",
-        "Reload",
-        "Hand",
-        "World",
-        "none",
-        "Lockpick",
-        "lockpick",
-        "safecracker",
-        "Unlock",
-        "Gadget",
-        "thiefmission",
-        "Thiefmission",
-        "interface",
-        "Interface",
-        "Animation",
-        "animation",
-        "animate",
-        "Animate",
-        "Prop",
-        "Decipher",
-        "decipher",
-        "Open",
-        "DownUp",
-        "-------",
-        "----------",
-        "------------",
-        "-------------",
-        "--------------",
-        "---------------",
-        "-------------------------",
-        "------------------------------",
-        "-------------------------------",
-        "+1StGd",
-        "+1StGd-1StGuAi",
-        "+2CrGd",
-        "+2CrGd_2CrGuAi",
-        "+2CrGd-2StGuAiPo",
-        "+2CrGu-2StGu",
-        "+2CrGuAi",
-        "+2CrGuAi-2CrGd",
-        "+2CrGuFi",
-        "+2CrGuRe",
-        "+2StGd-2StGuAi",
-        "+2StGu-2CrGu",
-        "+2StGuAi",
-        "+2StGuAi-2StGd",
-        "+2StGuAi-2StGuCv",
-        "+2StGuAiColNEW",
-        "+2StGuAiCorNEW",
-        "+2StGuAiPo",
-        "+2StGuAiPo-2CrGd",
-        "+2StGuCol-2StGuCvNEW",
-        "+2StGuCor-2StGuCvNEW",
-        "+2StGuCv",
-        "+2StGuCv-2StGuAi",
-        "+2StGuCv-2StGuColNEW",
-        "+2StGuCv-2StGuCorNEW",
-        "+2StGuFi",
-        "+2StGuFiColNEW",
-        "+2StGuFiCorNEW",
-        "+2StGuFiPo",
-        "+2StGuRe",
-        "+2StGuRol",
-        "+2StGuRor",
-        "+2StGuShL",
-        "+2StGuShR",
-        "+2StRuGuAi",
-        "+2StRuGuFi",
-        "+2StWaGdPa",
-        "+3StGd",
-        "+3StRuGd",
-        "+3StTki",
-        "+3StWaGd",
-        "+CrPn",
-        "+PrUn",
-        "+PrUn-St",
-        "+Si",
-        "+St-PrUn",
-        "+StDs",
-        "+StTka",
-        "+StTkag",
-        "+StTkdi",
-        "+StTkh",
-        "+StTki",
-        "+StTks",
-        "+StTkt",
-        "1CrGd",
-        "1CrGd-1CrGuAi",
-        "1CrGd-1CrGuAiOv",
-        "1CrGd-1StGuPo",
-        "1CrGu-1StGu",
-        "1CrGuAi",
-        "1CrGuAi-1CrGd",
-        "1CrGuAi*D",
-        "1CrGuAiOv",
-        "1CrGuAiOv-1CrGd",
-        "1CrGuFi",
-        "1CrGuFi*D",
-        "1CrGuFi*U",
-        "1CrGuFiOv",
-        "1CrGuRe",
-        "1CrGuRe*D",
-        "1CrGuRe*U",
-        "1StDr",
-        "1StGd",
-        "1StGd-1StGl",
-        "1StGd-1StGuAi",
-        "1StGdDr",
-        "1StGdLl",
-        "1StGdLr",
-        "1StGl-1StGd",
-        "1StGu-1CrGu",
-        "1StGuAi",
-        "1StGuAi-1StGd",
-        "1StGuAi-1StGuCv",
-        "1StGuAi*D",
-        "1StGuAi*U",
-        "1StGuAiCol*D",
-        "1StGuAiCol*U",
-        "1StGuAiColNEW",
-        "1StGuAiCor*D",
-        "1StGuAiCor*U",
-        "1StGuAiCorNEW",
-        "1StGuAiPo",
-        "1StGuAiPo*D",
-        "1StGuAiPo*U",
-        "1StGuAl1",
-        "1StGuAl2",
-        "1StGuAl3",
-        "1StGuCol-1StGuCvNEW",
-        "1StGuCor-1StGuCvNEW",
-        "1StGuCv",
-        "1StGuCv-1StGuAi",
-        "1StGuCv-1StGuColNEW",
-        "1StGuCv-1StGuCorNEW",
-        "1StGuEq",
-        "1StGuFi",
-        "1StGuFi*D",
-        "1StGuFi*U",
-        "1StGuFiCol*D",
-        "1StGuFiCol*U",
-        "1StGuFiColNEW",
-        "1StGuFiCor*D",
-        "1StGuFiCor*U",
-        "1StGuFiCorNEW",
-        "1StGuFiPo",
-        "1StGuFiPo*D",
-        "1StGuFiPo*U",
-        "1StGuIn",
-        "1StGuPo-1CrGd",
-        "1StGuRe",
-        "1StGuRe*D",
-        "1StGuRe*U",
-        "1StGuRol",
-        "1StGuRor",
-        "1StGuShL",
-        "1StGuShR",
-        "1StRuGd",
-        "1StRuGu",
-        "1StRuGu*D",
-        "1StRuGu*U",
-        "1StRuGuAi",
-        "1StRuGuAi*D",
-        "1StRuGuAi*U",
-        "1StRuGuCv",
-        "1StRuGuFi",
-        "1StRuGuFi*D",
-        "1StRuGuFi*U",
-        "1StWaGd",
-        "1StWaGdPa",
-        "1StWaGuIn",
-        "2CrGd",
-        "2CrGd-2CrGuAi",
-        "2CrGd-2CrGuAiOv",
-        "2CrGd-2StGuAiPo",
-        "2CrGu-2StGu",
-        "2CrGuAi",
-        "2CrGuAi-2CrGd",
-        "2CrGuAi*D",
-        "2CrGuAi*U",
-        "2CrGuAiOv",
-        "2CrGuAiOv-2CrGd",
-        "2CrGuFi",
-        "2CrGuFi*D",
-        "2CrGuFi*U",
-        "2CrGuFiOv",
-        "2CrGuRe",
-        "2CrGuRe*D",
-        "2CrGuRe*U",
-        "2StDr",
-        "2StGd",
-        "2StGd-2StGuAi",
-        "2StGdLl",
-        "2StGdLr",
-        "2StGu-2CrGu",
-        "2StGuAi",
-        "2StGuAi-2StGd",
-        "2StGuAi-2StGuCv",
-        "2StGuAi*D",
-        "2StGuAi*U",
-        "2StGuAiCol*D",
-        "2StGuAiCol*U",
-        "2StGuAiColNEW",
-        "2StGuAiCor*D",
-        "2StGuAiCor*U",
-        "2StGuAiCorNEW",
-        "2StGuAiPo",
-        "2StGuAiPo-2CrGd",
-        "2StGuAiPo*D",
-        "2StGuAiPo*U",
-        "2StGuAl1",
-        "2StGuAl2",
-        "2StGuAl3",
-        "2StGuCol-2StGuCvNEW",
-        "2StGuCor-2StGuCvNEW",
-        "2StGuCv",
-        "2StGuCv-2StGuAi",
-        "2StGuCv-2StGuColNEW",
-        "2StGuCv-2StGuCorNEW",
-        "2StGuFi",
-        "2StGuFi*D",
-        "2StGuFi*U",
-        "2StGuFiCol*D",
-        "2StGuFiCol*U",
-        "2StGuFiColNEW",
-        "2StGuFiCor*D",
-        "2StGuFiCor*U",
-        "2StGuFiCorNEW",
-        "2StGuFiPo",
-        "2StGuFiPo*D",
-        "2StGuFiPo*U",
-        "2StGuIn",
-        "2StGuRe",
-        "2StGuRe*D",
-        "2StGuRe*U",
-        "2StGuRol",
-        "2StGuRor",
-        "2StGuShL",
-        "2StGuShR",
-        "2StRuGd",
-        "2StRuGu",
-        "2StRuGu*D",
-        "2StRuGu*U",
-        "2StRuGuAi",
-        "2StRuGuAi*D",
-        "2StRuGuAi*U",
-        "2StRuGuCv",
-        "2StRuGuFi",
-        "2StRuGuFi*D",
-        "2StRuGuFi*U",
-        "2StWaGd",
-        "2StWaGdPa",
-        "2StWaGuIn",
-        "3StDr",
-        "3StGd",
-        "3StGuAl",
-        "3StGuBx",
-        "3StGuDe",
-        "3StGuEn",
-        "3StGuIn",
-        "3StGuPu1",
-        "3StGuPu2",
-        "3StGuPu3",
-        "3StGuPu4",
-        "3StGuSi",
-        "3StGuSl",
-        "3StGuSw1",
-        "3StGuSw2",
-        "3StGuTn",
-        "3StGuVi",
-        "3StRuGd",
-        "3StWaGd",
-        "3StWaGuIn",
-        "Aim",
-        "Aiming",
-        "AimSloMo",
-        "AimSloMo2",
-        "ALurch",
-        "Angry",
-        "Anxious",
-        "Approach",
-        "Arch1SightGun",
-        "Arch1SwimStudy",
-        "Arch23Rise",
-        "Arch2Blow",
-        "Arch2Brandish",
-        "Arch2Coin",
-        "Arch2CornrLoop",
-        "Arch2CornrPivot",
-        "Arch2CrchFire",
-        "Arch2Enter",
-        "Arch2FireVolkov",
-        "Arch2GestUpset",
-        "Arch2Glance",
-        "Arch2Gun",
-        "Arch2GunPoint",
-        "Arch2Hesitate",
-        "Arch2Hunker",
-        "Arch2KneeGrief",
-        "Arch2Kneel",
-        "Arch2Kneeling",
-        "Arch2KneelingNEW",
-        "Arch2LookDGrave",
-        "Arch2LookU",
-        "Arch2LookUCoy",
-        "Arch2LookUD",
-        "Arch2LookWatch",
-        "Arch2LookWatchU",
-        "Arch2NearDuck",
-        "Arch2NearMiss",
-        "Arch2Phone",
-        "Arch2Pivot",
-        "Arch2Preen",
-        "Arch2ReactLR",
-        "Arch2ReactStartld",
-        "Arch2SetGlassD",
-        "Arch2ShakeHead",
-        "Arch2Shoved",
-        "Arch2Shower",
-        "Arch2SighToss",
-        "Arch2Signal",
-        "Arch2Socko",
-        "Arch2Socko2",
-        "Arch2Stagger",
-        "Arch2StndSurrp",
-        "Arch2StndUpMad",
-        "Arch2StndUpShaken",
-        "Arch2StopSassy",
-        "Arch2StruckD",
-        "Arch2Survey",
-        "Arch3Checkin",
-        "Arch3Grave2",
-        "Arch3LightCig",
-        "Arch3PullPin",
-        "Arch3PushSpin",
-        "Arch3RaiseHand",
-        "Arch3SafeList",
-        "Arch3SitAcross",
-        "Arch3SitBruno",
-        "Arch3SitStareD",
-        "Arch3SlapNeck",
-        "Arch3SpikeJoe",
-        "Arch3Study",
-        "Arch3WalkSad",
-        "Arch3Warming",
-        "ArchGetUp",
-        "archmove1",
-        "archmove2",
-        "archmove3",
-        "archmove4",
-        "archmove5",
-        "Arm3Amused",
-        "Arm3Enraged",
-        "Arm3FistLookD",
-        "Arm3Furious",
-        "Arm3Glance",
-        "Arm3HipLookD",
-        "Arm3Impressed",
-        "Arm3Stand",
-        "Arm3StandAngry",
-        "Arm3StandBeat",
-        "Arm3StandMad",
-        "Arm3SwingL",
-        "Arm3SwingR",
-        "Arm3ThrowD",
-        "Arm3Victory",
-        "Arm3Watch",
-        "Arrive",
-        "Arrive1",
-        "Arrive2",
-        "attack",
-        "Attack",
-        "Awaken",
-        "backupGStagger",
-        "Bark",
-        "BarsStandGun",
-        "base",
-        "Bend1",
-        "Bend2",
-        "Bend3",
-        "Bite",
-        "blink",
-        "Blow",
-        "Bored",
-        "BossIdle",
-        "Brace",
-        "Bru3GestAngry",
-        "Bru3Greet",
-        "Bru3Shove",
-        "Bru3Sit",
-        "brunogest1",
-        "BSiTki",
-        "Cautious",
-        "cemetery",
-        "Cemetery",
-        "Cemetery2",
-        "Chair",
-        "Check",
-        "CheckMsg",
-        "Cheems",
-        "CIdle",
-        "Cigar1",
-        "Cigar2",
-        "Close",
-        "Coin",
-        "Conv1",
-        "CrPn",
-        "CrPn-St",
-        "DAcid",
-        "dance2",
-        "dance3",
-        "dance4",
-        "dance5",
-        "dance6",
-        "DArrow",
-        "DArrowFall",
-        "DBnB",
-        "DCrawl",
-        "DCrouch2",
-        "DCrouch3",
-        "DCrouch4",
-        "DCrouch5",
-        "DCrush",
-        "Dead",
-        "death",
-        "Death",
-        "Death1",
-        "Death2",
-        "Death2_laydown",
-        "Death2_sit",
-        "Defy",
-        "Depart",
-        "DFDS",
-        "DH",
-        "DH0000",
-        "DHB",
-        "DHeliAttack",
-        "Die",
-        "disappointed",
-        "DLaser",
-        "DLaser1",
-        "DLaser2",
-        "DLaser3",
-        "DLaser4",
-        "DLLeg",
-        "DLLegB",
-        "DLSh",
-        "DLShB",
-        "DLurch",
-        "DPoison",
-        "DProne",
-        "DPvs",
-        "DPvsB",
-        "Draw1",
-        "Draw2",
-        "Drink",
-        "DRLeg",
-        "DRLegB",
-        "DRSh",
-        "DRShB",
-        "DRun",
-        "DRun2",
-        "Drunk",
-        "DrwBA",
-        "DrwWoke",
-        "DSharkDeath",
-        "DSharkDie",
-        "DSharkMaul",
-        "DSharkSplash",
-        "DSit",
-        "DSit2",
-        "DSlump",
-        "DSlumpB",
-        "DT",
-        "DTB",
-        "Duck",
-        "DXBLoop",
-        "DXBStart",
-        "DXBStop",
-        "DXFLoop",
-        "DXFStart",
-        "DXFStop",
-        "EinMoment",
-        "EliteBackFlip",
-        "EliteBackFlip0",
-        "EliteBackFlip1",
-        "EliteIdle1",
-        "EliteIdle2",
-        "Enter",
-        "Entrance",
-        "Expire",
-        "Expired",
-        "Explore",
-        "F3Dance1",
-        "f3StndDust",
-        "FallDownStairs",
-        "FallDownStairsBack",
-        "FallDownStairsStart",
-        "FallDownStairsStop",
-        "FallOffLedge",
-        "FallOffLedgeBack",
-        "FallOffLedgeStart",
-        "FallOffLedgeStop",
-        "Fearful",
-        "fencebark",
-        "fencejump",
-        "fenceunjump",
-        "Firing",
-        "Floundering",
-        "Frightened",
-        "FrontDesk",
-        "GDuck",
-        "GDuckold",
-        "Gen2Impatient",
-        "Gen2SitLookU",
-        "Gen2SitTap",
-        "Gen2TurnWalk",
-        "Gen2WalkStop",
-        "Gen3Impatient",
-        "Gesture",
-        "GetPhoto",
-        "GetUp",
-        "GHandsUp",
-        "GHandsUpLoop",
-        "Give",
-        "Glance",
-        "GlanceBL",
-        "GLean",
-        "GLunge",
-        "Goodbye",
-        "Graveside",
-        "Grieving",
-        "growl",
-        "GShrug",
-        "GStagger",
-        "Gun",
-        "gun2",
-        "GunIdle",
-        "GunPoint",
-        "GunPoint2",
-        "GunPointloop",
-        "GunUp",
-        "Hail",
-        "Hail2",
-        "Halt",
-        "HandsOnHips",
-        "HandsUp",
-        "HandsUpShift",
-        "HDeath1",
-        "HDeath2",
-        "HDeath2idle",
-        "Hesitate",
-        "hit",
-        "Hunker",
-        "Hurt",
-        "Idle",
-        "Impatient",
-        "InjBurning",
-        "InjLimp1",
-        "InjLimp2",
-        "Innocent",
-        "InnocentOLD",
-        "Inside",
-        "Jones",
-        "KeyframeSmorgasboard",
-        "KnockOut",
-        "Laugh",
-        "laydown",
-        "LC",
-        "LCB",
-        "LCF",
-        "LCL",
-        "LCR",
-        "Leaning",
-        "LeanOnWall",
-        "Leave",
-        "LightCig",
-        "LJJ",
-        "LJL",
-        "LJT",
-        "lookaround",
-        "Lookback",
-        "LookBack",
-        "LookD",
-        "LookDown",
-        "LookL",
-        "LookLold",
-        "LookLR",
-        "LookR",
-        "LookU",
-        "LookUp",
-        "LookUpCoy",
-        "LookWatch",
-        "LRB",
-        "LRclLSh",
-        "LRclRSh",
-        "LRdM",
-        "LRdS",
-        "LRF",
-        "LRL",
-        "LRR",
-        "LSt",
-        "LSw",
-        "LSwF",
-        "LSwimBackwards",
-        "LSwimForward",
-        "LWB",
-        "LWF",
-        "LWL",
-        "LWR",
-        "M2ThrowDown",
-        "M3CrouchRepairH",
-        "M3CrouchRepairW",
-        "M3Dance2",
-        "M3StndFixH",
-        "M3StndFixW",
-        "M3StndPickU",
-        "M3StndPlan",
-        "move1",
-        "move2",
-        "move2old",
-        "move3a",
-        "move3b",
-        "move3c",
-        "move3d",
-        "move3e",
-        "move4a",
-        "move4a_copy",
-        "move4b",
-        "move4b_copy",
-        "move4c",
-        "move5",
-        "move6",
-        "move7",
-        "move8",
-        "NarrowEscape",
-        "Nod",
-        "Observe",
-        "OnFeet",
-        "Open",
-        "Opened",
-        "OutCold",
-        "OutCold2",
-        "OverCorpse",
-        "Pace",
-        "ParaDie",
-        "ParaDied",
-        "ParaDive",
-        "ParaEscape",
-        "ParaEscaped",
-        "ParaFire",
-        "Phone",
-        "Phone2",
-        "Phone3",
-        "Pickup",
-        "PointGun",
-        "PointGun000",
-        "PrCr",
-        "Preen",
-        "Preen000",
-        "Prone",
-        "Proud",
-        "PrPi",
-        "PrUn",
-        "PrUn-St",
-        "PsBtL",
-        "PullLeverHi",
-        "PullLeverLo",
-        "Punch",
-        "puppettest",
-        "PushButton",
-        "QuickDraw",
-        "Reach",
-        "React",
-        "Reaction",
-        "Read",
-        "Ready",
-        "Recline",
-        "Recline1",
-        "Recline1b",
-        "Recline2",
-        "Recline2b",
-        "Recline3",
-        "Recline3b",
-        "Recline4",
-        "Recline4b",
-        "Recover",
-        "Recover2",
-        "Recover3",
-        "Report",
-        "RubHands",
-        "Running",
-        "RunNod",
-        "RunOver",
-        "RunPain",
-        "RunStop",
-        "RunTired",
-        "Sad",
-        "SafeList",
-        "Salute",
-        "scratch",
-        "ScratchH",
-        "Scurry",
-        "SetGlassDown",
-        "ShakeHead",
-        "sheepish",
-        "shift",
-        "Shift",
-        "Shocked",
-        "ShootSmithy0",
-        "ShootSmithy1",
-        "ShootSmithy2",
-        "Shot",
-        "shower",
-        "Si",
-        "Si-SiDs",
-        "Si-St",
-        "Si-StPistol",
-        "Si-StRifle",
-        "SiDrAs",
-        "SiDrAw",
-        "SiDs",
-        "SiDs-Si",
-        "Sight",
-        "Sight000",
-        "SightGun",
-        "SighToss",
-        "Sing",
-        "SiPn",
-        "sit",
-        "SitDrunk",
-        "SiTka",
-        "SiTkag",
-        "SiTkdi",
-        "SiTkh",
-        "SiTki",
-        "SiTks",
-        "SiTkt",
-        "SitTied",
-        "SitUp",
-        "SlapNeck",
-        "Smoke",
-        "SniffPoodle",
-        "Spike",
-        "Spike_copy",
-        "SpikeOLD",
-        "Spin",
-        "SRclHead",
-        "SRclHeadB",
-        "SRclLLeg",
-        "SRclLSh",
-        "SRclRLeg",
-        "SRclRSh",
-        "SRclTB",
-        "St-CrPn",
-        "St-PrCr",
-        "St-PrPi",
-        "St-PrUn",
-        "St-Si",
-        "St-StDs",
-        "St-StSt",
-        "stagger",
-        "Stagger",
-        "StaggerL",
-        "StaggerLold",
-        "Stand",
-        "StandAlert",
-        "StandFolded",
-        "StandHip",
-        "StandUp",
-        "Start",
-        "Startled",
-        "StCb",
-        "StCold",
-        "StCp",
-        "StDo",
-        "StDoK",
-        "StDs",
-        "StDs-St",
-        "StGrTh",
-        "StGuFl",
-        "StGuLo",
-        "StGuLu",
-        "Stir",
-        "StndLookF",
-        "StndPreen",
-        "StopSinging",
-        "StPb",
-        "StPi",
-        "StPiGroundL",
-        "StPiGroundR",
-        "StPn",
-        "Stretch",
-        "Stretch_copy",
-        "StruckD",
-        "Struggle",
-        "StRuPn",
-        "StSt",
-        "StSt-St",
-        "StTa",
-        "StTka",
-        "StTkag",
-        "StTkdi",
-        "StTkh",
-        "StTkhOLD",
-        "StTki",
-        "StTks",
-        "StTkSad",
-        "StTkt",
-        "sung",
-        "sung*D",
-        "sung*U",
-        "Surrender",
-        "Survey",
-        "Sw",
-        "SwDo",
-        "Sweep",
-        "SwFi",
-        "SwimDeath",
-        "SwimDeathFull",
-        "SwimDeathStart",
-        "SwimDeathStop",
-        "SwRe",
-        "TalkShrug",
-        "TooLate",
-        "Topple",
-        "Trail",
-        "Turn",
-        "TurnWalk",
-        "Twitch",
-        "twitch",
-        "UHAm",
-        "UHChL",
-        "UHChR",
-        "UHPtL",
-        "UHPuL",
-        "UHPuR",
-        "UMAl",
-        "UMAm",
-        "UMAm*D",
-        "UMAm*U",
-        "UMCAm",
-        "UMCAm*D",
-        "UMCAm*U",
-        "UMCFi",
-        "UMCFi*D",
-        "UMCFi*U",
-        "UMCRe",
-        "UMCRe*D",
-        "UMCRe*U",
-        "UMCSAm",
-        "UMCSAm*D",
-        "UMCSAm*U",
-        "UMCSFi",
-        "UMCSFi*D",
-        "UMCSFi*U",
-        "UMDe",
-        "UMDe*D",
-        "UMDe*U",
-        "UMFi",
-        "UMFi*D",
-        "UMFi*U",
-        "UMRe",
-        "UMRe*D",
-        "UMRe*U",
-        "UMSAm",
-        "UMSAm*D",
-        "UMSAm*U",
-        "UMSe",
-        "UMSe*D",
-        "UMSe*U",
-        "UMSFi",
-        "UMSFi*D",
-        "UMSFi*U",
-        "UMUn",
-        "UOCSThO",
-        "UOCThO",
-        "UOCThU",
-        "UOSThO",
-        "UOThO",
-        "UPAm",
-        "UPAm*D",
-        "UPAm*U",
-        "UPCAm",
-        "UPCAm*D",
-        "UPCAm*U",
-        "UPCFi",
-        "UPCFi*D",
-        "UPCFi*U",
-        "UPCRe",
-        "UPCRe*D",
-        "UPCRe*U",
-        "UPCSAm",
-        "UPCSAm*D",
-        "UPCSAm*U",
-        "UPCSFi",
-        "UPCSFi*D",
-        "UPCSFi*U",
-        "UPDe",
-        "UPDe*D",
-        "UPDe*U",
-        "UPFi",
-        "UPFi*D",
-        "UPFi*U",
-        "UPI1",
-        "UPI2",
-        "UPI4",
-        "UPRe",
-        "UPRe*D",
-        "UPRe*U",
-        "UPSAm",
-        "UPSAm*D",
-        "UPSAm*U",
-        "UPSe",
-        "UPSe*D",
-        "UPSe*U",
-        "Upset",
-        "UPSFi",
-        "UPSFi*D",
-        "UPSFi*U",
-        "URAm",
-        "URAm*D",
-        "URAm*U",
-        "URCAm",
-        "URCAm*D",
-        "URCAm*U",
-        "URCFi",
-        "URCFi*D",
-        "URCFi*U",
-        "URCRe",
-        "URCRe*D",
-        "URCRe*U",
-        "URCSAm",
-        "URCSAm*D",
-        "URCSAm*U",
-        "URCSFi",
-        "URCSFi*D",
-        "URCSFi*U",
-        "URDe",
-        "URDe*D",
-        "URDe*U",
-        "URFi",
-        "URFi*D",
-        "URFi*U",
-        "URRe",
-        "URRe*D",
-        "URRe*U",
-        "URSAm",
-        "URSAm*D",
-        "URSAm*U",
-        "URSe",
-        "URSe*D",
-        "URSe*U",
-        "URSFi",
-        "URSFi*D",
-        "URSFi*U",
-        "URSwAm",
-        "URSwFi",
-        "URSwimAim",
-        "URSwimBackwardsAm",
-        "URSwimBackwardsFi",
-        "URSwimFire",
-        "URSwRe",
-        "URSwUn",
-        "UTAl",
-        "UTAm",
-        "UTAm*D",
-        "UTAm*U",
-        "UTCAm",
-        "UTCAm*D",
-        "UTCAm*U",
-        "UTCFi",
-        "UTCFi*D",
-        "UTCFi*U",
-        "UTCRe",
-        "UTCRe*D",
-        "UTCRe*U",
-        "UTCSAm",
-        "UTCSAm*D",
-        "UTCSAm*U",
-        "UTCSFi",
-        "UTCSFi*D",
-        "UTCSFi*U",
-        "UTDe",
-        "UTDe*D",
-        "UTDe*U",
-        "UTFi",
-        "UTFi*D",
-        "UTFi*U",
-        "UTRe",
-        "UTRe*D",
-        "UTRe*U",
-        "UTSAm",
-        "UTSAm*D",
-        "UTSAm*U",
-        "UTSe",
-        "UTSe*D",
-        "UTSe*U",
-        "UTSFi",
-        "UTSFi*D",
-        "UTSFi*U",
-        "UTUn",
-        "UUR",
-        "UUSt",
-        "UUW",
-        "VEnter",
-        "VEnter2",
-        "Von3Smoke",
-        "Wag3Idle",
-        "Wag3Idle2",
-        "WaistPitch",
-        "WaistYaw",
-        "Waiting",
-        "WalkAway",
-        "WalkAway2",
-        "WalkAway3",
-        "WalkCoy",
-        "WalkCoy2",
-        "Walking",
-        "WalkSad",
-        "WalkStop",
-        "walkstop",
-        "WalkStop2",
-        "walkstopold",
-        "Warming",
-        "Wince",
-        "Wipe",
-        "WipeBrow",
-        "Wounded",
-        "Write",
-        "base",
-        "Arch3WalkCoy",
-        "base",
-        "+1StGd",
-        "1CrGuAi*U",
-        "3StGd",
-        "Arm3LeanOver",
-        "Bar3SitEat",
-        "base",
-        "Base",
-        "Closed",
-        "dance1",
-        "EliteIdle4",
-        "Flirt",
-        "interface4",
-        "LongFall",
-        "LookL",
-        "Meddlesome",
-        "NearMiss",
-        "OpenDoor",
-        "Pace",
-        "ParaIdle",
-        "percolate",
-        "PullPin",
-        "React",
-        "SwimFire",
-        "Swimming",
-        "swimming",
-        "TooLate",
-        "TurnWalk",
-        "Walking",
-        "wounded"
-    ]
-}
+
+def load_dictionary(path):
+    '''
+    Merge the names from a dictionary file into the known names.
+    Returns how many new names were added.
+    '''
+    entries = _get_entries()
+    added = 0
+
+    for category, names in read_dictionary(path).items():
+        known = entries.setdefault(category, [])
+        seen = _known_names.setdefault(category, set())
+        for hash_value, magic, name in names:
+            if name and name not in seen:
+                known.append((hash_value, magic, name))
+                seen.add(name)
+                added += 1
+        # End For
+    # End For
+
+    if added:
+        _TABLES.clear()
+
+    return added
+
+
+def _get_entries():
+    global _entries
+    if _entries is not None:
+        return _entries
+    _entries = {}
+
+    paths = [DATA_PATH]
+    paths += sorted(glob.glob(os.path.join(os.path.dirname(DATA_PATH), 'hash_ps2_*.txt')))
+    paths += [path for path in os.environ.get(DICTIONARY_ENV, '').split(os.pathsep) if path]
+
+    for path in paths:
+        try:
+            added = load_dictionary(path)
+            if path != DATA_PATH:
+                print("Loaded %d PS2 hash name(s) from %s" % (added, path))
+        except (OSError, ValueError) as e:
+            print("Couldn't load PS2 hash dictionary %s: %s" % (path, e))
+    # End For
+
+    return _entries
+
+
+def __getattr__(name):
+    '''
+    HASH_LOOKUP used to be a literal in this module, {category: [names]}.
+    It's still available, built from the loaded entries on access.
+    '''
+    if name == 'HASH_LOOKUP':
+        return { category: [entry[2] for entry in entries] for category, entries in _get_entries().items() }
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+'''
+Per (magic number, category) tables, built on first use and shared by every
+HashLookUp instance. Each entry is a ({hash: name}, {name: hash}) pair.
+When two names share a hash the first one loaded wins, same as the old
+linear scan.
+'''
+_TABLES = {}
 
 '''
 HashLookUp
@@ -4112,16 +173,41 @@ Ported to Python, it relies on overflowing signed integers (signed int32), hence
 class HashLookUp(object):
     def __init__(self, magic_number):
         self._magic_number = magic_number
+        # (category, hash) pairs that weren't found, in the order they were asked for
+        self.unresolved = []
         pass
 
+    def _get_tables(self, category):
+        entries = _get_entries()
+
+        key = (self._magic_number, category)
+        tables = _TABLES.get(key)
+
+        if tables is None:
+            reverse = {}
+            forward = {}
+            for hashed, magic, string in entries.get(category, []):
+                if hashed is None or magic != self._magic_number:
+                    hashed = self.hash(string)
+                else:
+                    hashed = c_int(hashed).value
+                reverse.setdefault(hashed, string)
+                forward.setdefault(string, hashed)
+            # End For
+            tables = _TABLES[key] = (reverse, forward)
+        # End If
+
+        return tables
+
     def lookup_hash(self, hash_value, category):
-        for string in HASH_LOOKUP[category]:
+        reverse, _ = self._get_tables(category)
+        hash_value = c_int(hash_value).value
 
-            hashed = self.hash(string)
-            if hashed == c_int(hash_value).value:
-                return string
+        name = reverse.get(hash_value)
+        if name is None:
+            self.unresolved.append((category, hash_value))
 
-        return None
+        return name
 
     def hash(self, name):
         hash_value = c_int(0)
@@ -4141,24 +227,12 @@ class HashLookUp(object):
         
         Args:
             name (str): The name to find the hash for
-            context (str): The context to search in ('pieces', 'nodes', 'sockets', etc.)
+            context (str): The context to search in ('pieces', 'animations', 'sockets')
             
         Returns:
-            int: The hash value, or None if not found
+            int: The hash value, or None if the name isn't in that context
         """
-        # Not all hash dictionaries have been implemented yet
-        if not hasattr(self, f"_{context}_dict"):
-            return None
-            
-        # Get the appropriate dictionary for this context
-        context_dict = getattr(self, f"_{context}_dict")
-        
-        # Search for the name in the values, return the corresponding key
-        for hash_val, hash_name in context_dict.items():
-            if hash_name == name:
-                return hash_val
-                
-        return None
+        _, forward = self._get_tables(context)
+        return forward.get(name)
     
 # End Class
-
@@ -1,3 +1,5 @@
+import mmap
+import os
 import struct
 
 '''
@@ -13,3 +15,180 @@ def unpack(fmt, f):
 
 def pack(fmt, f, values):
     f.write(struct.pack(fmt, values))
+
+
+'''
+Precompiled little-endian structs, shared by every cursor.
+'''
+_STRUCTS = {}
+
+
+def _compiled(fmt):
+    s = _STRUCTS.get(fmt)
+    if s is None:
+        s = _STRUCTS[fmt] = struct.Struct('<' + fmt)
+    return s
+
+
+_U8 = _compiled('B')
+_I8 = _compiled('b')
+_U16 = _compiled('H')
+_I16 = _compiled('h')
+_U32 = _compiled('I')
+_I32 = _compiled('i')
+_F32 = _compiled('f')
+_VEC3 = _compiled('3f')
+_QUAT = _compiled('4f')
+
+
+class BinaryCursor(object):
+    '''
+    Read position over a whole file held in memory. Every read is a
+    `unpack_from` at the current offset, so there is no per-value `read()`
+    call and no format string parsing after the first use of a format.
+
+    The seek/tell/read trio mirrors a file object, so code that only needs
+    those keeps working unchanged.
+
+    `data` can be anything `unpack_from` accepts: bytes, a memoryview or an
+    mmap. Closing the cursor closes an mmap it was given.
+    '''
+    def __init__(self, data, offset=0):
+        self.data = data
+        self.offset = offset
+
+    def __len__(self):
+        return len(self.data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        data, self.data = self.data, b''
+        self.offset = 0
+        if isinstance(data, mmap.mmap):
+            try:
+                data.close()
+            except BufferError:
+                # A view handed out by view() is still alive; the map is
+                # released together with the last view instead.
+                pass
+
+    # File-like
+    def tell(self):
+        return self.offset
+
+    def seek(self, offset, whence=0):
+        if whence == 1:
+            offset += self.offset
+        elif whence == 2:
+            offset += len(self.data)
+        self.offset = offset
+        return offset
+
+    def skip(self, count):
+        self.offset += count
+
+    def read(self, count=-1):
+        start = self.offset
+        end = len(self.data) if count < 0 else start + count
+        self.offset = min(end, len(self.data))
+        return bytes(self.data[start:self.offset])
+
+    def view(self, count):
+        '''Zero-copy memoryview of the next `count` bytes.'''
+        start = self.offset
+        self.offset += count
+        return memoryview(self.data)[start:self.offset]
+
+    # Structured
+    def unpack(self, fmt):
+        s = _compiled(fmt)
+        values = s.unpack_from(self.data, self.offset)
+        self.offset += s.size
+        return values
+
+    def _scalar(self, s):
+        value = s.unpack_from(self.data, self.offset)[0]
+        self.offset += s.size
+        return value
+
+    def u8(self):
+        return self._scalar(_U8)
+
+    def i8(self):
+        return self._scalar(_I8)
+
+    def u16(self):
+        return self._scalar(_U16)
+
+    def i16(self):
+        return self._scalar(_I16)
+
+    def u32(self):
+        return self._scalar(_U32)
+
+    def i32(self):
+        return self._scalar(_I32)
+
+    def f32(self):
+        return self._scalar(_F32)
+
+    def vec3(self):
+        values = _VEC3.unpack_from(self.data, self.offset)
+        self.offset += 12
+        return values
+
+    def quat(self):
+        '''Raw quaternion in file order (x, y, z, w).'''
+        values = _QUAT.unpack_from(self.data, self.offset)
+        self.offset += 16
+        return values
+
+    def string(self, encoding='ascii'):
+        '''uint16 length-prefixed string.'''
+        length = self.u16()
+        start = self.offset
+        self.offset += length
+        return bytes(self.data[start:self.offset]).decode(encoding)
+
+
+'''
+Files at least this large are memory-mapped instead of read into a bytes
+object. Below it a single read() is cheaper than setting up the mapping.
+'''
+MMAP_THRESHOLD = 1 << 20
+
+
+def _map_file(f):
+    try:
+        fileno = f.fileno()
+        size = os.fstat(fileno).st_size
+    except (AttributeError, OSError, ValueError):
+        # In-memory or otherwise non-seekable stream
+        return None
+    if size < MMAP_THRESHOLD:
+        return None
+    try:
+        return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def read_cursor(source, use_mmap=True):
+    '''
+    Open a BinaryCursor over a path or a binary file object. Large regular
+    files are memory-mapped so the readers slice the page cache directly;
+    small files, pipes and in-memory streams are read in one go.
+    '''
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, 'rb') as f:
+            return read_cursor(f, use_mmap)
+
+    data = _map_file(source) if use_mmap else None
+    if data is None:
+        return BinaryCursor(source.read())
+    return BinaryCursor(data, source.tell())
@@ -1,6 +1,7 @@
 import os
+import numpy as np
 from .abc import *
-from .io import unpack
+from .io import read_cursor
 from mathutils import Vector, Matrix, Quaternion
 
 
@@ -12,37 +13,37 @@ class ABCModelReader(object):
         self._lod_dist_count = 0
 
     def _read_matrix(self, f):
-        data = unpack('16f', f)
+        data = f.unpack('16f')
         rows = [data[0:4], data[4:8], data[8:12], data[12:16]]
         return Matrix(rows)
 
     def _read_vector(self, f):
-        return Vector(unpack('3f', f))
+        return Vector(f.vec3())
 
     def _read_quaternion(self, f):
-        x, y, z, w = unpack('4f', f)
+        x, y, z, w = f.quat()
         return Quaternion((w, x, y, z))
 
     def _read_string(self, f):
-        return f.read(unpack('H', f)[0]).decode('ascii')
+        return f.string()
 
     def _read_weight(self, f):
         weight = Weight()
-        weight.node_index = unpack('I', f)[0]
+        weight.node_index = f.u32()
         weight.location = self._read_vector(f)
-        weight.bias = unpack('f', f)[0]
+        weight.bias = f.f32()
         return weight
 
     def _read_vertex(self, f):
         vertex = Vertex()
 
         if self._version != 108:
-            weight_count = unpack('H', f)[0]
-            vertex.sublod_vertex_index = unpack('H', f)[0]
+            weight_count = f.u16()
+            vertex.sublod_vertex_index = f.u16()
         elif self._version == 108:
-            weight_count = unpack('B', f)[0]
-            vertex.sublod_vertex_index = unpack('B', f)[0]
-            f.seek(2, 1)
+            weight_count = f.u8()
+            vertex.sublod_vertex_index = f.u8()
+            f.skip(2)
 
         vertex.weights = [self._read_weight(f) for _ in range(weight_count)]
         vertex.location = self._read_vector(f)
@@ -51,8 +52,8 @@ class ABCModelReader(object):
 
     def _read_face_vertex(self, f):
         face_vertex = FaceVertex()
-        face_vertex.texcoord.xy = unpack('2f', f)
-        face_vertex.vertex_index = unpack('H', f)[0]
+        face_vertex.texcoord.xy = f.unpack('2f')
+        face_vertex.vertex_index = f.u16()
         return face_vertex
 
     def _read_face(self, f):
@@ -62,24 +63,24 @@ class ABCModelReader(object):
 
     def _read_lod(self, f):
         lod = LOD()
-        face_count = unpack('I', f)[0]
+        face_count = f.u32()
         lod.faces = [self._read_face(f) for _ in range(face_count)]
-        vertex_count = unpack('I', f)[0]
+        vertex_count = f.u32()
         lod.vertices = [self._read_vertex(f) for _ in range(vertex_count)]
         return lod
 
     def _read_piece(self, f):
         piece = Piece()
-        piece.material_index = unpack('H', f)[0]
+        piece.material_index = f.u16()
 
         if self._version == 108:
-            f.seek(6, 1)
+            f.skip(6)
 
-        piece.specular_power = unpack('f', f)[0]
-        piece.specular_scale = unpack('f', f)[0]
+        piece.specular_power = f.f32()
+        piece.specular_scale = f.f32()
         if self._version > 9:
-            piece.lod_weight = unpack('f', f)[0]
-        piece.padding = unpack('H', f)[0]
+            piece.lod_weight = f.f32()
+        piece.padding = f.u16()
         piece.name = self._read_string(f)
         piece.lods = [self._read_lod(f) for _ in range(self._lod_count)]
         return piece
@@ -87,16 +88,16 @@ class ABCModelReader(object):
     def _read_node(self, f):
         node = Node()
         node.name = self._read_string(f)
-        node.index = unpack('H', f)[0]
-        node.flags = unpack('b', f)[0]
+        node.index = f.u16()
+        node.flags = f.i8()
 
         if self._version == 108:
-            f.seek(4, 1)
+            f.skip(4)
 
         node.bind_matrix = self._read_matrix(f)
         node.inverse_bind_matrix = node.bind_matrix.inverted()
 
-        node.child_count = unpack('I', f)[0]
+        node.child_count = f.u32()
         return node
 
     def _read_transform(self, f):
@@ -106,53 +107,58 @@ class ABCModelReader(object):
 
         # Two unknown floats!
         if self._version == 13:
-            f.seek(8, 1)
+            f.skip(8)
 
         return transform
 
     def _read_child_model(self, f):
         child_model = ChildModel()
         child_model.name = self._read_string(f)
-        child_model.build_number = unpack('I', f)[0]
+        child_model.build_number = f.u32()
         child_model.transforms = [self._read_transform(f) for _ in range(self._node_count)]
         return child_model
 
     def _read_keyframe(self, f):
         keyframe = Animation.Keyframe()
-        keyframe.time = unpack('I', f)[0]
+        keyframe.time = f.u32()
         keyframe.string = self._read_string(f)
         return keyframe
 
-    def _read_anim_transform(self, f):
-        transform = self._read_transform(f)
+    def _read_anim_transforms(self, animation, node_index, f):
+        # Same layout as _read_transform, plus 8 more bytes on v108
+        stride = 28
+        if self._version == 13 or self._version == 108:
+            stride += 8
 
-        if self._version == 108:
-            f.seek(8, 1)
+        dtype = np.dtype({'names': ['location', 'rotation'], 'formats': [('<f4', 3), ('<f4', 4)],
+                          'offsets': [0, 12], 'itemsize': stride})
+        data = np.frombuffer(f.view(stride * animation.keyframe_count), dtype=dtype)
 
-        return transform
+        animation.locations[node_index] = data['location']
+        # Stored as x, y, z, w
+        animation.rotations[node_index] = data['rotation'][:, [3, 0, 1, 2]]
 
     def _read_animation(self, f):
         animation = Animation()
         animation.extents = self._read_vector(f)
         animation.name = self._read_string(f)
-        animation.unknown1 = unpack('i', f)[0]
-        animation.interpolation_time = unpack('I', f)[0] if self._version >= 12 else 200
-        animation.keyframe_count = unpack('I', f)[0]
+        animation.unknown1 = f.i32()
+        animation.interpolation_time = f.u32() if self._version >= 12 else 200
+        animation.keyframe_count = f.u32()
         animation.keyframes = [self._read_keyframe(f) for _ in range(animation.keyframe_count)]
-        animation.node_keyframe_transforms = []
-        for _ in range(self._node_count):
+        animation.allocate_transforms(self._node_count, animation.keyframe_count)
+        for node_index in range(self._node_count):
 
             # Skip past -1
             if self._version >= 13:
-                f.seek(4, 1)
+                f.skip(4)
 
-            animation.node_keyframe_transforms.append(
-                [self._read_anim_transform(f) for _ in range(animation.keyframe_count)])
+            self._read_anim_transforms(animation, node_index, f)
         return animation
 
     def _read_socket(self, f):
         socket = Socket()
-        socket.node_index = unpack('I', f)[0]
+        socket.node_index = f.u32()
         socket.name = self._read_string(f)
         socket.rotation = self._read_quaternion(f)
         socket.location = self._read_vector(f)
@@ -168,11 +174,11 @@ class ABCModelReader(object):
     def _read_weight_set(self, f):
         weight_set = WeightSet()
         weight_set.name = self._read_string(f)
-        node_count = unpack('I', f)[0]
-        weight_set.node_weights = [unpack('f', f)[0] for _ in range(node_count)]
+        node_count = f.u32()
+        weight_set.node_weights = [f.f32() for _ in range(node_count)]
         return weight_set
 
-    def from_file(self, path):
+    def from_file(self, path, use_mmap=True):
         model = Model()
         model.name = os.path.splitext(os.path.basename(path))[0]
         
@@ -184,70 +190,70 @@ class ABCModelReader(object):
         print(f"{'='*60}\n")
     
         
-        with open(path, 'rb') as f:
+        with read_cursor(path, use_mmap) as f:
             next_section_offset = 0
             while next_section_offset != -1:
                 f.seek(next_section_offset)
                 section_name = self._read_string(f)
-                next_section_offset = unpack('i', f)[0]
+                next_section_offset = f.i32()
                 if section_name == 'Header':
-                    self._version = unpack('I', f)[0]
+                    self._version = f.u32()
                     if self._version not in [9, 10, 11, 12, 13, 108]:
                         raise Exception('Unsupported file version ({}).'.format(self._version))
                     model.version = self._version
-                    f.seek(8, 1)
-                    self._node_count = unpack('I', f)[0]
-                    f.seek(20, 1)
-                    self._lod_count = unpack('I', f)[0]
+                    f.skip(8)
+                    self._node_count = f.u32()
+                    f.skip(20)
+                    self._lod_count = f.u32()
                     self._lod_dist_count = self._lod_count
-                    f.seek(4, 1)
-                    self._weight_set_count = unpack('I', f)[0]
-                    f.seek(8, 1)
+                    f.skip(4)
+                    self._weight_set_count = f.u32()
+                    f.skip(8)
 
                     # Unknown new value
                     if self._version >= 13:
-                        f.seek(4, 1)
+                        f.skip(4)
 
                     if self._version == 108:
-                        f.seek(8, 1)
+                        f.skip(8)
 
                     model.command_string = self._read_string(f)
-                    model.internal_radius = unpack('f', f)[0]
+                    model.internal_radius = f.f32()
 
                     if self._version == 108:
-                        self._lod_dist_count = unpack('I', f)[0]
+                        self._lod_dist_count = f.u32()
                     else:
-                        f.seek(4, 1)
+                        f.skip(4)
 
-                    f.seek(60, 1)
-                    model.lod_distances = [unpack('f', f)[0] for _ in range(self._lod_dist_count)]
+                    f.skip(60)
+                    model.lod_distances = [f.f32() for _ in range(self._lod_dist_count)]
                 elif section_name == 'Pieces':
-                    weight_count, pieces_count = unpack('2I', f)
+                    weight_count, pieces_count = f.unpack('2I')
                     model.pieces = [self._read_piece(f) for _ in range(pieces_count)]
                 elif section_name == 'Nodes':
                     if self._version == 108:
-                        weight_set_count = unpack('I', f)[0]
+                        weight_set_count = f.u32()
                         model.weight_sets = [self._read_weight_set(f) for _ in range(weight_set_count)]
 
                     model.nodes = [self._read_node(f) for _ in range(self._node_count)]
                     build_undirected_tree(model.nodes)
 
                     if self._version != 108:
-                        weight_set_count = unpack('I', f)[0]
+                        weight_set_count = f.u32()
                         model.weight_sets = [self._read_weight_set(f) for _ in range(weight_set_count)]
                 elif section_name == 'ChildModels':
-                    child_model_count = unpack('H', f)[0]
+                    child_model_count = f.u16()
                     model.child_models = [self._read_child_model(f) for _ in range(child_model_count)]
                 elif section_name == 'Animation':
-                    animation_count = unpack('I', f)[0]
+                    animation_count = f.u32()
                     model.animations = [self._read_animation(f) for _ in range(animation_count)]
                 elif section_name == 'Sockets':
-                    socket_count = unpack('I', f)[0]
+                    socket_count = f.u32()
                     model.sockets = [self._read_socket(f) for _ in range(socket_count)]
                 elif section_name == 'AnimBindings':
-                    anim_binding_count = unpack('I', f)[0]
+                    anim_binding_count = f.u32()
                     model.anim_bindings = [self._read_anim_binding(f) for _ in range(anim_binding_count)]
                 elif section_name == 'HitGroups' and self._version == 108:
-                    hitgroups_count = unpack('I', f)[0]
+                    hitgroups_count = f.u32()
                     #model.hitgroups = [self._read_hitgroups(f) for _ in range(hitgroups_count)]
         return model
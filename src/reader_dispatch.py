@@ -20,12 +20,12 @@ try:
     from .reader_abc_pc import ABCModelReader
     from .reader_ltb_pc import PCLTBModelReader
     from .reader_ltb_ps2 import PS2LTBModelReader
-    from .reader_lta import LTAModelReader
+    from .reader_lta import LTAModelReader, compression_of
 except ImportError:
     from reader_abc_pc import ABCModelReader
     from reader_ltb_pc import PCLTBModelReader
     from reader_ltb_ps2 import PS2LTBModelReader
-    from reader_lta import LTAModelReader
+    from reader_lta import LTAModelReader, compression_of
 
 
 def detect_format(path):
@@ -36,6 +36,9 @@ def detect_format(path):
     stripped = head.lstrip(b'\xef\xbb\xbf \t\r\n')
     if stripped[:1] == b'(' or os.path.splitext(path)[1].lower() == '.lta':
         return 'lta'
+    # compressed exporter output (.lta.gz / .lta.bz2 / .lta.xz)
+    if compression_of(head) is not None:
+        return 'lta'
     if len(head) >= 8:
         n = struct.unpack_from('<H', head, 0)[0]
         if n == 6 and head[2:8] == b'Header':
@@ -49,15 +52,18 @@ def detect_format(path):
     return {'.abc': 'abc'}.get(os.path.splitext(path)[1].lower(), 'unknown')
 
 
-def read_model(path):
-    """Detect format and return a populated abc.py:Model."""
+def read_model(path, use_mmap=True):
+    """Detect format and return a populated abc.py:Model.
+
+    Binary files above io.MMAP_THRESHOLD are memory-mapped unless `use_mmap`
+    is False; smaller ones are read into memory in one call."""
     fmt = detect_format(path)
     if fmt == 'lta':
         return LTAModelReader().from_file(path)
     if fmt == 'abc':
-        return ABCModelReader().from_file(path)
+        return ABCModelReader().from_file(path, use_mmap)
     if fmt == 'ltb_pc':
-        return PCLTBModelReader().from_file(path)
+        return PCLTBModelReader().from_file(path, use_mmap)
     if fmt == 'ltb_ps2':
-        return PS2LTBModelReader().from_file(path)
+        return PS2LTBModelReader().from_file(path, use_mmap)
     raise ValueError("Unrecognised LithTech model header: %s" % os.path.basename(path))
@@ -22,9 +22,11 @@ from mathutils import Vector, Matrix, Quaternion
 try:
     from .abc import (Model, Node, Piece, LOD, Vertex, Face, FaceVertex,
                       Weight, Socket, Animation, AnimBinding)
+    from . import fk
 except ImportError:
     from abc import (Model, Node, Piece, LOD, Vertex, Face, FaceVertex,
                      Weight, Socket, Animation, AnimBinding)
+    import fk
 
 
 _TIME_TO_MS = 1.0  # LTA 'times' are already milliseconds (confirmed from v1:
@@ -32,18 +34,53 @@ _TIME_TO_MS = 1.0  # LTA 'times' are already milliseconds (confirmed from v1:
 #                    binary Model also uses ms, so we store them unchanged.
 
 
+# First bytes of the compressors the LTA exporter can write through
+_COMPRESSED_MAGIC = (
+    (b'\x1f\x8b', 'gzip'),
+    (b'BZh', 'bz2'),
+    (b'\xfd7zXZ\x00', 'lzma'),
+)
+
+
+def compression_of(head):
+    """'gzip', 'bz2' or 'lzma' if `head` (the first bytes of a file) starts
+    with that compressor's magic, else None."""
+    for magic, module in _COMPRESSED_MAGIC:
+        if head.startswith(magic):
+            return module
+    return None
+
+
+def open_lta_text(path):
+    """Text stream over an .lta file, decompressing .lta.gz/.bz2/.xz output
+    (recognised by its magic bytes, not the extension)."""
+    with open(path, 'rb') as f:
+        module = compression_of(f.read(8))
+    if module is None:
+        return open(path, 'r', errors='replace')
+    import importlib
+    return importlib.import_module(module).open(path, 'rt', errors='replace')
+
+
 # ---------------------------------------------------------------------------
 # LTA S-expression parser + helpers (from v1, verbatim behaviour)
 # ---------------------------------------------------------------------------
 _TOKEN_RE = re.compile(r'\(|\)|"[^"]*"|[^\s()"]+')
 
+# Lists are indexed by their first atom only when it can be a node name: the
+# numeric rows (vertices, posquats, ...) would otherwise make up most entries.
+_NAME_START = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_')
+
 
 class LTAParseError(Exception):
     pass
 
 
-def parse_lta(text):
-    root, stack = [], None
+def parse_lta(text, index=None):
+    """Parse LTA text into nested lists. If `index` is a dict, it is filled
+    with node name -> [nodes] in the order find_all() would return them, so
+    callers can look nodes up without walking the tree again. Only names
+    starting with a letter or '_' are indexed."""
     root = []
     stack = [root]
     for tok in _TOKEN_RE.findall(text):
@@ -58,19 +95,23 @@ def parse_lta(text):
         else:
             if tok.startswith('"'):
                 tok = tok[1:-1]
-            stack[-1].append(tok)
+            top = stack[-1]
+            if index is not None and not top and tok[:1] in _NAME_START:
+                # first atom of a list is its name (see node_name)
+                index.setdefault(tok, []).append(top)
+            top.append(tok)
     if len(stack) != 1:
         raise LTAParseError("Unbalanced '(' (truncated?)")
     return root
 
 
-def parse_lta_spans(text):
+def parse_lta_spans(text, index=None):
     """Like parse_lta but also returns {id(list_node): (start, end)} mapping
     each parsed list to its exact character span in the source. Used to
     re-emit preserved on-load-cmd blocks VERBATIM (quotes and all) instead of
     re-serializing the parsed tree, which loses string-quote information and
     would corrupt names containing spaces (e.g. "Upper Instant") or any
-    quoted piece name in piece-priorities."""
+    quoted piece name in piece-priorities. `index` as in parse_lta."""
     root = []
     stack = [root]
     starts = [None]
@@ -91,7 +132,10 @@ def parse_lta_spans(text):
         else:
             if tok.startswith('"'):
                 tok = tok[1:-1]
-            stack[-1].append(tok)
+            top = stack[-1]
+            if index is not None and not top and tok[:1] in _NAME_START:
+                index.setdefault(tok, []).append(top)
+            top.append(tok)
     if len(stack) != 1:
         raise LTAParseError("Unbalanced '(' (truncated?)")
     return root, spans
@@ -196,19 +240,24 @@ def _quat_xyzw(vals):
 # ---------------------------------------------------------------------------
 class LTAModelReader(object):
     def from_file(self, path):
-        with open(path, 'r', errors='replace') as f:
+        with open_lta_text(path) as f:
             src_text = f.read()
-        tree, spans = parse_lta_spans(src_text)
+        index = {}
+        tree, spans = parse_lta_spans(src_text, index)
 
         model = Model()
         model.name = os.path.splitext(os.path.basename(path))[0]
+        if model.name.lower().endswith('.lta'):      # hero.lta.gz
+            model.name = model.name[:-4]
         model.version = 0  # LTA carries no binary version
 
         self._tree = tree
+        self._index = index       # node name -> [nodes], built while parsing
         self._spans = spans
         self._src_text = src_text
         self._world = {}          # node name -> world Matrix (raw LT)
         self._name_to_index = {}  # node name -> global index
+        self._rest_local = None   # (locations, rotations) of every node, parent-relative
 
         # model-level coord-frame-type sets the default for all transforms
         # (default GLOBAL; only explicit 'local' composes the hierarchy)
@@ -226,6 +275,11 @@ class LTAModelReader(object):
         self._read_metadata(model)
         return model
 
+    def _find_all(self, name):
+        """find_all(self._tree, name), answered from the parse-time index
+        (names must start with a letter or '_', see parse_lta)."""
+        return list(self._index.get(name, ()))
+
     # -- on-load-cmds metadata ---------------------------------------------
     def _read_metadata(self, model):
         """Read on-load-cmds so the LTA Model carries the same metadata the
@@ -237,7 +291,7 @@ class LTAModelReader(object):
         anim_by_name = {a.name: a for a in model.animations}
 
         cmds = []
-        for olc in find_all(self._tree, 'on-load-cmds'):
+        for olc in self._find_all('on-load-cmds'):
             for sub in lists_of(olc):
                 if node_name(sub):
                     cmds.append(sub)
@@ -319,7 +373,7 @@ class LTAModelReader(object):
     def _read_nodes(self, model):
         hierarchy = shallow_find(self._tree, 'hierarchy')
         if hierarchy is None:
-            hs = find_all(self._tree, 'hierarchy')
+            hs = self._find_all('hierarchy')
             hierarchy = hs[0] if hs else self._tree
         children = shallow_find(hierarchy, 'children') or hierarchy
         for sub in lists_of(children):
@@ -396,16 +450,20 @@ class LTAModelReader(object):
                         if node_name(t) == 'transform':
                             self._read_transform(model, t, name, world)
 
-    def _local_of(self, node):
-        p = getattr(node, '_parent_name', None)
-        if p and p in self._world:
-            return self._world[p].inverted_safe() @ self._world[node.name]
-        return self._world[node.name].copy()
+    def _rest_locals(self, model):
+        """Rest transform of every node relative to its parent as (nodes, 3)
+        locations and (nodes, 4) w x y z rotations, computed once for all
+        animations in one batched pass."""
+        if self._rest_local is None:
+            world = fk.matrix_stack([self._world[node.name] for node in model.nodes])
+            local = fk.world_to_local(world, fk.parent_indices(model.nodes))
+            self._rest_local = fk.decompose(local)
+        return self._rest_local
 
     # -- geometry -----------------------------------------------------------
     def _read_pieces(self, model):
         self._shape_to_piece = {}
-        for snode in find_all(self._tree, 'shape'):
+        for snode in self._find_all('shape'):
             piece = self._read_shape(snode, len(model.pieces))
             if piece is not None:
                 model.pieces.append(piece)
@@ -490,7 +548,7 @@ class LTAModelReader(object):
 
     # -- weights ------------------------------------------------------------
     def _read_weights(self, model):
-        for deformer in find_all(self._tree, 'skel-deformer'):
+        for deformer in self._find_all('skel-deformer'):
             tnode = shallow_find(deformer, 'target')
             target = first_string(tnode) if tnode else None
             piece = self._shape_to_piece.get(target)
@@ -530,7 +588,7 @@ class LTAModelReader(object):
 
     # -- sockets ------------------------------------------------------------
     def _read_sockets(self, model):
-        for sock in find_all(self._tree, 'socket'):
+        for sock in self._find_all('socket'):
             s = Socket()
             s.name = first_string(sock) or "socket"
             pnode = shallow_find(sock, 'parent')
@@ -553,12 +611,12 @@ class LTAModelReader(object):
     # -- animations ---------------------------------------------------------
     def _read_animations(self, model):
         all_anim_nodes = {}
-        for a in find_all(self._tree, 'anim'):
+        for a in self._find_all('anim'):
             ident = first_string(a)
             if ident and shallow_find(a, 'frames'):
                 all_anim_nodes.setdefault(ident, a)
 
-        for aset in find_all(self._tree, 'animset'):
+        for aset in self._find_all('animset'):
             name = first_string(aset) or "anim%d" % len(model.animations)
             times = self._anim_times(aset)
             values = self._anim_values(aset)
@@ -674,26 +732,19 @@ class LTAModelReader(object):
             anim.keyframes.append(kf)
 
         # one (loc, rot) per node per keyframe; un-animated nodes hold rest-local
-        anim.node_keyframe_transforms = []
-        for node in model.nodes:
+        anim.allocate_transforms(len(model.nodes), kc)
+        for ni, node in enumerate(model.nodes):
             track = node_tracks.get(node.name)
-            row = []
             if track:
-                for k in range(kc):
-                    loc, rot = track[k] if k < len(track) else track[-1]
-                    t = Animation.Keyframe.Transform()
-                    t.location = loc.copy()
-                    t.rotation = rot.copy()
-                    row.append(t)
+                n = min(len(track), kc)
+                anim.locations[ni, :n] = [tuple(loc) for loc, _ in track[:n]]
+                anim.rotations[ni, :n] = [tuple(rot) for _, rot in track[:n]]
+                # short tracks hold their last key
+                anim.locations[ni, n:] = tuple(track[n - 1][0])
+                anim.rotations[ni, n:] = tuple(track[n - 1][1])
             else:
-                lm = self._local_of(node)
-                loc = lm.to_translation()
-                rot = lm.to_quaternion()
-                for _ in range(kc):
-                    t = Animation.Keyframe.Transform()
-                    t.location = loc.copy()
-                    t.rotation = rot.copy()
-                    row.append(t)
-            anim.node_keyframe_transforms.append(row)
+                rest_locations, rest_rotations = self._rest_locals(model)
+                anim.locations[ni] = rest_locations[ni]
+                anim.rotations[ni] = rest_rotations[ni]
 
         model.animations.append(anim)
@@ -1,6 +1,7 @@
 import os
+import numpy as np
 from .abc import *
-from .io import unpack
+from .io import read_cursor
 from mathutils import Vector, Matrix, Quaternion
 
 # LTB Mesh Types
@@ -38,31 +39,31 @@ class PCLTBModelReader(object):
         self.lod_count = 0
 
     def _read_matrix(self, f):
-        data = unpack('16f', f)
+        data = f.unpack('16f')
         rows = [data[0:4], data[4:8], data[8:12], data[12:16]]
         return Matrix(rows)
 
     def _read_vector(self, f):
-        return Vector(unpack('3f', f))
+        return Vector(f.vec3())
 
     def _read_quaternion(self, f):
-        x, y, z, w = unpack('4f', f)
+        x, y, z, w = f.quat()
         return Quaternion((w, x, y, z))
 
     def _read_string(self, f):
-        return f.read(unpack('H', f)[0]).decode('ascii')
+        return f.string()
 
     def _read_weight(self, f):
         weight = Weight()
-        weight.node_index = unpack('I', f)[0]
+        weight.node_index = f.u32()
         weight.location = self._read_vector(f)
-        weight.bias = unpack('f', f)[0]
+        weight.bias = f.f32()
         return weight
 
     def _read_vertex(self, f):
         vertex = Vertex()
-        weight_count = unpack('H', f)[0]
-        vertex.sublod_vertex_index = unpack('H', f)[0]
+        weight_count = f.u16()
+        vertex.sublod_vertex_index = f.u16()
         vertex.weights = [self._read_weight(f) for _ in range(weight_count)]
         vertex.location = self._read_vector(f)
         vertex.normal = self._read_vector(f)
@@ -70,8 +71,8 @@ class PCLTBModelReader(object):
 
     def _read_face_vertex(self, f):
         face_vertex = FaceVertex()
-        face_vertex.texcoord.xy = unpack('2f', f)
-        face_vertex.vertex_index = unpack('H', f)[0]
+        face_vertex.texcoord.xy = f.unpack('2f')
+        face_vertex.vertex_index = f.u16()
         return face_vertex
 
     def _read_face(self, f):
@@ -81,413 +82,218 @@ class PCLTBModelReader(object):
 
     def _read_null_mesh(self, lod, f):
         # No data here but a filler int!
-        f.seek(4, 1)
+        f.skip(4)
         return lod
 
-    def _read_rigid_mesh(self, lod, f):
-        data_type = unpack('4I', f)
-        bone = unpack('I', f)[0]
-
-        # We need face vertex data alongside vertices!
-        face_vertex_list = []
-
+    def _vertex_stream_dtype(self, mask, blend_count):
+        '''
+        Layout of one vertex in a data stream. The fields come in the same
+        order as the VTX_* bits, blend weights follow the position.
+        '''
+        fields = []
+        if mask & VTX_Position:
+            fields.append(('position', '<f4', 3))
+            if blend_count > 0:
+                fields.append(('blend', '<f4', blend_count))
+        if mask & VTX_Normal:
+            fields.append(('normal', '<f4', 3))
+        if mask & VTX_Colour:
+            fields.append(('colour', '<i4'))
+        if mask & VTX_UV_Sets_1:
+            fields.append(('uv1', '<f4', 2))
+        if mask & VTX_UV_Sets_2:
+            fields.append(('uv2', '<f4', 2))
+        if mask & VTX_UV_Sets_3:
+            fields.append(('uv3', '<f4', 2))
+        if mask & VTX_UV_Sets_4:
+            fields.append(('uv4', '<f4', 2))
+        if mask & VTX_BasisVector:
+            fields.append(('s', '<f4', 3))
+            fields.append(('t', '<f4', 3))
+        # End If
+        return np.dtype(fields)
+
+    def _read_vertex_streams(self, lod, data_type, blend_count, f):
+        '''
+        Decode the (up to) four data streams, each one np.frombuffer call.
+        Returns {field name: array with one row per vertex}.
+        '''
+        streams = {}
         for mask in data_type:
-            for _ in range(lod.vert_count):
-                vertex = Vertex()
-                face_vertex = FaceVertex()
-
-                # Dirty flags
-                is_vertex_used = False
-                is_face_vertex_used = False
-            
-                if mask & VTX_Position:
-                    vertex.location = self._read_vector(f)
-                    
-                    # One bone per vertex
-                    weight = Weight()
-                    weight.node_index = bone
-                    weight.bias = 1.0
-
-                    vertex.weights.append(weight)
-
-                    is_vertex_used = True
-                if mask & VTX_Normal:
-                    vertex.normal = self._read_vector(f)
-                    is_vertex_used = True
-                if mask & VTX_Colour:
-                    vertex.colour = unpack('i', f)[0]
-                    is_vertex_used = True
-                if mask & VTX_UV_Sets_1:
-                    face_vertex.texcoord.xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_2:
-                    face_vertex.extra_texcoords[0].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_3:
-                    face_vertex.extra_texcoords[1].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_4:
-                    face_vertex.extra_texcoords[2].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_BasisVector:
-                    vertex.s = self._read_vector(f)
-                    vertex.t = self._read_vector(f)
-                    is_vertex_used = True
-                # End If
-
-                if is_vertex_used:
-                    lod.vertices.append(vertex)
-
-                if is_face_vertex_used:
-                    face_vertex_list.append(face_vertex)
-                 
-            # End For
-        # End For
-
-        # Make sure our stuff is good!!
-        print ("Vert Count Check: %d/%d" % (lod.vert_count, len(lod.vertices)))
-        assert(lod.vert_count == len(lod.vertices))
-
-        # We need a "global" face, we'll fill it and re-use it.
-        face = Face()
-        for _ in range(lod.face_count * 3):
-            vertex_index = unpack('H', f)[0]
-
-            face_vertex = face_vertex_list[vertex_index]
-            face_vertex.vertex_index = vertex_index
+            dtype = self._vertex_stream_dtype(mask, blend_count)
+            if dtype.itemsize == 0:
+                continue
 
-            # If we have room, append!
-            if len(face.vertices) < 3:
-                face.vertices.append(face_vertex)
-            # End If
+            data = np.frombuffer(f.view(dtype.itemsize * lod.vert_count), dtype=dtype, count=lod.vert_count)
 
-            # If we're now over, then flush!
-            if len(face.vertices) >= 3:
-                lod.faces.append(face)
-                # Make a new face, and append our face vertex
-                face = Face()
-            # End If
+            # Copy out of the file buffer, so nothing keeps it alive
+            for name in dtype.names:
+                streams[name] = data[name].copy()
         # End For
 
-        # Make sure our stuff is good!!
-        print ("Face Count Check: %d/%d" % (lod.face_count, len(lod.faces)))
-        assert(lod.face_count == len(lod.faces))
+        return streams
+
+    def _build_arrays(self, lod, streams):
+        '''
+        Start lod.arrays from decoded streams, positions and normals are
+        used as is.
+        '''
+        arrays = LODArrays()
+        arrays.positions = streams.get('position', np.zeros((lod.vert_count, 3), dtype=np.float32))
+        arrays.normals = streams.get('normal', np.zeros((lod.vert_count, 3), dtype=np.float32))
+        lod.arrays = arrays
+        return arrays
+
+    def _read_triangles(self, lod, index_count, streams, f):
+        '''
+        Read the whole uint16 index buffer in one go into lod.arrays,
+        with the first UV set gathered per corner.
+        '''
+        indices = np.frombuffer(f.view(index_count * 2), dtype='<u2', count=index_count)
+
+        if 'uv1' in streams:
+            texcoords = streams['uv1'][indices]
+        else:
+            texcoords = np.zeros((index_count, 2), dtype=np.float32)
 
-        return lod
+        lod.arrays.indices = indices.astype(np.int32)
+        lod.arrays.texcoords = texcoords
 
-    def _read_skeletal_mesh(self, lod, f):
-        reindexed_bone = unpack('B', f)[0]
-        data_type = unpack('4I', f)
+    def _read_bone_sets(self, lod, weight_nodes, weight_biases, f):
+        '''
+        Bone sets map a range of vertices' weight columns to nodes.
+        weight_nodes/weight_biases are (vertices, columns), the finished
+        weights go into lod.arrays.
+        '''
+        used = np.ones(weight_nodes.shape, dtype=bool)
+        columns = weight_nodes.shape[1]
 
-        matrix_palette = unpack('B', f)[0]
+        bone_set_count = f.u32()
 
-        print("Matrix Palette? %d" % matrix_palette)
+        for _ in range(bone_set_count):
+            index_start = f.u16()
+            index_count = f.u16()
 
-        # We need face vertex data alongside vertices!
-        face_vertex_list = []
+            bone_list = f.unpack('4B')
 
-        for mask in data_type:
-            for _ in range(lod.vert_count):
-                vertex = Vertex()
-                face_vertex = FaceVertex()
-
-                # Dirty flags
-                is_vertex_used = False
-                is_face_vertex_used = False
-
-                if mask & VTX_Position:
-                    vertex.location = self._read_vector(f)
-                    is_vertex_used = True
-
-                    weights = []
-
-                    weight = Weight()
-                    weight.bias = 1.0                    
-
-                    for i in range(lod.max_bones_per_face):
-                        # Skip the first one
-                        if i == 0:
-                            continue
-                        # End If
-
-                        # There's 3 additional blends, 
-                        # If ... max_bones_per_face >= 2,3,4
-                        if lod.max_bones_per_face >= (i+1):
-                            blend = unpack('f', f)[0]
-                            weight.bias -= blend
-
-                            blend_weight = Weight()
-                            blend_weight.bias = blend
-                            weights.append(blend_weight)
-                        # End If
-                    # End For
-
-                    weights.append(weight)
-
-                    vertex.weights = weights
-                if mask & VTX_Normal:
-                    vertex.normal = self._read_vector(f)
-                    is_vertex_used = True
-                if mask & VTX_Colour:
-                    vertex.colour = unpack('i', f)[0]
-                    is_vertex_used = True
-                if mask & VTX_UV_Sets_1:
-                    face_vertex.texcoord.xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_2:
-                    face_vertex.extra_texcoords[0].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_3:
-                    face_vertex.extra_texcoords[1].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_4:
-                    face_vertex.extra_texcoords[2].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_BasisVector:
-                    vertex.s = self._read_vector(f)
-                    vertex.t = self._read_vector(f)
-                    is_vertex_used = True
-                # End If
-
-                if is_vertex_used:
-                    lod.vertices.append(vertex)
-
-                if is_face_vertex_used:
-                    face_vertex_list.append(face_vertex)
-                
+            # ???
+            index_buffer_index = f.u32()
+
+            # Okay, now we can fill up our node indexes!
+            vertex_range = slice(index_start, index_start + index_count)
+            for (index, bone_index) in enumerate(bone_list[:columns]):
+                # If we've got an invalid bone (255) then drop that weight
+                if bone_index == Invalid_Bone:
+                    used[vertex_range, index] = False
+                else:
+                    weight_nodes[vertex_range, index] = bone_index
             # End For
+
+            totals = np.where(used[vertex_range], weight_biases[vertex_range], 0.0).sum(axis=1)
+            assert(np.all(totals != 0.0))
         # End For
 
-        # Make sure our stuff is good!!
-        print ("Vert Count Check: %d/%d" % (lod.vert_count, len(lod.vertices)))
-        assert(lod.vert_count == len(lod.vertices))
+        # Rows are kept in column order, same as the weight lists were
+        lod.arrays.set_weights(used.sum(axis=1), weight_nodes[used], weight_biases[used])
 
-        # We need a "global" face, we'll fill it and re-use it.
-        face = Face()
-        for _ in range(lod.face_count * 3):
-            vertex_index = unpack('H', f)[0]
+    def _read_rigid_mesh(self, lod, f):
+        data_type = f.unpack('4I')
+        bone = f.u32()
 
-            face_vertex = face_vertex_list[vertex_index]
-            face_vertex.vertex_index = vertex_index
+        streams = self._read_vertex_streams(lod, data_type, 0, f)
+        arrays = self._build_arrays(lod, streams)
 
-            # If we have room, append!
-            if len(face.vertices) < 3:
-                face.vertices.append(face_vertex)
-            # End If
-
-            # If we're now over, then flush!
-            if len(face.vertices) >= 3:
-                lod.faces.append(face)
-                # Make a new face, and append our face vertex
-                face = Face()
-            # End If
-        # End For
+        # One bone per vertex
+        arrays.set_weights(np.ones(lod.vert_count, dtype=np.int32),
+                           np.full(lod.vert_count, bone, dtype=np.int32),
+                           np.ones(lod.vert_count, dtype=np.float32))
 
         # Make sure our stuff is good!!
-        print ("Face Count Check: %d/%d" % (lod.face_count, len(lod.faces)))
-        assert(lod.face_count == len(lod.faces))
+        print ("Vert Count Check: %d/%d" % (lod.vert_count, lod.get_vertex_count()))
+        assert(lod.vert_count == lod.get_vertex_count())
 
-        bone_set_count = unpack('I', f)[0]
+        self._read_triangles(lod, lod.face_count * 3, streams, f)
 
-        for _ in range(bone_set_count):
-            index_start = unpack('H', f)[0]
-            index_count = unpack('H', f)[0]
+        # Make sure our stuff is good!!
+        print ("Face Count Check: %d/%d" % (lod.face_count, lod.get_triangle_count()))
+        assert(lod.face_count == lod.get_triangle_count())
 
-            bone_list = unpack('4B', f)
+        return lod
 
-            # ???
-            index_buffer_index = unpack('I', f)[0]
+    def _read_skeletal_mesh(self, lod, f):
+        reindexed_bone = f.u8()
+        data_type = f.unpack('4I')
 
-            # Okay, now we can fill up our node indexes!
-            for vertex_index in range(index_start, index_start + index_count):
-                vertex = lod.vertices[vertex_index]
+        matrix_palette = f.u8()
 
-                # We need to re-build the weight list for our vertex
-                weights = []
+        print("Matrix Palette? %d" % matrix_palette)
 
-                for (index, bone_index) in enumerate(bone_list):
-                    # If we've got an invalid bone (255) then ignore it
-                    if bone_index == Invalid_Bone:
-                        continue
-                    # End If
+        # There's up to 3 additional blends after the position,
+        # if max_bones_per_face >= 2,3,4
+        blend_count = max(0, lod.max_bones_per_face - 1)
+        streams = self._read_vertex_streams(lod, data_type, blend_count, f)
+        self._build_arrays(lod, streams)
+
+        # One weight column per blend, then the main weight which gets
+        # whatever the blends leave over
+        blends = streams.get('blend', np.zeros((lod.vert_count, blend_count), dtype=np.float32)).reshape(lod.vert_count, blend_count)
+        weight_biases = np.ones((lod.vert_count, blend_count + 1))
+        weight_biases[:, :blend_count] = blends
+        for i in range(blend_count):
+            weight_biases[:, blend_count] -= blends[:, i]
+        weight_nodes = np.zeros(weight_biases.shape, dtype=np.int32)
 
-                    vertex.weights[index].node_index = bone_index
-                    # Keep this one!
-                    weights.append(vertex.weights[index])
-                # End For
+        # Make sure our stuff is good!!
+        print ("Vert Count Check: %d/%d" % (lod.vert_count, lod.get_vertex_count()))
+        assert(lod.vert_count == lod.get_vertex_count())
 
-                total = 0.0
-                for weight in weights:
-                    total += weight.bias
+        self._read_triangles(lod, lod.face_count * 3, streams, f)
 
-                assert(total != 0.0)
+        # Make sure our stuff is good!!
+        print ("Face Count Check: %d/%d" % (lod.face_count, lod.get_triangle_count()))
+        assert(lod.face_count == lod.get_triangle_count())
 
-                vertex.weights = weights
-            #End For
-        # End For
+        self._read_bone_sets(lod, weight_nodes, weight_biases, f)
 
         return lod
 
     def _read_vertex_animated_mesh(self, lod, f):
-        _ = unpack('I', f)[0]
-        data_type = unpack('4I', f)
-
-        _ = unpack('2I', f)
+        _ = f.u32()
+        data_type = f.unpack('4I')
 
-        # We need face vertex data alongside vertices!
-        face_vertex_list = []
+        _ = f.unpack('2I')
 
-        for mask in data_type:
-            for _ in range(lod.vert_count):
-                vertex = Vertex()
-                face_vertex = FaceVertex()
-
-                # Dirty flags
-                is_vertex_used = False
-                is_face_vertex_used = False
-
-                if mask & VTX_Position:
-                    vertex.location = self._read_vector(f)
-                    is_vertex_used = True
-
-                    weights = []
-
-                    weight = Weight()
-                    weight.bias = 1.0
-
-                    '''for i in range(lod.max_bones_per_face):
-                        # Skip the first one
-                        if i == 0:
-                            continue
-                        # End If
-
-                        # There's 3 additional blends,
-                        # If ... max_bones_per_face >= 2,3,4
-                        if lod.max_bones_per_face >= (i+1):
-                            blend = unpack('f', f)[0]
-                            weight.bias -= blend
-
-                            blend_weight = Weight()
-                            blend_weight.bias = blend
-                            weights.append(blend_weight)
-                        # End If
-                    # End For'''
-
-                    weights.append(weight)
-
-                    vertex.weights = weights
-                if mask & VTX_Normal:
-                    vertex.normal = self._read_vector(f)
-                    is_vertex_used = True
-                if mask & VTX_Colour:
-                    vertex.colour = unpack('i', f)[0]
-                    is_vertex_used = True
-                if mask & VTX_UV_Sets_1:
-                    face_vertex.texcoord.xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_2:
-                    face_vertex.extra_texcoords[0].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_3:
-                    face_vertex.extra_texcoords[1].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_UV_Sets_4:
-                    face_vertex.extra_texcoords[2].xy = unpack('2f', f)
-                    is_face_vertex_used = True
-                if mask & VTX_BasisVector:
-                    vertex.s = self._read_vector(f)
-                    vertex.t = self._read_vector(f)
-                    is_vertex_used = True
-                # End If
-
-                if is_vertex_used:
-                    lod.vertices.append(vertex)
-
-                if is_face_vertex_used:
-                    face_vertex_list.append(face_vertex)
+        # Blend weights aren't stored here (see the skeletal mesh)
+        streams = self._read_vertex_streams(lod, data_type, 0, f)
+        self._build_arrays(lod, streams)
 
-            # End For
-        # End For
+        weight_biases = np.ones((lod.vert_count, 1))
+        weight_nodes = np.zeros(weight_biases.shape, dtype=np.int32)
 
         # Make sure our stuff is good!!
-        print ("Vert Count Check: %d/%d" % (lod.vert_count, len(lod.vertices)))
-        assert(lod.vert_count == len(lod.vertices))
+        print ("Vert Count Check: %d/%d" % (lod.vert_count, lod.get_vertex_count()))
+        assert(lod.vert_count == lod.get_vertex_count())
 
-        # We need a "global" face, we'll fill it and re-use it.
-        face = Face()
-        for _ in range(lod.face_count):
-            vertex_index = unpack('H', f)[0]
-
-            face_vertex = face_vertex_list[vertex_index]
-            face_vertex.vertex_index = vertex_index
-
-            # If we have room, append!
-            if len(face.vertices) < 3:
-                face.vertices.append(face_vertex)
-            # End If
-
-            # If we're now over, then flush!
-            if len(face.vertices) >= 3:
-                lod.faces.append(face)
-                # Make a new face, and append our face vertex
-                face = Face()
-            # End If
-        # End For
+        # face_count is the index count here
+        self._read_triangles(lod, lod.face_count, streams, f)
 
         # Make sure our stuff is good!!
-        print ("Face Count Check: %d/%d" % (lod.face_count / 3, len(lod.faces)))
-        assert(lod.face_count / 3 == len(lod.faces))
-
-        bone_set_count = unpack('I', f)[0]
-
-        for _ in range(bone_set_count):
-            index_start = unpack('H', f)[0]
-            index_count = unpack('H', f)[0]
-
-            bone_list = unpack('4B', f)
-
-            # ???
-            index_buffer_index = unpack('I', f)[0]
-
-            # Okay, now we can fill up our node indexes!
-            for vertex_index in range(index_start, index_start + index_count):
-                vertex = lod.vertices[vertex_index]
-
-                # We need to re-build the weight list for our vertex
-                weights = []
-
-                for (index, bone_index) in enumerate(bone_list):
-                    # If we've got an invalid bone (255) then ignore it
-                    if bone_index == Invalid_Bone:
-                        continue
-                    # End If
+        print ("Face Count Check: %d/%d" % (lod.face_count / 3, lod.get_triangle_count()))
+        assert(lod.face_count == lod.get_triangle_count() * 3)
 
-                    vertex.weights[index].node_index = bone_index
-                    # Keep this one!
-                    weights.append(vertex.weights[index])
-                # End For
-
-                total = 0.0
-                for weight in weights:
-                    total += weight.bias
-
-                assert(total != 0.0)
-
-                vertex.weights = weights
-            #End For
-        # End For
+        self._read_bone_sets(lod, weight_nodes, weight_biases, f)
 
         return lod
 
     def _read_lod(self, f):
         lod = LOD()
 
-        lod.texture_count = unpack('I', f)[0]
-        lod.textures = unpack('4I', f)
-        lod.render_style = unpack('I', f)[0]
-        lod.render_priority = unpack('b', f)[0]
+        lod.texture_count = f.u32()
+        lod.textures = f.unpack('4I')
+        lod.render_style = f.u32()
+        lod.render_priority = f.i8()
 
-        lod.type = unpack('I', f)[0]
+        lod.type = f.u32()
 
         # Check if it's a null mesh, it skips a lot of the data...
         if lod.type == LTB_Type_Null_Mesh:
@@ -495,11 +301,11 @@ class PCLTBModelReader(object):
             lod = self._read_null_mesh(lod, f)
         else:
             # Some common data
-            obj_size = unpack('I', f)[0]
-            lod.vert_count = unpack('I', f)[0]
-            lod.face_count = unpack('I', f)[0]
-            lod.max_bones_per_face = unpack('I', f)[0]
-            lod.max_bones_per_vert = unpack('I', f)[0]
+            obj_size = f.u32()
+            lod.vert_count = f.u32()
+            lod.face_count = f.u32()
+            lod.max_bones_per_face = f.u32()
+            lod.max_bones_per_vert = f.u32()
             
             if lod.type == LTB_Type_Rigid_Mesh:
                 lod = self._read_rigid_mesh(lod, f)
@@ -508,8 +314,8 @@ class PCLTBModelReader(object):
             elif lod.type == LTB_Type_Vertex_Animated_Mesh:
                 lod = self._read_vertex_animated_mesh(lod, f)
 
-        nodes_used_count = unpack('B', f)[0]
-        nodes_used = [unpack('B', f)[0] for _ in range(nodes_used_count)]
+        nodes_used_count = f.u8()
+        nodes_used = [f.u8() for _ in range(nodes_used_count)]
 
         return lod
 
@@ -517,10 +323,10 @@ class PCLTBModelReader(object):
         piece = Piece()
 
         piece.name = self._read_string(f)
-        lod_count = unpack('I', f)[0]
-        piece.lod_distances = [unpack('f', f)[0] for _ in range(lod_count)]
-        piece.lod_min = unpack('I', f)[0]
-        piece.lod_max = unpack('I', f)[0]
+        lod_count = f.u32()
+        piece.lod_distances = [f.f32() for _ in range(lod_count)]
+        piece.lod_min = f.u32()
+        piece.lod_max = f.u32()
         piece.lods = [self._read_lod(f) for _ in range(lod_count)]
 
         # Just use the first LODs first texture
@@ -532,91 +338,75 @@ class PCLTBModelReader(object):
     def _read_node(self, f):
         node = Node()
         node.name = self._read_string(f)
-        node.index = unpack('H', f)[0]
-        node.flags = unpack('b', f)[0]
+        node.index = f.u16()
+        node.flags = f.i8()
         node.bind_matrix = self._read_matrix(f)
         node.inverse_bind_matrix = node.bind_matrix.inverted()
-        node.child_count = unpack('I', f)[0]
+        node.child_count = f.u32()
         return node
 
-    def _read_uncompressed_transform(self, keyframe_count, f):
-        node_transforms = [Animation.Keyframe.Transform() for _ in range(keyframe_count)]
-
-        for t in node_transforms:
-            t.location = self._read_vector(f)
-        for t in node_transforms:
-            t.rotation = self._read_quaternion(f)
+    def _read_uncompressed_transform(self, animation, node_index, f):
+        keyframe_count = animation.keyframe_count
 
-        return node_transforms
+        # All the locations, then all the rotations (x, y, z, w)
+        animation.locations[node_index] = np.frombuffer(f.view(keyframe_count * 12), dtype='<f4').reshape(-1, 3)
+        rotations = np.frombuffer(f.view(keyframe_count * 16), dtype='<f4').reshape(-1, 4)
+        animation.rotations[node_index] = rotations[:, [3, 0, 1, 2]]
 
     def _read_uncompressed_vertex_transform(self, keyframe_count, f):
         for _ in range(keyframe_count):
-            vertex_count = unpack('I', f)[0]
+            vertex_count = f.u32()
             for _ in range(vertex_count):
-                temp_vertex = unpack('3f', f)
+                temp_vertex = f.vec3()
 
         return None
 
-    def _process_compressed_vector(self, compressed_vector):
-        return Vector( (compressed_vector[0] / 16.0, compressed_vector[1] / 16.0, compressed_vector[2] / 16.0) )
-
-    def _process_compressed_quat(self, compressed_quat):
-        return Quaternion( (compressed_quat[3] / 0x7FFF, compressed_quat[0] / 0x7FFF, compressed_quat[1] / 0x7FFF, compressed_quat[2] / 0x7FFF) )
-
     def _read_compressed_transform(self, compression_type, keyframe_count, f):
-        
-        node_transforms = []
-
-        for _ in range(self.node_count):
+        '''
+        Returns a (nodes, keys, 7) float32 array, each key being
+        location (x, y, z) followed by rotation (w, x, y, z).
+        '''
+        transforms = np.zeros((self.node_count, keyframe_count, 7), dtype=np.float32)
+        transforms[:, :, 3] = 1.0
+
+        for node_index in range(self.node_count):
             # RLE!
-            key_position_count = unpack('I', f)[0]
+            key_position_count = f.u32()
 
-            compressed_positions = []
+            compressed_positions = None
             if compression_type == CMP_Relevant or compression_type == CMP_Relevant_Rot16:
-                compressed_positions = [self._read_vector(f) for _ in range(key_position_count)]
+                compressed_positions = np.frombuffer(f.view(key_position_count * 12), dtype='<f4').reshape(-1, 3)
             elif compression_type == CMP_Relevant_16:
-                compressed_positions = [self._process_compressed_vector(unpack('3h', f)) for _ in range(key_position_count)]
+                compressed_positions = np.frombuffer(f.view(key_position_count * 6), dtype='<i2').reshape(-1, 3) / 16.0
             # End If
 
-            key_rotation_count = unpack('I', f)[0]
+            key_rotation_count = f.u32()
 
-            compressed_rotations = []
+            compressed_rotations = None
             if compression_type == CMP_Relevant:
-                compressed_rotations = [self._read_quaternion(f) for _ in range(key_rotation_count)]
+                compressed_rotations = np.frombuffer(f.view(key_rotation_count * 16), dtype='<f4').reshape(-1, 4)
             elif compression_type == CMP_Relevant_16 or compression_type == CMP_Relevant_Rot16:
-                compressed_rotations = [self._process_compressed_quat(unpack('4h', f)) for _ in range(key_rotation_count)]
+                compressed_rotations = np.frombuffer(f.view(key_rotation_count * 8), dtype='<i2').reshape(-1, 4) / 0x7FFF
             # End If
 
-            transforms = []
-
-            previous_position = Vector( (0, 0, 0) )
-            previous_rotation = Quaternion( (1, 0, 0, 0) )
-
             # RLE animations, if it doesn't change in any additional keyframe,
             # then it we can just use the last known pos/rot!
-            for i in range(keyframe_count):
-                transform = Animation.Keyframe.Transform()
-
-                try:
-                    transform.location = compressed_positions[i]
-                except IndexError:
-                    transform.location = previous_position
-
-                try:
-                    transform.rotation = compressed_rotations[i]
-                except IndexError:
-                    transform.rotation = previous_rotation
-
-                previous_position = transform.location
-                previous_rotation = transform.rotation
+            if compressed_positions is not None:
+                self._expand_rle(transforms[node_index, :, 0:3], compressed_positions)
+            if compressed_rotations is not None:
+                # Stored as x, y, z, w
+                self._expand_rle(transforms[node_index, :, 3:7], compressed_rotations[:, [3, 0, 1, 2]])
+        # End For
 
-                transforms.append(transform)
-            # End For
+        return transforms
 
-            node_transforms.append(transforms)
-        # End For
+    def _expand_rle(self, out, values):
+        count = min(len(values), len(out))
+        if count == 0:
+            return
 
-        return node_transforms
+        out[:count] = values[:count]
+        out[count:] = values[count - 1]
 
     def _read_child_model(self, f):
         child_model = ChildModel()
@@ -625,7 +415,7 @@ class PCLTBModelReader(object):
 
     def _read_keyframe(self, f):
         keyframe = Animation.Keyframe()
-        keyframe.time = unpack('I', f)[0]
+        keyframe.time = f.u32()
         keyframe.string = self._read_string(f)
         return keyframe
 
@@ -633,32 +423,35 @@ class PCLTBModelReader(object):
         animation = Animation()
         animation.extents = self._read_vector(f)
         animation.name = self._read_string(f)
-        animation.compression_type = unpack('i', f)[0]
-        animation.interpolation_time = unpack('I', f)[0]
-        animation.keyframe_count = unpack('I', f)[0]
+        animation.compression_type = f.i32()
+        animation.interpolation_time = f.u32()
+        animation.keyframe_count = f.u32()
         animation.keyframes = [self._read_keyframe(f) for _ in range(animation.keyframe_count)]
-        animation.node_keyframe_transforms = []
-
         if animation.compression_type == CMP_None:
-            for _ in range(self.node_count):
-                animation.is_vertex_animation = unpack('b', f)[0]
+            animation.allocate_transforms(self.node_count, animation.keyframe_count)
+
+            for node_index in range(self.node_count):
+                animation.is_vertex_animation = f.i8()
 
                 # We don't support vertex animations yet, so alert if we accidentally load some!
+                # Those nodes keep the identity transform.
                 #assert(animation.is_vertex_animation == 0)
                 if animation.is_vertex_animation:
                     _ = self._read_uncompressed_vertex_transform(animation.keyframe_count, f)
                 else:
-                    animation.node_keyframe_transforms.append(self._read_uncompressed_transform(animation.keyframe_count, f))
+                    self._read_uncompressed_transform(animation, node_index, f)
             # End For
         else:
-            animation.node_keyframe_transforms = self._read_compressed_transform(animation.compression_type, animation.keyframe_count, f)
+            transforms = self._read_compressed_transform(animation.compression_type, animation.keyframe_count, f)
+            animation.locations = np.ascontiguousarray(transforms[:, :, 0:3])
+            animation.rotations = np.ascontiguousarray(transforms[:, :, 3:7])
         # End If
 
         return animation
 
     def _read_socket(self, f):
         socket = Socket()
-        socket.node_index = unpack('I', f)[0]
+        socket.node_index = f.u32()
         socket.name = self._read_string(f)
         socket.rotation = self._read_quaternion(f)
         socket.location = self._read_vector(f)
@@ -675,11 +468,11 @@ class PCLTBModelReader(object):
     def _read_weight_set(self, f):
         weight_set = WeightSet()
         weight_set.name = self._read_string(f)
-        node_count = unpack('I', f)[0]
-        weight_set.node_weights = [unpack('f', f)[0] for _ in range(node_count)]
+        node_count = f.u32()
+        weight_set.node_weights = [f.f32() for _ in range(node_count)]
         return weight_set
 
-    def from_file(self, path):
+    def from_file(self, path, use_mmap=True):
         model = Model()
         model.name = os.path.splitext(os.path.basename(path))[0]
         
@@ -690,13 +483,13 @@ class PCLTBModelReader(object):
         print(f"Format: LithTech LTB (PC)")
         print(f"{'='*60}\n")
         
-        with open(path, 'rb') as f:
+        with read_cursor(path, use_mmap) as f:
 
             #
             # HEADER
             #
-            file_type = unpack('H', f)[0]
-            file_version = unpack('H', f)[0]
+            file_type = f.u16()
+            file_version = f.u16()
 
             if file_type != 1:
                 raise Exception('Unsupported File Type! Only mesh LTB files are supported.')
@@ -707,9 +500,9 @@ class PCLTBModelReader(object):
             # End If
 
             # Skip 4 ints
-            f.seek(4 * 4, 1)
+            f.skip(4 * 4)
 
-            self.version = unpack('i', f)[0]
+            self.version = f.i32()
 
             if self.version not in [23, 24, 25]:
                 raise Exception('Unsupported file version ({}).'.format(self.version))
@@ -717,30 +510,30 @@ class PCLTBModelReader(object):
 
             model.version = self.version
 
-            keyframe_count = unpack('i', f)[0]
-            animation_count = unpack('i', f)[0]
-            self.node_count = unpack('i', f)[0]
-            piece_count = unpack('i', f)[0]
-            child_model_count = unpack('i', f)[0]
-            face_count = unpack('i', f)[0]
-            vertex_count = unpack('i', f)[0]
-            vertex_weight_count = unpack('i', f)[0]
-            lod_count = unpack('i', f)[0]
-            socket_count = unpack('i', f)[0]
-            weight_set_count = unpack('i', f)[0]
-            string_count = unpack('i', f)[0]
-            string_length = unpack('i', f)[0]
-            vertex_animation_data_size = unpack('i', f)[0]
-            animation_data_size = unpack('i', f)[0]
+            keyframe_count = f.i32()
+            animation_count = f.i32()
+            self.node_count = f.i32()
+            piece_count = f.i32()
+            child_model_count = f.i32()
+            face_count = f.i32()
+            vertex_count = f.i32()
+            vertex_weight_count = f.i32()
+            lod_count = f.i32()
+            socket_count = f.i32()
+            weight_set_count = f.i32()
+            string_count = f.i32()
+            string_length = f.i32()
+            vertex_animation_data_size = f.i32()
+            animation_data_size = f.i32()
 
             model.command_string = self._read_string(f)
 
-            model.internal_radius = unpack('f', f)[0]
+            model.internal_radius = f.f32()
 
             #
             # OBB Information
             #
-            obb_count = unpack('i', f)[0]
+            obb_count = f.i32()
 
             obb_size = 64
 
@@ -749,14 +542,14 @@ class PCLTBModelReader(object):
 
             # OBB information is a matrix per each node
             # We don't use it anywhere, so just skip it.
-            f.seek(obb_size * obb_count, 1)
+            f.skip(obb_size * obb_count)
 
             #
             # Pieces
             # 
 
             # Yep again!
-            piece_count = unpack('i', f)[0]
+            piece_count = f.i32()
             model.pieces = [self._read_piece(f) for _ in range(piece_count)]
 
             #
@@ -764,31 +557,31 @@ class PCLTBModelReader(object):
             #
             model.nodes = [self._read_node(f) for _ in range(self.node_count)]
             build_undirected_tree(model.nodes)
-            weight_set_count = unpack('I', f)[0]
+            weight_set_count = f.u32()
             model.weight_sets = [self._read_weight_set(f) for _ in range(weight_set_count)]
 
             #
             # Child Models
             # 
-            child_model_count = unpack('I', f)[0]
+            child_model_count = f.u32()
             model.child_models = [self._read_child_model(f) for _ in range(child_model_count - 1)]
 
             #
             # Animations
             # 
-            animation_count = unpack('I', f)[0]
+            animation_count = f.u32()
             model.animations = [self._read_animation(f) for _ in range(animation_count)]
 
             #
             # Sockets
             # 
-            socket_count = unpack('I', f)[0]
+            socket_count = f.u32()
             model.sockets = [self._read_socket(f) for _ in range(socket_count)]
 
             #
             # Animation Bindings
             #
-            anim_binding_count = unpack('I', f)[0]
+            anim_binding_count = f.u32()
 
             #model.anim_bindings = [self._read_anim_binding(f) for _ in range(anim_binding_count)]
 
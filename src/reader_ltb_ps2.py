@@ -1,10 +1,12 @@
 import os
+import numpy as np
 from .abc import *
-from .io import unpack
+from .io import read_cursor
 from mathutils import Vector, Matrix, Quaternion
 from functools import cmp_to_key
 import math
 import copy
+from array import array
 from .hash_ps2 import HashLookUp
 
 #########################################################################################
@@ -44,117 +46,126 @@ class VIFCommand(object):
         self.code = 0
 
     def read(self, f):
-        self.constant = unpack('h', f)[0]
-        self.variable = unpack('B', f)[0]
-        self.code = unpack('B', f)[0]
+        self.constant = f.i16()
+        self.variable = f.u8()
+        self.code = f.u8()
 
 class EndCommand(object):
     def __init__(self):
         self.code = 0
 
     def read(self, f):
-        f.seek(4 * 3, 1)
-        self.code = unpack('i', f)[0]
+        f.skip(4 * 3)
+        self.code = f.i32()
 
 class LocalVertex(object):
     def __init__(self):
         self.id = 0
-        self.merge_string = ""
+        self.merge_key = None
         self.vertex = Vertex()
         self.associated_ids = []
         
-class LocalFace(object):
-    def __init__(self):
-        self.group_id = 0
-        self.face_vertex = FaceVertex()
-
 # VertexList remains the same
 class VertexList(object):
     def __init__(self):
         self.auto_increment = 0
-        self.groups = []
+        # Ordered set of the mesh set ids seen so far (dict keys keep insertion order)
+        self._group_set = {}
         self.list = []
-        self.face_verts = []
-        self.faces = []
-    
-    def append(self, vertex, group_id, face_vertex, unknown_flag = False):
-        # Method implementation remains the same
+        # Merge key -> index into self.list
+        self.index = {}
+
+        # Strip corners in file order, as parallel arrays
+        self.corner_vertices = array('I')
+        self.corner_texcoords = array('f')
+        self.corner_reversed = bytearray()
+        self.corner_groups = []
+
+        # Generated triangles, see generate_faces()
+        self.face_indices = array('I')
+        self.face_texcoords = array('f')
+
+    @property
+    def groups(self):
+        return list(self._group_set)
+
+    def append(self, vertex, group_id, texcoord, reversed = False):
         local_vertex = LocalVertex()
         local_vertex.id = self.auto_increment
         local_vertex.vertex = vertex
-        local_vertex.merge_string = self.generate_merge_string(vertex.location)
+        local_vertex.merge_key = self.generate_merge_key(vertex.location)
         local_vertex.associated_ids.append(group_id)
 
-        local_face = LocalFace()
-        local_face.group_id = group_id
-
-        vertex_index = self.find_in_list(local_vertex.merge_string)
+        vertex_index = self.find_in_list(local_vertex.merge_key)
 
         if vertex_index == -1:
             self.list.append(local_vertex)
             vertex_index = self.auto_increment
+            self.index[local_vertex.merge_key] = vertex_index
             self.auto_increment += 1
         else:
             self.list[vertex_index].associated_ids.append(group_id)
-            
-        face_vertex.vertex_index = vertex_index
-        local_face.face_vertex = face_vertex
-        self.groups.append(group_id)
-        self.groups = list(set(self.groups))
-        self.face_verts.append(local_face)
 
-    # Other methods remain the same
-    def generate_faces(self):
-        faces = []
+        self.corner_vertices.append(vertex_index)
+        self.corner_texcoords.extend(texcoord)
+        self.corner_reversed.append(1 if reversed else 0)
+        self.corner_groups.append(group_id)
+        self._group_set[group_id] = None
 
+    def generate_faces(self):
         print("------------------------------------")
         print("Generating Faces :) ")
         print("Groups: ",self.groups)
-        
-        for j in range( len(self.groups) ):
-            flip = False
-            group_id = self.groups[j]
-            grouped_faces = []
 
-            for i in range( len(self.face_verts) ):
-                face_vert = self.face_verts[i]
+        # Bucket the corners by mesh set in one pass. The buckets are created
+        # in group order, so strips come out in the same order as before.
+        strips = { group_id: [] for group_id in self._group_set }
+        for corner, group_id in enumerate(self.corner_groups):
+            strips[group_id].append(corner)
 
-                if face_vert.group_id != group_id:
-                    continue
+        vertices = self.corner_vertices
+        texcoords = self.corner_texcoords
+        face_indices = array('I')
+        face_texcoords = array('f')
 
-                grouped_faces.append(face_vert)
-            
-            for i in range( len(grouped_faces) ):
-                if i < 2:
-                    continue
+        for strip in strips.values():
+            flip = False
 
-                face = Face()
+            for i in range(2, len(strip)):
+                a, b, c = strip[i - 2], strip[i - 1], strip[i]
 
-                if grouped_faces[i].face_vertex.reversed:
-                    if flip:
-                        face.vertices = [ grouped_faces[i - 1].face_vertex, grouped_faces[i].face_vertex, grouped_faces[i - 2].face_vertex ]
-                    else:
-                        face.vertices = [ grouped_faces[i - 2].face_vertex, grouped_faces[i].face_vertex, grouped_faces[i - 1].face_vertex ]
+                # Strips alternate winding; reversed mesh sets start the other way round
+                if self.corner_reversed[c]:
+                    triangle = (b, c, a) if flip else (a, c, b)
                 else:
-                    if flip:
-                        face.vertices = [ grouped_faces[i].face_vertex, grouped_faces[i - 1].face_vertex, grouped_faces[i - 2].face_vertex ]
-                    else:
-                        face.vertices = [ grouped_faces[i].face_vertex, grouped_faces[i - 2].face_vertex, grouped_faces[i - 1].face_vertex ]
+                    triangle = (c, b, a) if flip else (c, a, b)
 
-                faces.append(face)
-                flip = not flip
+                for corner in triangle:
+                    face_indices.append(vertices[corner])
+                    face_texcoords.append(texcoords[corner * 2])
+                    face_texcoords.append(texcoords[corner * 2 + 1])
 
-        self.faces = faces
+                flip = not flip
 
-    def find_in_list(self, merge_string):
-        for i in range( len(self.list) ):
-            if merge_string == self.list[i].merge_string:
-                return i
+        self.face_indices = face_indices
+        self.face_texcoords = face_texcoords
 
-        return -1
+    def find_in_list(self, merge_key):
+        return self.index.get(merge_key, -1)
 
-    def generate_merge_string(self, vector):
-        return "%f/%f/%f" % (vector.x, vector.y, vector.z)
+    def generate_merge_key(self, vector):
+        # Positions are welded at 1e-6, the precision of the "%f" strings this
+        # used to compare. round(v * 1e6) is exact for the float32 values in
+        # the file, and "%f" keeps the sign of anything that rounds to zero
+        # ("-0.000000"), so the sign is part of the key for those components.
+        key = []
+        for value in (vector.x, vector.y, vector.z):
+            quantized = round(value * 1e6)
+            if quantized == 0 and math.copysign(1.0, value) < 0.0:
+                key.append(-0.5)
+            else:
+                key.append(quantized)
+        return tuple(key)
 
     def get_vertex_list(self):
         print("Getting vertex list! Length: %d" % len(self.list))
@@ -164,8 +175,8 @@ class VertexList(object):
 
         return out_list
 
-    def get_face_list(self):
-        return self.faces
+    def get_triangles(self):
+        return self.face_indices, self.face_texcoords
 
 # Modified PS2LTBModelReader
 class PS2LTBModelReader(object):
@@ -180,20 +191,20 @@ class PS2LTBModelReader(object):
 
     # Utility methods remain the same
     def _read_matrix(self, f):
-        data = unpack('16f', f)
+        data = f.unpack('16f')
         rows = [data[0:4], data[4:8], data[8:12], data[12:16]]
         return Matrix(rows)
 
     def _read_vector(self, f):
-        return Vector(unpack('3f', f))
+        return Vector(f.vec3())
 
     def _read_quaternion(self, f):
-        x, y, z, w = unpack('4f', f)
+        x, y, z, w = f.quat()
         return Quaternion((w, x, y, z))
 
     def _read_string(self, f):
         try:
-            string_length = unpack('H', f)[0]
+            string_length = f.u16()
             return f.read(string_length).decode('ascii')
         except UnicodeDecodeError:
             # Return a placeholder name if we encounter decoding issues
@@ -202,15 +213,15 @@ class PS2LTBModelReader(object):
 
     def _read_weight(self, f):
         weight = Weight()
-        weight.node_index = unpack('I', f)[0]
+        weight.node_index = f.u32()
         weight.location = self._read_vector(f)
-        weight.bias = unpack('f', f)[0]
+        weight.bias = f.f32()
         return weight
 
     def _read_vertex(self, f):
         vertex = Vertex()
-        weight_count = unpack('H', f)[0]
-        vertex.sublod_vertex_index = unpack('H', f)[0]
+        weight_count = f.u16()
+        vertex.sublod_vertex_index = f.u16()
         vertex.weights = [self._read_weight(f) for _ in range(weight_count)]
         vertex.location = self._read_vector(f)
         vertex.normal = self._read_vector(f)
@@ -218,8 +229,8 @@ class PS2LTBModelReader(object):
 
     def _read_face_vertex(self, f):
         face_vertex = FaceVertex()
-        face_vertex.texcoord.xy = unpack('2f', f)
-        face_vertex.vertex_index = unpack('H', f)[0]
+        face_vertex.texcoord.xy = f.unpack('2f')
+        face_vertex.vertex_index = f.u16()
         return face_vertex
 
     def _read_face(self, f):
@@ -229,20 +240,20 @@ class PS2LTBModelReader(object):
 
     def _read_lod(self, f):
         lod = LOD()
-        face_count = unpack('I', f)[0]
+        face_count = f.u32()
         lod.faces = [self._read_face(f) for _ in range(face_count)]
-        vertex_count = unpack('I', f)[0]
+        vertex_count = f.u32()
         lod.vertices = [self._read_vertex(f) for _ in range(vertex_count)]
         return lod
 
     def _read_piece(self, f):
         piece = Piece()
-        piece.material_index = unpack('H', f)[0]
-        piece.specular_power = unpack('f', f)[0]
-        piece.specular_scale = unpack('f', f)[0]
+        piece.material_index = f.u16()
+        piece.specular_power = f.f32()
+        piece.specular_scale = f.f32()
         if self._version > 9:
-            piece.lod_weight = unpack('f', f)[0]
-        piece.padding = unpack('H', f)[0]
+            piece.lod_weight = f.f32()
+        piece.padding = f.u16()
         piece.name = self._read_string(f)
         piece.lods = [self._read_lod(f) for _ in range(self._lod_count)]
         return piece
@@ -251,47 +262,35 @@ class PS2LTBModelReader(object):
         node = Node()
         node.name = self._read_string(f)
         node.bind_matrix = self._read_matrix(f)
-        f.seek(4, 1) 
-        node.child_count = unpack('I', f)[0]
-        node.index = unpack('H', f)[0]
-        f.seek(2, 1)
+        f.skip(4) 
+        node.child_count = f.u32()
+        node.index = f.u16()
+        f.skip(2)
         return node
 
-    def _read_transform(self, f):
-        transform = Animation.Keyframe.Transform()
-        
-        location = unpack('3h', f)
-        location_small_scale = unpack('h', f)[0]
-        rotation = unpack('4h', f)
+    def _read_transforms(self, animation, node_index, f):
+        # Per key: location (3h), location scale flag (h), rotation (4h, x y z w)
+        data = np.frombuffer(f.view(animation.keyframe_count * 16), dtype='<i2').reshape(-1, 8)
         
         SCALE_ROT = 0x4000
-        SCALE_LOC = 0x10
         
-        if location_small_scale == 0:
-            SCALE_LOC = 0x1000
-            
-        transform.location.x = location[0] / SCALE_LOC
-        transform.location.y = location[1] / SCALE_LOC
-        transform.location.z = location[2] / SCALE_LOC
+        # Small scale flag 0 means a finer location scale
+        scale_loc = np.where(data[:, 3] == 0, 0x1000, 0x10)
         
-        transform.rotation.x = rotation[0] / SCALE_ROT
-        transform.rotation.y = rotation[1] / SCALE_ROT
-        transform.rotation.z = rotation[2] / SCALE_ROT
-        transform.rotation.w = rotation[3] / SCALE_ROT
-        
-        return transform
+        animation.locations[node_index] = data[:, 0:3] / scale_loc[:, None]
+        animation.rotations[node_index] = data[:, [7, 4, 5, 6]] / SCALE_ROT
 
     def _read_child_model(self, f):
         #only for character models, we count ourselves as 1!
         child_model = ChildModel()
         child_model.name = self._read_string(f)
-        #child_model.build_number = unpack('I', f)[0]
+        #child_model.build_number = f.u32()
         #child_model.transforms = [self._read_transform(f) for _ in range(self._node_count)]
         return child_model
 
     def _read_keyframe(self, f):
         keyframe = Animation.Keyframe()
-        keyframe.time = unpack('I', f)[0]
+        keyframe.time = f.u32()
         keyframe.string = self._read_string(f)
         
         #print(f"DEBUG LTB reader: keyframe.time = {keyframe.time}, string = '{keyframe.string}'")
@@ -304,15 +303,14 @@ class PS2LTBModelReader(object):
         animation.extents = self._read_vector(f)
         
         unknown_vector_maybe = self._read_vector(f)
-        hashed_string = unpack('I', f)[0]
-        animation.interpolation_time = unpack('I', f)[0]
-        animation.keyframe_count = unpack('I', f)[0]
+        hashed_string = f.u32()
+        animation.interpolation_time = f.u32()
+        animation.keyframe_count = f.u32()
         animation.keyframes = [self._read_keyframe(f) for _ in range(animation.keyframe_count)]
-        animation.node_keyframe_transforms = []
-        for _ in range(self._node_count):
-            start_marker = unpack('I', f)[0]
-            animation.node_keyframe_transforms.append(
-                [self._read_transform(f) for _ in range(animation.keyframe_count)])
+        animation.allocate_transforms(self._node_count, animation.keyframe_count)
+        for node_index in range(self._node_count):
+            start_marker = f.u32()
+            self._read_transforms(animation, node_index, f)
                 
         self._animations_processed += 1
         
@@ -325,14 +323,14 @@ class PS2LTBModelReader(object):
     
     def _read_socket(self, f):
         socket = Socket()
-        f.seek(4, 1)
+        f.skip(4)
         socket.rotation = self._read_quaternion(f)
         socket.location = self._read_vector(f)
-        f.seek(4, 1)
-        socket.node_index = unpack('I', f)[0]
-        hashed_string = unpack('I', f)[0]
+        f.skip(4)
+        socket.node_index = f.u32()
+        hashed_string = f.u32()
         
-        f.seek(4, 1)
+        f.skip(4)
         
         socket.name = "Socket" + str(self._socket_counter)
         self._socket_counter += 1
@@ -354,11 +352,11 @@ class PS2LTBModelReader(object):
     def _read_weight_set(self, f):
         weight_set = WeightSet()
         # First read the ID
-        weight_set.id = unpack('I', f)[0]
+        weight_set.id = f.u32()
         # Then read the node count
-        node_count = unpack('I', f)[0]
+        node_count = f.u32()
         # Read weights for each node
-        weight_set.node_weights = [unpack('f', f)[0] for _ in range(node_count)]
+        weight_set.node_weights = [f.f32() for _ in range(node_count)]
         return weight_set
         
         
@@ -507,7 +505,7 @@ class PS2LTBModelReader(object):
         return True
 
     # Modified main method to better follow BT structure and support LODs with individual mesh types
-    def from_file(self, path):
+    def from_file(self, path, use_mmap=True):
         model = Model()
         #model.name = os.path.splitext(os.path.basename(path))[0]
         filename = os.path.basename(path)
@@ -518,15 +516,15 @@ class PS2LTBModelReader(object):
         print(f"Format: LithTech LTB (PS2)")
         print(f"{'='*60}\n")
 
-        with open(path, 'rb') as f:
+        with read_cursor(path, use_mmap) as f:
             # Header section
-            self._file_type = unpack('i', f)[0]
-            self._version = unpack('h', f)[0]
+            self._file_type = f.i32()
+            self._version = f.i16()
             
-            reserved1 = unpack('h', f)[0]  # Reserved1
-            reserved2 = unpack('i', f)[0]  # Reserved2
-            reserved3 = unpack('i', f)[0]  # Reserved3
-            reserved4 = unpack('i', f)[0]  # Reserved4
+            reserved1 = f.i16()  # Reserved1
+            reserved2 = f.i32()  # Reserved2
+            reserved3 = f.i32()  # Reserved3
+            reserved4 = f.i32()  # Reserved4
             
             print("Loading ltb version %d" % self._version)
 
@@ -540,40 +538,40 @@ class PS2LTBModelReader(object):
                 raise Exception(message)
 
             # Read offsets from header
-            offset_offset = unpack('i', f)[0]
-            piece_offset = unpack('i', f)[0]
-            node_offset = unpack('i', f)[0]
-            child_model_offset = unpack('i', f)[0]
-            animation_offset = unpack('i', f)[0]
-            socket_offset = unpack('i', f)[0]
-            file_size = unpack('i', f)[0]
+            offset_offset = f.i32()
+            piece_offset = f.i32()
+            node_offset = f.i32()
+            child_model_offset = f.i32()
+            animation_offset = f.i32()
+            socket_offset = f.i32()
+            file_size = f.i32()
             
-            padding = unpack('i', f)[0]  # Additional padding/unknown
+            padding = f.i32()  # Additional padding/unknown
 
             # Read model info
-            keyframe_count = unpack('i', f)[0]  # KeyframeCount
-            animation_count = unpack('i', f)[0]  # AnimationCount
-            self._node_count = unpack('i', f)[0]  # NodeCount
-            piece_count = unpack('i', f)[0]  # PieceCount
-            child_model_count = unpack('i', f)[0]  # ChildModelCount
-            triangle_count = unpack('i', f)[0]  # TriangleCount
-            vertex_count = unpack('i', f)[0]  # VertexCount
-            weight_count = unpack('i', f)[0]  # WeightCount
-            self._lod_count = unpack('i', f)[0]  # LODCount
-            socket_count = unpack('i', f)[0]  # SocketCount
-            weight_set_count = unpack('i', f)[0]  # WeightSetCount
-            string_count = unpack('i', f)[0]  # StringCount
-            string_length_count = unpack('i', f)[0]  # StringLengthCount
-            model_info_unknown = unpack('i', f)[0]  # Unknown
+            keyframe_count = f.i32()  # KeyframeCount
+            animation_count = f.i32()  # AnimationCount
+            self._node_count = f.i32()  # NodeCount
+            piece_count = f.i32()  # PieceCount
+            child_model_count = f.i32()  # ChildModelCount
+            triangle_count = f.i32()  # TriangleCount
+            vertex_count = f.i32()  # VertexCount
+            weight_count = f.i32()  # WeightCount
+            self._lod_count = f.i32()  # LODCount
+            socket_count = f.i32()  # SocketCount
+            weight_set_count = f.i32()  # WeightSetCount
+            string_count = f.i32()  # StringCount
+            string_length_count = f.i32()  # StringLengthCount
+            model_info_unknown = f.i32()  # Unknown
             
             # Read command string
             model.command_string = self._read_string(f)
-            model.internal_radius = unpack('f', f)[0]
+            model.internal_radius = f.f32()
 
             # Read ModelInfoExtended
-            hash_magic_number = unpack('i', f)[0]  # HashValue
-            model_info_unk1 = unpack('i', f)[0]  # Unk1
-            model_info_unk2 = unpack('i', f)[0]  # Unk2
+            hash_magic_number = f.i32()  # HashValue
+            model_info_unk1 = f.i32()  # Unk1
+            model_info_unk2 = f.i32()  # Unk2
 
             # Setup hasher
             self._hasher = HashLookUp(hash_magic_number)
@@ -582,7 +580,7 @@ class PS2LTBModelReader(object):
             f.seek(piece_offset)
             
             # Read PieceInfo structure
-            piece_info_count = unpack('i', f)[0]
+            piece_info_count = f.i32()
             print(f"Found {piece_info_count} pieces in PieceInfo")
             
             # Process each piece according to BT structure
@@ -591,17 +589,17 @@ class PS2LTBModelReader(object):
                 print(f"Processing Piece {piece_index}")
                 
                 # Read Piece structure
-                hashed_piece_name = unpack('i', f)[0]  # HashedPieceName
-                specular_power = unpack('f', f)[0]     # SpecularPower
-                specular_scale = unpack('f', f)[0]     # SpecularScale
-                lod_weight = unpack('f', f)[0]         # LODWeight
+                hashed_piece_name = f.i32()  # HashedPieceName
+                specular_power = f.f32()     # SpecularPower
+                specular_scale = f.f32()     # SpecularScale
+                lod_weight = f.f32()         # LODWeight
                 
                 # Skip floaty padding (9 floats)
-                f.seek(4 * 9, 1)
+                f.skip(4 * 9)
                 
-                texture_index = unpack('i', f)[0]      # TextureIndex
-                unknowns = unpack('i', f)[0] + unpack('i', f)[0]  # Unknown[2]
-                four = unpack('i', f)[0]               # Four
+                texture_index = f.i32()      # TextureIndex
+                unknowns = f.i32() + f.i32()  # Unknown[2]
+                four = f.i32()               # Four
                 
                 # Create piece object
                 piece_object = Piece()
@@ -620,7 +618,7 @@ class PS2LTBModelReader(object):
                     print(f"Processing LOD {lod_index} for Piece {piece_index}")
                     
                     # Read mesh_type for this specific LOD
-                    mesh_type = unpack('i', f)[0]      # MeshType - moved to LOD level
+                    mesh_type = f.i32()      # MeshType - moved to LOD level
                     
                     print(f"LOD {lod_index} Mesh Type: {mesh_type}")
                     if mesh_type == MT_RIGID:
@@ -640,13 +638,13 @@ class PS2LTBModelReader(object):
                     
                     # Read SkeletalMeshData if this is a skeletal mesh
                     if mesh_type == MT_SKELETAL:
-                        skel_unk = unpack('i', f)[0]  # SkelUnk
-                        lod_skeletal_unk_sector_count = unpack('i', f)[0]  # UnknownSectorSize
+                        skel_unk = f.i32()  # SkelUnk
+                        lod_skeletal_unk_sector_count = f.i32()  # UnknownSectorSize
                         print(f"Skeletal mesh with UnknownSectorSize: {lod_skeletal_unk_sector_count}")
                     
                     # Read GeometryBatchHeader
-                    lod_vertex_count = unpack('i', f)[0]       # VertexCount
-                    lod_node_binding = unpack('i', f)[0]  # target node index for ridgid or bone count for weighting in skeletal
+                    lod_vertex_count = f.i32()       # VertexCount
+                    lod_node_binding = f.i32()  # target node index for ridgid or bone count for weighting in skeletal
                     lod.node_binding = lod_node_binding  # Store it in the LOD object
                     print(f"Geometry batch: {lod_vertex_count} vertices, {lod_node_binding} target node iondex/bone count")
                     
@@ -663,12 +661,12 @@ class PS2LTBModelReader(object):
                             # SizeOf(BatchConnector)
                             peek_amount = 28
                             
-                            f.seek(peek_amount, 1)
+                            f.skip(peek_amount)
                             vif_cmd = VIFCommand()
                             vif_cmd.read(f)
                             
                             # Move back
-                            f.seek(-(peek_amount + 4), 1)
+                            f.skip(-(peek_amount + 4))
                             
                             # Check if there's more data
                             if vif_cmd.constant != VIF_DIRECT or vif_cmd.code != VIF_UNPACK:
@@ -684,24 +682,24 @@ class PS2LTBModelReader(object):
                         unknown_command.read(f)
                         
                         # Skip unknown
-                        f.seek(4, 1)
+                        f.skip(4)
                         
                         # Read flush command
                         flush_command = VIFCommand()
                         flush_command.read(f)
                         
                         # Skip unknowns
-                        f.seek(4 * 4, 1)
+                        f.skip(4 * 4)
                         
                         # Read PS2VIFUnpack
                         unpack_command = VIFCommand()
                         unpack_command.read(f)
                         
-                        mesh_set_count = unpack('i', f)[0]
-                        mesh_data_count = unpack('i', f)[0]
+                        mesh_set_count = f.i32()
+                        mesh_data_count = f.i32()
                         
                         # Skip zeros
-                        f.seek(4 * 2, 1)
+                        f.skip(4 * 2)
                         
                         # Track size for batch size calculation
                         size_start = f.tell()
@@ -710,55 +708,47 @@ class PS2LTBModelReader(object):
                         # Process MeshSets
                         while True:
                             # Read MeshSet header
-                            data_count = int.from_bytes(unpack('c', f)[0], 'little')
-                            unknown_flag = int.from_bytes(unpack('c', f)[0], 'little')
+                            data_count = f.u8()
+                            unknown_flag = f.u8()
                             
                             # Skip padding
-                            f.seek(2, 1)
+                            f.skip(2)
                             
                             # Read render patch details
-                            unknown_val_1 = unpack('I', f)[0]  # RenderPatchStart
-                            face_winding_order = unpack('I', f)[0]  # WindingOrder
-                            unknown_val_2 = unpack('I', f)[0]  # Unknown3
+                            unknown_val_1 = f.u32()  # RenderPatchStart
+                            face_winding_order = f.u32()  # WindingOrder
+                            unknown_val_2 = f.u32()  # Unknown3
                             
                             # Process each vertex in this mesh set
                             for i in range(data_count):
                                 # Check for 1.0f padding marker
-                                f.seek(4 * 3, 1)
-                                constant_one = unpack('f', f)[0]
+                                f.skip(4 * 3)
+                                constant_one = f.f32()
                                 
                                 # If we found the marker, go back to read vertex data
                                 if constant_one == 1.0:
-                                    f.seek(-(4 * 4), 1)
+                                    f.skip(-(4 * 4))
                                 
                                 # Read vertex data
                                 vertex = Vertex()
                                 vertex.sublod_vertex_index = 0xCDCD
                                 
                                 vertex_data = self._read_vector(f)
-                                vertex_padding = unpack('f', f)[0]
+                                vertex_padding = f.f32()
                                 normal_data = self._read_vector(f)
-                                normal_padding = unpack('f', f)[0]
-                                
-                                uv_data = Vector()
-                                uv_data.x = unpack('f', f)[0]
-                                uv_data.y = unpack('f', f)[0]
+                                normal_padding = f.f32()
                                 
-                                vertex_index = unpack('f', f)[0]
-                                unknown_padding = unpack('f', f)[0]
+                                uv_data = f.unpack('2f')
                                 
-                                # Create face vertex
-                                face_vertex = FaceVertex()
-                                face_vertex.texcoord = uv_data
-                                face_vertex.vertex_index = mesh_index
-                                face_vertex.reversed = face_winding_order == WO_REVERSED
+                                vertex_index = f.f32()
+                                unknown_padding = f.f32()
                                 
                                 # Set vertex attributes
                                 vertex.location = vertex_data
                                 vertex.normal = normal_data
                                 
-                                # Add to vertex list
-                                vertex_list.append(vertex, mesh_set_index, face_vertex, False)
+                                # Add to vertex list, the strip corner keeps the UV and winding
+                                vertex_list.append(vertex, mesh_set_index, uv_data, face_winding_order == WO_REVERSED)
                                 
                                 mesh_index += 1
                             
@@ -772,12 +762,12 @@ class PS2LTBModelReader(object):
                         
                         
                         # Check for extended data or end command
-                        end_command_peek = [unpack('i', f)[0], unpack('i', f)[0], unpack('i', f)[0], unpack('i', f)[0]]
+                        end_command_peek = [f.i32(), f.i32(), f.i32(), f.i32()]
                         
                         # If end command, go back to read it properly
                         if end_command_peek[0] == 0 and end_command_peek[1] == 0 and end_command_peek[2] == 0 and end_command_peek[3] == VIF_MSCALF:
                             print("Found End Command")
-                            f.seek(-(4*4), 1)
+                            f.skip(-(4*4))
                         else:
                             print("Skipping extra data before end command")
                         
@@ -796,7 +786,7 @@ class PS2LTBModelReader(object):
                         try:
                             # Peek ahead (BatchConnector structure size is 28 bytes)
                             peek_amount = 28
-                            f.seek(peek_amount, 1)
+                            f.skip(peek_amount)
                             
                             # Try to read a VIF command
                             vif_cmd = VIFCommand()
@@ -824,7 +814,7 @@ class PS2LTBModelReader(object):
                     # Process vertices and faces
                     lod.vertices += vertex_list.get_vertex_list()
                     vertex_list.generate_faces()
-                    lod.faces += vertex_list.get_face_list()
+                    lod.face_indices, lod.face_texcoords = vertex_list.get_triangles()
                     
                     # Process skeletal mesh weights if needed
                     if mesh_type == MT_SKELETAL:
@@ -834,19 +824,19 @@ class PS2LTBModelReader(object):
                         
                         # Step through variable-length entries
                         while True:
-                            unk_amount_to_skip = unpack('H', f)[0]
-                            f.seek(+(unk_amount_to_skip * 2), 1)
+                            unk_amount_to_skip = f.u16()
+                            f.skip(unk_amount_to_skip * 2)
                             
                             current_total = (f.tell() - unk_sector_start) / 2
                             if current_total >= lod_skeletal_unk_sector_count:
                                 # Look for 1.0f marker indicating start of vertex data
                                 while True:
-                                    test_values = unpack('4f', f)
+                                    test_values = f.unpack('4f')
                                     if test_values[3] == 1.0:
                                         unk_sector_finished = True
-                                        f.seek(-4*4, 1)
+                                        f.skip(-4*4)
                                         break
-                                    f.seek(-14, 1)
+                                    f.skip(-14)
                             
                             if unk_sector_finished:
                                 break
@@ -866,9 +856,9 @@ class PS2LTBModelReader(object):
                         for vi in range(lod_vertex_count):
                             ov = OrderedVertex()
                             ov.location = self._read_vector(f)
-                            ov.location_padding = unpack('f', f)[0]
+                            ov.location_padding = f.f32()
                             ov.normal = self._read_vector(f)
-                            ov.normal_padding = unpack('f', f)[0]
+                            ov.normal_padding = f.f32()
                             ordered_vertices.append(ov)
                         
                         # Read node map
@@ -876,7 +866,7 @@ class PS2LTBModelReader(object):
                         print(f"Reading {lod_node_binding} node map entries at position {f.tell()}")
                         
                         for wni in range(lod_node_binding):
-                            node_map.append(unpack('i', f)[0])
+                            node_map.append(f.i32())
                         
                         print(f"Node map: {node_map}")
                         
@@ -885,9 +875,9 @@ class PS2LTBModelReader(object):
                         processed_weights_list = []
                         
                         for wi in range(lod_vertex_count):
-                            weights = unpack('4h', f)
+                            weights = f.unpack('4h')
                             #node_indices = unpack('4b', f)
-                            node_indices = unpack('4B', f)
+                            node_indices = f.unpack('4B')
                             
                             normalized_weights = []
                             
@@ -1007,7 +997,7 @@ class PS2LTBModelReader(object):
                     piece_object.lods.append(lod)
                     
                     print(f"LOD {lod_index} Final vertices: {len(lod.vertices)}")
-                    print(f"LOD {lod_index} Final faces: {len(lod.faces)}")
+                    print(f"LOD {lod_index} Final faces: {lod.get_triangle_count()}")
                 
                 
                  # AFTER the LOD loop, set piece-level mesh type from first LOD
@@ -1030,7 +1020,7 @@ class PS2LTBModelReader(object):
             
             # Read WeightSet data (follows node data)
             try:
-                weight_set_count = unpack('I', f)[0]
+                weight_set_count = f.u32()
                 print(f"Found {weight_set_count} weight sets")
     
                 if 0 <= weight_set_count < 1000:  # Reasonable sanity check
@@ -1038,13 +1028,13 @@ class PS2LTBModelReader(object):
                     for i in range(weight_set_count):
                         try:
                             # Read the ID
-                            weight_set_id = unpack('I', f)[0]
+                            weight_set_id = f.u32()
                             # Read node count
-                            node_count = unpack('I', f)[0]
+                            node_count = f.u32()
                             # Read weights
                             node_weights = []
                             for j in range(node_count):
-                                node_weights.append(unpack('f', f)[0])
+                                node_weights.append(f.f32())
                 
                             # Create and add the weight set
                             weight_set = WeightSet()
@@ -1066,7 +1056,7 @@ class PS2LTBModelReader(object):
             # Then for child models, subtract 1 from the count for character models
             try:
                 f.seek(child_model_offset)
-                child_model_count = unpack('I', f)[0]
+                child_model_count = f.u32()
     
                 # Subtract 1 from child model count for character models
                 if child_model_count > 0:
@@ -1086,7 +1076,7 @@ class PS2LTBModelReader(object):
             # Read Animations
             try:
                 f.seek(animation_offset)
-                local_animation_count = unpack('I', f)[0]
+                local_animation_count = f.u32()
                 if local_animation_count > 0 and local_animation_count < 1000:  # Sanity check
                     model.animations = [self._read_animation(f) for _ in range(local_animation_count)]
                 else:
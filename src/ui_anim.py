@@ -6,12 +6,78 @@ its own NLA track (muted by default). Clicking an entry SOLOS that track
 (un-mutes it, mutes the others) and sets the frame range -- so exactly one
 animation plays at a time, NLA-based, no overlap.
 
+Models imported with "Create Actions On Demand" list their not-yet-built
+animations here too; playing one creates its Action and track first.
+
+Each row also has a Quick Preview button, which skips Blender animation data
+entirely: a frame_change_pre handler samples the decoded LithTech keyframes
+of the chosen animation (animation_import.AnimationSampler) and writes the
+pose bones directly, so any clip can be scrubbed without creating Actions,
+F-Curves or undo steps.
+
 Layout follows the original io_scene_lithtech player (Properties > Object tab,
 boxed clickable list).
 """
 import bpy
 from bpy.props import StringProperty
 
+try:
+    from .animation_import import (pending_animations, materialize_animations,
+                                   load_animation, release_preview_source, prune_cache,
+                                   AnimationSampler, SOURCE_PATH_KEY)
+except ImportError:
+    from animation_import import (pending_animations, materialize_animations,
+                                  load_animation, release_preview_source, prune_cache,
+                                  AnimationSampler, SOURCE_PATH_KEY)
+
+
+# Active quick preview: armature name + AnimationSampler
+_preview = {}
+
+
+def _remove_handler(handlers, func):
+    # match by name too: reloading the add-on leaves the old module's copy
+    for h in list(handlers):
+        if h is func or (getattr(h, '__name__', None) == func.__name__
+                         and getattr(h, '__module__', None) == func.__module__):
+            handlers.remove(h)
+
+
+@bpy.app.handlers.persistent
+def _preview_frame(scene, depsgraph=None):
+    obj = bpy.data.objects.get(_preview.get('object', ''))
+    sampler = _preview.get('sampler')
+    if obj is None or sampler is None or obj.type != 'ARMATURE':
+        # armature gone; the handler is removed with the next stop
+        _preview.clear()
+        return
+    fps = scene.render.fps / (scene.render.fps_base or 1.0)
+    time_ms = (scene.frame_current + scene.frame_subframe) * 1000.0 / fps
+    locations, rotations = sampler.sample(time_ms)
+
+    pbs = obj.pose.bones
+    for name, loc, rot in zip(sampler.bone_names, locations.tolist(), rotations.tolist()):
+        pb = pbs.get(name)
+        if pb is not None:
+            pb.location = loc
+            pb.rotation_quaternion = rot
+
+
+def _stop_preview(reset_pose=True, release=True):
+    _remove_handler(bpy.app.handlers.frame_change_pre, _preview_frame)
+    name = _preview.get('object')
+    _preview.clear()
+    if release and name:
+        # free the decoded file kept for switching clips
+        release_preview_source()
+    if not reset_pose or not name:
+        return
+    obj = bpy.data.objects.get(name)
+    if obj is not None and obj.type == 'ARMATURE':
+        for pb in obj.pose.bones:
+            pb.location = (0.0, 0.0, 0.0)
+            pb.rotation_quaternion = (1.0, 0.0, 0.0, 0.0)
+
 
 def _tracks(obj):
     if obj and obj.type == 'ARMATURE' and obj.animation_data:
@@ -52,7 +118,17 @@ class LITHTECH_OT_play_animation(bpy.types.Operator):
 
     def execute(self, context):
         obj = context.active_object
-        if not obj or obj.type != 'ARMATURE' or not obj.animation_data:
+        if not obj or obj.type != 'ARMATURE':
+            self.report({'ERROR'}, "Select a LithTech armature")
+            return {'CANCELLED'}
+        _stop_preview()
+        if self.track_name in pending_animations(obj):
+            try:
+                materialize_animations(obj, {self.track_name})
+            except Exception as e:
+                self.report({'ERROR'}, "Could not load '%s': %s" % (self.track_name, e))
+                return {'CANCELLED'}
+        if not obj.animation_data:
             self.report({'ERROR'}, "Select a LithTech armature")
             return {'CANCELLED'}
         if not _solo(obj, self.track_name, context.scene):
@@ -117,6 +193,7 @@ class LITHTECH_OT_rest_pose(bpy.types.Operator):
 
     def execute(self, context):
         obj = context.active_object
+        _stop_preview()
         if not obj or obj.type != 'ARMATURE' or not obj.animation_data:
             return {'CANCELLED'}
         for tr in obj.animation_data.nla_tracks:
@@ -125,6 +202,66 @@ class LITHTECH_OT_rest_pose(bpy.types.Operator):
         return {'FINISHED'}
 
 
+class LITHTECH_OT_preview_animation(bpy.types.Operator):
+    """Preview this animation straight from the model file, without creating
+    an Action (scrub or play the timeline)"""
+    bl_idname = "lithtech.preview_animation"
+    bl_label = "Preview Animation"
+    bl_options = {'REGISTER'}
+
+    anim_name: StringProperty()
+
+    def execute(self, context):
+        obj = context.active_object
+        if not obj or obj.type != 'ARMATURE':
+            self.report({'ERROR'}, "Select a LithTech armature")
+            return {'CANCELLED'}
+        try:
+            source, anim = load_animation(obj, self.anim_name)
+        except Exception as e:
+            self.report({'ERROR'}, "Could not load the source model: %s" % e)
+            return {'CANCELLED'}
+        if anim is None:
+            _stop_preview()
+            self.report({'ERROR'}, "Animation not found in the source model")
+            return {'CANCELLED'}
+
+        _stop_preview(reset_pose=False, release=False)
+        # Actions/NLA would overwrite the pose after the handler ran
+        ad = obj.animation_data
+        if ad is not None:
+            ad.action = None
+            for tr in ad.nla_tracks:
+                tr.mute = True
+        for pb in obj.pose.bones:
+            pb.rotation_mode = 'QUATERNION'
+
+        sampler = AnimationSampler(source, obj, anim)
+        _preview['object'] = obj.name
+        _preview['sampler'] = sampler
+
+        scene = context.scene
+        fps = scene.render.fps / (scene.render.fps_base or 1.0)
+        scene.frame_start = 0
+        scene.frame_end = max(1, int(round(sampler.duration * fps / 1000.0)))
+        scene.use_preview_range = False
+        bpy.app.handlers.frame_change_pre.append(_preview_frame)
+        scene.frame_set(0)
+        self.report({'INFO'}, "Previewing: %s" % self.anim_name)
+        return {'FINISHED'}
+
+
+class LITHTECH_OT_stop_preview(bpy.types.Operator):
+    """Stop the quick preview and return to the rest pose"""
+    bl_idname = "lithtech.stop_preview"
+    bl_label = "Stop Preview"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        _stop_preview()
+        return {'FINISHED'}
+
+
 class LITHTECH_PT_animation_panel(bpy.types.Panel):
     """Animation selector panel"""
     bl_label = "LithTech Animations"
@@ -141,15 +278,21 @@ class LITHTECH_PT_animation_panel(bpy.types.Panel):
         layout = self.layout
         obj = context.active_object
         tracks = _tracks(obj)
+        pending = pending_animations(obj)
 
         box = layout.box()
         box.label(text="Status", icon='INFO')
         playing = next((t.name for t in tracks if not t.mute), None)
-        if playing:
+        previewing = _preview.get('sampler') if _preview.get('object') == obj.name else None
+        if previewing is not None:
+            box.label(text="Previewing: %s" % previewing.name, icon='HIDE_OFF')
+        elif playing:
             box.label(text="Playing: %s" % playing, icon='PLAY')
         else:
             box.label(text="Rest pose (none active)", icon='BLANK1')
-        box.label(text="Available: %d" % len(tracks), icon='ACTION')
+        box.label(text="Available: %d" % (len(tracks) + len(pending)), icon='ACTION')
+        if pending:
+            box.label(text="Not loaded yet: %d" % len(pending), icon='IMPORT')
 
         # Authoring: register a newly authored Action for export (always shown,
         # also when the rig has no animations yet).
@@ -160,7 +303,7 @@ class LITHTECH_PT_animation_panel(bpy.types.Panel):
         box.label(text="Pushes the active Action to a", icon='BLANK1')
         box.label(text="track so the LTA export finds it.", icon='BLANK1')
 
-        if not tracks:
+        if not tracks and not pending:
             b = layout.box()
             b.label(text="No animations found!", icon='ERROR')
             b.label(text="Import with 'Import Animations' enabled,")
@@ -169,6 +312,10 @@ class LITHTECH_PT_animation_panel(bpy.types.Panel):
 
         box = layout.box()
         box.label(text="Animations", icon='SEQUENCE')
+        if previewing is not None:
+            box.operator("lithtech.stop_preview", text="Stop Preview", icon='X')
+        # one row per animation: play (solo its track) + quick preview
+        can_preview = bool(obj.get(SOURCE_PATH_KEY))
         col = box.column(align=True)
         for tr in tracks:
             is_on = not tr.mute
@@ -181,6 +328,14 @@ class LITHTECH_PT_animation_panel(bpy.types.Panel):
                          icon='PLAY' if is_on else 'BLANK1',
                          depress=is_on).track_name = tr.name
             row.label(text="%df" % frames)
+            self._draw_preview_button(row, tr.name, previewing, can_preview)
+        # lazily imported: built on first play
+        for name in pending:
+            row = col.row(align=True)
+            row.operator("lithtech.play_animation", text=name,
+                         icon='IMPORT').track_name = name
+            row.label(text="-")
+            self._draw_preview_button(row, name, previewing, can_preview)
 
         layout.separator()
         box = layout.box()
@@ -192,21 +347,64 @@ class LITHTECH_PT_animation_panel(bpy.types.Panel):
             row.operator("screen.animation_play", text="Play", icon='PLAY')
         box.operator("lithtech.rest_pose", text="Rest Pose", icon='ARMATURE_DATA')
 
+    def _draw_preview_button(self, row, name, previewing, can_preview):
+        # quick preview reads the source file, no Actions involved
+        sub = row.row(align=True)
+        sub.enabled = can_preview
+        is_on = previewing is not None and previewing.name == name
+        sub.operator("lithtech.preview_animation", text="", icon='HIDE_OFF',
+                     depress=is_on).anim_name = name
+
 
 _classes = (
     LITHTECH_OT_play_animation,
     LITHTECH_OT_register_animation,
     LITHTECH_OT_rest_pose,
+    LITHTECH_OT_preview_animation,
+    LITHTECH_OT_stop_preview,
     LITHTECH_PT_animation_panel,
 )
 
 
+@bpy.app.handlers.persistent
+def _prune_animation_cache(*args):
+    # a newly loaded .blend / undo of an import: free animations no armature
+    # waits for (deletions are caught when the cache is next used)
+    prune_cache()
+
+
+@bpy.app.handlers.persistent
+def _end_preview_on_load(*args):
+    # the previewed armature belonged to the previous file
+    _stop_preview(reset_pose=False)
+
+
+_cache_handlers = (
+    bpy.app.handlers.load_post,
+    bpy.app.handlers.undo_post,
+    bpy.app.handlers.redo_post,
+)
+
+
 def register():
     for c in _classes:
         bpy.utils.register_class(c)
+    # bpy.data is restricted while add-ons are enabled at startup: only drop
+    # the state a reload may have left, no object lookups
+    _preview.clear()
+    _remove_handler(bpy.app.handlers.frame_change_pre, _preview_frame)
+    for handlers in _cache_handlers:
+        _remove_handler(handlers, _prune_animation_cache)
+        handlers.append(_prune_animation_cache)
+    _remove_handler(bpy.app.handlers.load_post, _end_preview_on_load)
+    bpy.app.handlers.load_post.append(_end_preview_on_load)
 
 
 def unregister():
+    for handlers in _cache_handlers:
+        _remove_handler(handlers, _prune_animation_cache)
+    _remove_handler(bpy.app.handlers.load_post, _end_preview_on_load)
+    _stop_preview(reset_pose=False)
     for c in reversed(_classes):
         try:
             bpy.utils.unregister_class(c)